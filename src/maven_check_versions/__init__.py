@@ -14,9 +14,11 @@ if sys.version_info < (3, 10):  # pragma: no cover
 if importlib.util.find_spec('maven_check_versions') is None:  # pragma: no cover
     sys.path.append(os.path.dirname(__file__) + '/..')
 
+import maven_check_versions.cacheutils as _cacheutils
 import maven_check_versions.logutils as _logutils
 import maven_check_versions.process as _process
 import maven_check_versions.utils as _utils
+import maven_check_versions.workqueue as _workqueue
 
 
 # noinspection PyMissingOrEmptyDocstring
@@ -33,7 +35,12 @@ def main() -> int:
         _logutils.configure_logging(arguments)
         ci_mode_enabled = arguments.get('ci_mode')  # type: ignore
 
-        _process.process_main(arguments)
+        if arguments.get('command') == 'cache':
+            _cacheutils.process_cache_command(arguments)
+        elif arguments.get('queue_mode'):
+            _workqueue.process_queue(arguments)
+        else:
+            _process.process_main(arguments)
 
         elapsed = f"{time.time() - start_time:.2f} sec."
         logging.info(f"Processing is completed, {elapsed}")
@@ -1,15 +1,23 @@
 #!/usr/bin/python3
 """This file provides cache utilities"""
+import hashlib
 import json
 import logging
+import mmap
 import os
+import sqlite3
+import stat
+import struct
+import tempfile
 import threading
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
 from contextlib import contextmanager
 from dataclasses import asdict, is_dataclass
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Iterator, Callable
 
 import maven_check_versions.config as _config
 import pymemcache
@@ -17,15 +25,47 @@ import redis
 import tarantool
 from maven_check_versions.config import Config, Arguments
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+    import msvcrt
+
 _ARTIFACTS_KEY = 'cache_maven_check_versions_artifacts'
 _VULNERABILITIES_KEY = 'cache_maven_check_versions_vulnerabilities'
+_POMS_KEY = 'cache_maven_check_versions_poms'
 _HOST = 'localhost'
 _REDIS_PORT = 6379
 _TARANTOOL_PORT = 3301
 _MEMCACHED_PORT = 11211
+_REDIS_HMGET_CHUNK = 500
+_TARANTOOL_BATCH = 1000
+_MEMCACHED_FORMAT = 2
+_MEMCACHED_KEY_LENGTH = 250
+_MEMCACHED_CAS_RETRIES = 10
+_MEMCACHED_SCAN_CHUNK = 500
+_SQLITE_FILE = 'cache_maven_check_versions.sqlite3'
+_SQLITE_BATCH = 500
+_TIERED_MEMORY_SIZE = 10000
+_STATS_FILE = 'cache_maven_check_versions_stats.json'
+_ACCESS_RESOLUTION = 86400
+_FLUSH_INTERVAL = 30
+_FLUSH_ENTRIES = 500
+_BINARY_MAGIC = b'MCVC'
+_BINARY_HEADER = struct.Struct('<4sHxxI')
+_BINARY_ENTRY = struct.Struct('<QQI')
+_BINARY_KEY = struct.Struct('<H')
+
+# Stored functions installed on the server by tools/tarantool/maven_check_versions.lua
+_TARANTOOL_FETCH = 'maven_check_versions_fetch'
+_TARANTOOL_SAVE = 'maven_check_versions_save'
 
 update_cache_artifact_lock = threading.Lock()
 
+# Process umask, read once at import because os.umask can only be read by setting it
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
 
 class DCJSONEncoder(json.JSONEncoder):  # pragma: no cover
     """
@@ -49,6 +89,199 @@ class DCJSONEncoder(json.JSONEncoder):  # pragma: no cover
             return None
 
 
+def _default_key(section: str) -> str:
+    """
+    Returns the default cache key (file name, Redis key, Tarantool space, etc.) for a configuration section.
+
+    Args:
+        section (str): Configuration section (e.g., 'base', 'vulnerability' or 'pom').
+
+    Returns:
+        str: The default cache key.
+    """
+    return {'vulnerability': _VULNERABILITIES_KEY, 'pom': _POMS_KEY}.get(section, _ARTIFACTS_KEY)
+
+
+class CacheData(dict):
+    """
+    Cache dictionary that tracks the keys changed or deleted since it was loaded or last saved,
+    so backends can save only the delta.
+    Backends that load lazily pass a fetch function: entries are then loaded by prefetch,
+    or one at a time on the first lookup of a key.
+    """
+
+    def __init__(self, *args, fetch: Optional[Callable[[list[str]], Dict[str, Any]]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dirty: set[str] = set()
+        self.deleted: set[str] = set()
+        self._fetch = fetch
+        self._fetched: set[str] = set()
+        self._fetch_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def prefetch(self, keys: Iterable[str]) -> None:
+        """
+        Loads the given keys from a lazily loading backend in one batch.
+
+        Args:
+            keys (Iterable[str]): Keys to load. Keys that are known or were fetched before are skipped.
+        """
+        if self._fetch is None:
+            return
+        with self._fetch_lock:
+            missing = [
+                key for key in dict.fromkeys(keys)
+                if key not in self._fetched and not dict.__contains__(self, key) and key not in self.deleted]
+            if missing:
+                for key, value in self._fetch(missing).items():
+                    if not dict.__contains__(self, key):
+                        dict.__setitem__(self, key, value)
+                self._fetched.update(missing)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        self.prefetch([key])
+        return super().get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        if isinstance(key, str):
+            self.prefetch([key])
+        return super().__contains__(key)
+
+    def __missing__(self, key: str) -> Any:
+        self.prefetch([key])
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.dirty.add(key)
+        self.deleted.discard(key)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.dirty.discard(key)
+        self.deleted.add(key)
+
+    def pop(self, key: str, *args) -> Any:
+        if key in self:
+            self.dirty.discard(key)
+            self.deleted.add(key)
+        return super().pop(key, *args)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        self.deleted.update(self.keys())
+        self.dirty.clear()
+        super().clear()
+
+    def count_lookup(self, hit: bool, count: int = 1) -> None:
+        """
+        Counts lookups for the hit ratio statistics.
+
+        Args:
+            hit (bool): True if the entries were found and valid.
+            count (int, optional): Number of lookups (default is 1).
+        """
+        with self._fetch_lock:
+            if hit:
+                self.hits += count
+            else:
+                self.misses += count
+
+    def take_lookups(self) -> tuple[int, int]:
+        """
+        Returns and resets the lookup counters.
+
+        Returns:
+            tuple[int, int]: The number of hits and misses since the last call.
+        """
+        with self._fetch_lock:
+            counters, self.hits, self.misses = (self.hits, self.misses), 0, 0
+            return counters
+
+    def mark_clean(self, keys: Optional[Iterable[str]] = None) -> None:
+        """
+        Marks the given keys, or all keys, as saved.
+
+        Args:
+            keys (Optional[Iterable[str]], optional): Saved keys. Defaults to all keys.
+        """
+        if keys is None:
+            self.dirty.clear()
+            self.deleted.clear()
+        else:
+            for key in keys:
+                self.dirty.discard(key)
+                self.deleted.discard(key)
+
+
+def get_changes(cache_data: Dict[str, Any]) -> tuple[Dict[str, Any], set[str]]:
+    """
+    Returns the changes to save: dirty entries and deleted keys of a CacheData,
+    or every entry of a plain dictionary.
+
+    Args:
+        cache_data (Dict[str, Any]): Cache data.
+
+    Returns:
+        tuple[Dict[str, Any], set[str]]: The entries to write and the keys to delete.
+    """
+    if isinstance(cache_data, CacheData):
+        return {k: cache_data[k] for k in list(cache_data.dirty) if k in cache_data}, set(cache_data.deleted)
+    return dict(cache_data), set()
+
+
+def prefetch_cache(cache_data: Optional[Dict[str, Any]], keys: Iterable[str]) -> None:
+    """
+    Loads the given keys in one batch if the cache data loads lazily.
+
+    Args:
+        cache_data (Optional[Dict[str, Any]]): Cache data, or None if caching is disabled.
+        keys (Iterable[str]): Keys that the run is going to look up.
+    """
+    if isinstance(cache_data, CacheData):
+        cache_data.prefetch(keys)
+
+
+def mark_saved(cache_data: Dict[str, Any], changed: Dict[str, Any], deleted: set[str]) -> None:
+    """
+    Marks saved changes of a CacheData as clean.
+    Keys changed again while the save was running stay dirty.
+
+    Args:
+        cache_data (Dict[str, Any]): Cache data.
+        changed (Dict[str, Any]): Saved entries.
+        deleted (set[str]): Deleted keys.
+    """
+    if isinstance(cache_data, CacheData):
+        cache_data.mark_clean(
+            [key for key, value in changed.items() if dict.get(cache_data, key) is value] +
+            [key for key in deleted if not dict.__contains__(cache_data, key)])
+
+
+def is_changed(cache_data: Dict[str, Any]) -> bool:
+    """
+    Checks if cache data has changes to save.
+
+    Args:
+        cache_data (Dict[str, Any]): Cache data.
+
+    Returns:
+        bool: False for a CacheData without dirty or deleted keys, True otherwise.
+    """
+    return not isinstance(cache_data, CacheData) or bool(cache_data.dirty or cache_data.deleted)
+
+
 class _CacheBackend(ABC):
     """
     Abstract base class for cache backend implementations.
@@ -75,7 +308,7 @@ class _CacheBackend(ABC):
             self, config: Config, arguments: Arguments, cache_data: Dict[str, Any], section: str
     ) -> None:
         """
-        Saves the cache data.
+        Saves the changes of the cache data (see get_changes).
 
         Args:
             config (Config): Configuration dictionary parsed from YAML.
@@ -85,6 +318,23 @@ class _CacheBackend(ABC):
         """
         pass
 
+    @abstractmethod
+    def scan(  # pragma: no cover
+            self, config: Config, arguments: Arguments, section: str
+    ) -> Iterator[tuple[str, Any, int]]:
+        """
+        Iterates over all entries of the cache, for maintenance commands.
+
+        Args:
+            config (Config): Configuration dictionary parsed from YAML.
+            arguments (Arguments): Command-line arguments.
+            section (str): Configuration section to use (e.g., 'base' or 'vulnerability').
+
+        Yields:
+            tuple[str, Any, int]: The key, the value and the stored size of the entry in bytes.
+        """
+        pass
+
 
 class _CacheBackendRegistry:
     """
@@ -107,44 +357,205 @@ class _CacheBackendRegistry:
         return cls._backends.get(name, _JSONCacheBackend())
 
 
+@contextmanager
+def _file_lock(path: str):
+    """
+    Context manager for an exclusive advisory lock on '<path>.lock', shared by processes on the same host.
+
+    Args:
+        path (str): Path of the locked file.
+    """
+    with open(path + '.lock', 'a+b') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:  # pragma: no cover
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:  # pragma: no cover
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def _atomic_write(path: str, mode: str = 'wb', **kwargs):
+    """
+    Context manager for writing a file atomically: data goes to a temporary file in the same directory,
+    which replaces the target only if writing succeeded. The file keeps the permissions of the target,
+    or gets the default permissions of new files if the target does not exist yet.
+
+    Args:
+        path (str): Path of the target file.
+        mode (str, optional): File mode. Defaults to 'wb'.
+        **kwargs: Additional arguments for opening the temporary file (e.g., encoding).
+
+    Yields:
+        IO: The temporary file.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile(mode, dir=directory, prefix='.tmp-', delete=False, **kwargs) as f:
+        try:
+            yield f
+        except BaseException:
+            f.close()
+            os.unlink(f.name)
+            raise
+    try:
+        os.chmod(f.name, stat.S_IMODE(os.stat(path).st_mode) if os.path.exists(path) else 0o666 & ~_UMASK)
+        os.replace(f.name, path)
+    except BaseException:
+        os.unlink(f.name)
+        raise
+
+
+def entry_time(value: Any) -> Optional[float]:
+    """
+    Returns the timestamp of a cache entry in seconds: the update time of an artifact entry
+    or the file modification time of a POM entry, which is stored in nanoseconds.
+
+    Args:
+        value (Any): The cache value.
+
+    Returns:
+        Optional[float]: The timestamp, or None if the entry has none.
+    """
+    if isinstance(value, (list, tuple)) and value and isinstance(value[0], (int, float)):
+        return value[0]
+    if isinstance(value, dict) and isinstance(value.get('mtime'), (int, float)):
+        return value['mtime'] / 1e9
+    return None
+
+
+def merge_newest(current: Any, value: Any) -> Any:
+    """
+    Chooses between a stored entry and a new entry, keeping the one with the newest timestamp.
+
+    Args:
+        current (Any): The stored entry.
+        value (Any): The new entry.
+
+    Returns:
+        Any: The stored entry if it is strictly newer, the new entry otherwise.
+    """
+    current_time, value_time = entry_time(current), entry_time(value)
+    if current_time is not None and value_time is not None and current_time > value_time:
+        return current
+    return value
+
+
+def entry_access(value: Any) -> Optional[float]:
+    """
+    Returns the last access time of an artifact entry: its recorded access time, or its update time if it has none.
+
+    Args:
+        value (Any): The cache value.
+
+    Returns:
+        Optional[float]: The access time, or None if the entry is not an artifact entry.
+    """
+    if isinstance(value, (list, tuple)) and value and isinstance(value[0], (int, float)):
+        return value[5] if len(value) > 5 and isinstance(value[5], (int, float)) else value[0]
+    return None
+
+
 class _JSONCacheBackend(_CacheBackend):
     """
     Backend for caching data in json files.
+    Saves are safe for concurrent processes: under a file lock the changes are merged into the current file,
+    keeping the newest entry per key, and the result is written to a temporary file that replaces it.
     """
 
-    def load(self, config: Config, arguments: Arguments, section: str) -> Dict[str, Any]:
-        cache_file = _config.get_config_value(
-            config, arguments, 'cache_file', section=section,
-            default=(_VULNERABILITIES_KEY if section == 'vulnerability' else _ARTIFACTS_KEY) + '.json')
+    @staticmethod
+    def _file(config: Config, arguments: Arguments, section: str) -> str:
+        """
+        Retrieves the path of the cache file from the configuration.
+
+        Args:
+            config (Config): Configuration dictionary parsed from YAML.
+            arguments (Arguments): Command-line arguments.
+            section (str): Configuration section to use (e.g., 'base' or 'vulnerability').
+
+        Returns:
+            str: The path of the cache file.
+        """
+        return _config.get_config_value(
+            config, arguments, 'cache_file', section=section, default=_default_key(section) + '.json')
+
+    @staticmethod
+    def _read(cache_file: str) -> Dict[str, Any]:
+        """
+        Reads the cache file.
+
+        Args:
+            cache_file (str): Path to the cache file.
 
+        Returns:
+            Dict[str, Any]: The cache data. Returns an empty dictionary if the file is missing or invalid.
+        """
         if os.path.exists(cache_file):
             try:
-                logging.info(f"Load Cache file: {Path(cache_file).absolute()}")
                 with open(cache_file, encoding='utf-8') as cf:
                     return json.load(cf)
-            except json.JSONDecodeError as e:
-                logging.error(f"Failed to decode JSON cache data: {e}")
+            except (OSError, ValueError) as e:
+                logging.error(f"Failed to read JSON cache data from {cache_file}: {e}")
         return {}
 
+    def load(self, config: Config, arguments: Arguments, section: str) -> Dict[str, Any]:
+        cache_file = self._file(config, arguments, section)
+        if os.path.exists(cache_file):
+            logging.info(f"Load Cache file: {Path(cache_file).absolute()}")
+        return self._read(cache_file)
+
     def save(
             self, config: Config, arguments: Arguments, cache_data: Dict[str, Any], section: str
     ) -> None:
-        cache_file = _config.get_config_value(
-            config, arguments, 'cache_file', section=section,
-            default=(_VULNERABILITIES_KEY if section == 'vulnerability' else _ARTIFACTS_KEY) + '.json')
+        cache_file = self._file(config, arguments, section)
+
+        if not is_changed(cache_data):
+            return
 
         try:
+            changed, deleted = get_changes(cache_data)
             logging.info(f"Save Cache file: {Path(cache_file).absolute()}")
-            with open(cache_file, 'w', encoding='utf-8') as cf:
-                cf.write(json.dumps(cache_data, cls=DCJSONEncoder, indent=2))
+            with _file_lock(cache_file):
+                merged = self._read(cache_file)
+                for key in deleted:
+                    merged.pop(key, None)
+                for key, value in changed.items():
+                    merged[key] = merge_newest(merged[key], value) if key in merged else value
+                with _atomic_write(cache_file, 'w', encoding='utf-8') as cf:
+                    cf.write(json.dumps(merged, cls=DCJSONEncoder, indent=2))
+            mark_saved(cache_data, changed, deleted)
         except Exception as e:
             logging.error(f"Failed to save cache to JSON file {cache_file}: {e}")
 
+    def scan(self, config: Config, arguments: Arguments, section: str) -> Iterator[tuple[str, Any, int]]:
+        """
+        Iterates over all entries of the cache file.
+
+        Args:
+            config (Config): Configuration dictionary parsed from YAML.
+            arguments (Arguments): Command-line arguments.
+            section (str): Configuration section to use (e.g., 'base' or 'vulnerability').
+
+        Yields:
+            tuple[str, Any, int]: The key, the value and the stored size of the entry in bytes.
+        """
+        for key, value in self._read(self._file(config, arguments, section)).items():
+            yield key, value, len(json.dumps(value, cls=DCJSONEncoder))
+
 
 class _RedisCacheBackend(_CacheBackend):
     """
     Backend for caching data in Redis.
+    Entries are loaded lazily with pipelined HMGET and connections come from a shared pool.
     """
+    _pools: dict[tuple, redis.ConnectionPool] = {}
+    _pools_lock = threading.Lock()
 
     @staticmethod
     def _config(config: Config, arguments: Arguments, section: str) -> tuple:
@@ -159,7 +570,7 @@ class _RedisCacheBackend(_CacheBackend):
         Returns:
             tuple: A tuple containing (host, port, key, user, password) for Redis connection.
         """
-        default_key = _VULNERABILITIES_KEY if section == 'vulnerability' else _ARTIFACTS_KEY
+        default_key = _default_key(section)
         return (
             _config.get_config_value(config, arguments, 'redis_host', section=section, default=_HOST),
             _config.get_config_value(config, arguments, 'redis_port', section=section, default=_REDIS_PORT),
@@ -188,20 +599,47 @@ class _RedisCacheBackend(_CacheBackend):
             redis.ConnectionError: If the connection to Redis fails.
             redis.RedisError: If an error occurs during Redis operations.
         """
-        inst = redis.Redis(host=host, port=port, username=user, password=password, decode_responses=True)
+        with self._pools_lock:
+            if (pool := self._pools.get((host, port, user, password))) is None:
+                pool = redis.ConnectionPool(
+                    host=host, port=port, username=user, password=password, decode_responses=True)
+                self._pools[(host, port, user, password)] = pool
+        inst = redis.Redis(connection_pool=pool)
         try:
             yield inst
         finally:
             inst.close()
 
     def load(self, config: Config, arguments: Arguments, section: str) -> Dict[str, Any]:
+        return CacheData(fetch=lambda keys: self.fetch(config, arguments, section, keys))
+
+    def fetch(self, config: Config, arguments: Arguments, section: str, keys: list[str]) -> Dict[str, Any]:
+        """
+        Loads the given keys with pipelined HMGET commands.
+
+        Args:
+            config (Config): Configuration dictionary parsed from YAML.
+            arguments (Arguments): Command-line arguments.
+            section (str): Configuration section to use (e.g., 'base' or 'vulnerability').
+            keys (list[str]): Keys to load.
+
+        Returns:
+            Dict[str, Any]: The entries found. Returns an empty dictionary if loading fails.
+        """
         try:
             host, port, ckey, user, password = self._config(config, arguments, section)
 
             with self._connection(host, port, user, password) as inst:
+                pipe = inst.pipeline(transaction=False)
+                chunks = [keys[i:i + _REDIS_HMGET_CHUNK] for i in range(0, len(keys), _REDIS_HMGET_CHUNK)]
+                for chunk in chunks:
+                    pipe.hmget(ckey, chunk)
+
                 cache_data: Dict[str, Any] = {}
-                if data := inst.hgetall(ckey):
-                    for key, value in data.items():
+                for chunk, values in zip(chunks, pipe.execute()):
+                    for key, value in zip(chunk, values):
+                        if value is None:
+                            continue
                         try:
                             cache_data[key] = json.loads(value)
                         except json.JSONDecodeError as e:
@@ -222,12 +660,19 @@ class _RedisCacheBackend(_CacheBackend):
         try:
             host, port, ckey, user, password = self._config(config, arguments, section)
 
+            changed, deleted = get_changes(cache_data)
+            if not changed and not deleted:
+                return
+
             with self._connection(host, port, user, password) as inst:
-                for key, value in cache_data.items():
-                    try:
-                        inst.hset(ckey, key, json.dumps(value, cls=DCJSONEncoder))
-                    except redis.RedisError as e:  # pragma: no cover
-                        logging.error(f"Failed to save cache to Redis for key {key}: {e}")
+                pipe = inst.pipeline(transaction=False)
+                if changed:
+                    pipe.hset(ckey, mapping={
+                        key: json.dumps(value, cls=DCJSONEncoder) for key, value in changed.items()})
+                if deleted:
+                    pipe.hdel(ckey, *deleted)
+                pipe.execute()
+            mark_saved(cache_data, changed, deleted)
 
         except redis.ConnectionError as e:  # pragma: no cover
             logging.error(f"Redis connection failed: {e}")
@@ -236,10 +681,30 @@ class _RedisCacheBackend(_CacheBackend):
         except Exception as e:
             logging.error(f"Failed to save cache to Redis: {e}")
 
+    def scan(self, config: Config, arguments: Arguments, section: str) -> Iterator[tuple[str, Any, int]]:
+        """
+        Iterates over all entries of the Redis hash with HSCAN.
+
+        Args:
+            config (Config): Configuration dictionary parsed from YAML.
+            arguments (Arguments): Command-line arguments.
+            section (str): Configuration section to use (e.g., 'base' or 'vulnerability').
+
+        Yields:
+            tuple[str, Any, int]: The key, the value and the stored size of the entry in bytes.
+        """
+        host, port, ckey, user, password = self._config(config, arguments, section)
+        with self._connection(host, port, user, password) as inst:
+            for key, value in inst.hscan_iter(ckey, count=_REDIS_HMGET_CHUNK):
+                yield key, json.loads(value), len(value)
+
 
 class _TarantoolCacheBackend(_CacheBackend):
     """
     Backend for caching data in Tarantool.
+    Entries are loaded lazily by key and written in batches through the stored functions
+    of tools/tarantool/maven_check_versions.lua, as (key, json, timestamp) tuples.
+    Tuples older than 'tarantool_ttl' seconds are not returned, and are deleted on the server by expirationd.
     """
 
     @staticmethod
@@ -255,7 +720,7 @@ class _TarantoolCacheBackend(_CacheBackend):
         Returns:
             tuple: A tuple containing (host, port, space, user, password) for Tarantool connection.
         """
-        default_key = _VULNERABILITIES_KEY if section == 'vulnerability' else _ARTIFACTS_KEY
+        default_key = _default_key(section)
         return (
             _config.get_config_value(config, arguments, 'tarantool_host', section=section, default=_HOST),
             _config.get_config_value(config, arguments, 'tarantool_port', section=section, default=_TARANTOOL_PORT),
@@ -290,17 +755,35 @@ class _TarantoolCacheBackend(_CacheBackend):
             conn.close()
 
     def load(self, config: Config, arguments: Arguments, section: str) -> Dict[str, Any]:
+        return CacheData(fetch=lambda keys: self.fetch(config, arguments, section, keys))
+
+    def fetch(self, config: Config, arguments: Arguments, section: str, keys: list[str]) -> Dict[str, Any]:
+        """
+        Loads the given keys in batches with a read-only stored function, which skips expired tuples.
+
+        Args:
+            config (Config): Configuration dictionary parsed from YAML.
+            arguments (Arguments): Command-line arguments.
+            section (str): Configuration section to use (e.g., 'base' or 'vulnerability').
+            keys (list[str]): Keys to load.
+
+        Returns:
+            Dict[str, Any]: The entries found. Returns an empty dictionary if loading fails.
+        """
         try:
             host, port, space, user, password = self._config(config, arguments, section)
+            ttl = int(_config.get_config_value(config, arguments, 'tarantool_ttl', section=section, default=0))
+            expire_before = int(time.time()) - ttl if ttl > 0 else 0
 
             with self._connection(host, port, user, password) as conn:
                 cache_data: Dict[str, Any] = {}
-                if data := conn.select(space):
-                    for item in data:
+                for i in range(0, len(keys), _TARANTOOL_BATCH):
+                    response = conn.call(_TARANTOOL_FETCH, (space, keys[i:i + _TARANTOOL_BATCH], expire_before))
+                    for key, value in (response.data[0] if response.data else None) or []:
                         try:
-                            cache_data[item[0]] = json.loads(item[1])
+                            cache_data[key] = json.loads(value)
                         except json.JSONDecodeError as e:
-                            logging.error(f"Failed to decode Tarantool data for key {item[0]}: {e}")
+                            logging.error(f"Failed to decode Tarantool data for key {key}: {e}")
                 return cache_data
 
         except tarantool.DatabaseError as e:  # pragma: no cover
@@ -314,21 +797,49 @@ class _TarantoolCacheBackend(_CacheBackend):
     ) -> None:
         try:
             host, port, space, user, password = self._config(config, arguments, section)
+            changed, deleted = get_changes(cache_data)
+            if not changed and not deleted:
+                return
 
+            now = int(time.time())
+            tuples = [(key, json.dumps(value, cls=DCJSONEncoder), now) for key, value in changed.items()]
+            deleted_keys = list(deleted)
             with self._connection(host, port, user, password) as conn:
-                space = conn.space(space)
-                for key, value in cache_data.items():
-                    space.replace((key, json.dumps(value, cls=DCJSONEncoder)))
+                for i in range(0, max(len(tuples), len(deleted_keys)), _TARANTOOL_BATCH):
+                    conn.call(_TARANTOOL_SAVE, (
+                        space, tuples[i:i + _TARANTOOL_BATCH], deleted_keys[i:i + _TARANTOOL_BATCH]))
+            mark_saved(cache_data, changed, deleted)
 
         except tarantool.DatabaseError as e:  # pragma: no cover
             logging.error(f"Tarantool error: {e}")
         except Exception as e:
             logging.error(f"Failed to save cache to Tarantool: {e}")
 
+    def scan(self, config: Config, arguments: Arguments, section: str) -> Iterator[tuple[str, Any, int]]:
+        """
+        Iterates over all entries of the Tarantool space.
+
+        Args:
+            config (Config): Configuration dictionary parsed from YAML.
+            arguments (Arguments): Command-line arguments.
+            section (str): Configuration section to use (e.g., 'base' or 'vulnerability').
+
+        Yields:
+            tuple[str, Any, int]: The key, the value and the stored size of the entry in bytes.
+        """
+        host, port, space, user, password = self._config(config, arguments, section)
+        with self._connection(host, port, user, password) as conn:
+            for key, value, *_ in conn.select(space).data:
+                yield key, json.loads(value), len(value)
+
 
 class _MemcachedCacheBackend(_CacheBackend):
     """
     Backend for caching data in Memcached.
+    Each entry is a separate item under '<memcached_key>:<key>' that expires after 'cache_time' seconds
+    in the base section, and the manifest under 'memcached_key' records the layout.
+    Memcached cannot enumerate items, so the keys are also listed in an index item under '<memcached_key>#keys',
+    updated with check-and-set so concurrent saves do not lose each other's keys.
     """
 
     @staticmethod
@@ -344,13 +855,35 @@ class _MemcachedCacheBackend(_CacheBackend):
         Returns:
             tuple: A tuple containing (host, port, key) for Memcached connection.
         """
-        default_key = _VULNERABILITIES_KEY if section == 'vulnerability' else _ARTIFACTS_KEY
+        default_key = _default_key(section)
         return (
             _config.get_config_value(config, arguments, 'memcached_host', section=section, default=_HOST),
             _config.get_config_value(config, arguments, 'memcached_port', section=section, default=_MEMCACHED_PORT),
             _config.get_config_value(config, arguments, 'memcached_key', section=section, default=default_key)
         )
 
+    @staticmethod
+    def _expire(config: Config, arguments: Arguments, section: str) -> int:
+        """
+        Retrieves the expiry time of the items of a section.
+        Base entries expire after 'cache_time'. Vulnerability entries are served stale after 'cve_ttl'
+        and refreshed, and POM entries are validated by file time, so they do not expire
+        unless 'cache_time' is set in their section.
+
+        Args:
+            config (Config): Configuration dictionary parsed from YAML.
+            arguments (Arguments): Command-line arguments.
+            section (str): Configuration section to use (e.g., 'base' or 'vulnerability').
+
+        Returns:
+            int: The expiry time in seconds, 0 if items do not expire.
+        """
+        if section in ('vulnerability', 'pom'):
+            return int(_config.get_config_value(config, arguments, 'cache_time', section=section, default=0))
+        return int(_config.get_config_value(
+            config, arguments, 'cache_time', section=section,
+            default=_config.get_config_value(config, arguments, 'cache_time', default=600)))
+
     @contextmanager
     def _connection(self, host: str, port: int):
         """
@@ -372,17 +905,118 @@ class _MemcachedCacheBackend(_CacheBackend):
         finally:
             client.close()
 
+    @staticmethod
+    def _item_key(prefix: str, key: str) -> str:
+        """
+        Builds the Memcached key of an entry, hashing keys that Memcached would not accept.
+
+        Args:
+            prefix (str): The 'memcached_key' value.
+            key (str): The cache key (e.g., 'group:artifact').
+
+        Returns:
+            str: The item key.
+        """
+        item_key = f"{prefix}:{key}"
+        if len(item_key.encode()) > _MEMCACHED_KEY_LENGTH or any(c.isspace() or ord(c) < 33 for c in item_key):
+            item_key = f"{prefix}:sha1:{hashlib.sha1(key.encode()).hexdigest()}"
+        return item_key
+
     def load(self, config: Config, arguments: Arguments, section: str) -> Dict[str, Any]:
+        cache_data = CacheData(fetch=lambda keys: self.fetch(config, arguments, section, keys))
         try:
             host, port, key = self._config(config, arguments, section)
 
             with self._connection(host, port) as client:
                 if data := client.get(key):
                     try:
-                        return json.loads(data)
-                    except json.JSONDecodeError as e:
+                        manifest = json.loads(data)
+                        if manifest.get('format') != _MEMCACHED_FORMAT:
+                            self._migrate(client, key, manifest, self._expire(config, arguments, section), cache_data)
+                    except (json.JSONDecodeError, AttributeError) as e:
                         logging.error(f"Failed to decode Memcached data: {e}")
 
+        except pymemcache.exceptions.MemcacheError as e:  # pragma: no cover
+            logging.error(f"Memcached error: {e}")
+        except Exception as e:
+            logging.error(f"Failed to load cache from Memcached: {e}")
+        return cache_data
+
+    def _update_index(self, client, prefix: str, added: Iterable[str], removed: Iterable[str]) -> None:
+        """
+        Adds and removes keys in the key index with check-and-set, retrying when another process changed it.
+
+        Args:
+            client (pymemcache.client.base.Client): Memcached client.
+            prefix (str): The 'memcached_key' value.
+            added (Iterable[str]): Keys to add.
+            removed (Iterable[str]): Keys to remove.
+        """
+        added, removed = set(added), set(removed)
+        if not added and not removed:
+            return
+        index_key = f"{prefix}#keys"
+        for _ in range(_MEMCACHED_CAS_RETRIES):
+            data, cas = client.gets(index_key)
+            keys = (set(json.loads(data)) if data else set()) - removed | added
+            value = json.dumps(sorted(keys))
+            if client.cas(index_key, value, cas) if data else client.add(index_key, value, noreply=False):
+                return
+        logging.error(f"Failed to update Memcached key index {index_key}: too many concurrent updates")
+
+    def _migrate(self, client, prefix: str, legacy: Dict[str, Any], expire: int, cache_data: CacheData) -> None:
+        """
+        Migrates a cache stored by earlier versions as a single value to one item per entry.
+        The entries are written here rather than left to the caller's next save,
+        which only writes the entries it changed. The manifest replaces the old value only
+        once every entry is written; entries that failed are added to the cache data as changed.
+
+        Args:
+            client (pymemcache.client.base.Client): Memcached client.
+            prefix (str): The 'memcached_key' value.
+            legacy (Dict[str, Any]): Entries of the old value.
+            expire (int): Expiry time of the items in seconds.
+            cache_data (CacheData): Cache data that receives the entries.
+        """
+        logging.info('Migrate Memcached cache to one item per entry')
+        item_keys = {self._item_key(prefix, key): key for key in legacy}
+        failed = client.set_many({
+            item_key: json.dumps(legacy[key], cls=DCJSONEncoder) for item_key, key in item_keys.items()
+        }, expire=expire)
+        self._update_index(client, prefix, [key for item_key, key in item_keys.items() if item_key not in failed], ())
+        if failed:
+            logging.error(f"Failed to migrate Memcached cache for keys: {failed}")
+            cache_data.update({item_keys[item_key]: legacy[item_keys[item_key]] for item_key in failed})
+        else:
+            client.set(prefix, json.dumps({'format': _MEMCACHED_FORMAT, 'updated': int(time.time())}))
+        dict.update(cache_data, {key: value for key, value in legacy.items() if key not in cache_data.dirty})
+
+    def fetch(self, config: Config, arguments: Arguments, section: str, keys: list[str]) -> Dict[str, Any]:
+        """
+        Loads the given keys with a single get_many request.
+
+        Args:
+            config (Config): Configuration dictionary parsed from YAML.
+            arguments (Arguments): Command-line arguments.
+            section (str): Configuration section to use (e.g., 'base' or 'vulnerability').
+            keys (list[str]): Keys to load.
+
+        Returns:
+            Dict[str, Any]: The entries found. Returns an empty dictionary if loading fails.
+        """
+        try:
+            host, port, prefix = self._config(config, arguments, section)
+            item_keys = {self._item_key(prefix, key): key for key in keys}
+
+            with self._connection(host, port) as client:
+                cache_data: Dict[str, Any] = {}
+                for item_key, value in client.get_many(list(item_keys)).items():
+                    try:
+                        cache_data[item_keys[item_key]] = json.loads(value)
+                    except json.JSONDecodeError as e:
+                        logging.error(f"Failed to decode Memcached data for key {item_keys[item_key]}: {e}")
+                return cache_data
+
         except pymemcache.exceptions.MemcacheError as e:  # pragma: no cover
             logging.error(f"Memcached error: {e}")
         except Exception as e:
@@ -393,53 +1027,771 @@ class _MemcachedCacheBackend(_CacheBackend):
             self, config: Config, arguments: Arguments, cache_data: Dict[str, Any], section: str
     ) -> None:
         try:
-            host, port, key = self._config(config, arguments, section)
+            host, port, prefix = self._config(config, arguments, section)
+            changed, deleted = get_changes(cache_data)
+            if not changed and not deleted:
+                return
 
+            expire = self._expire(config, arguments, section)
+            item_keys = {self._item_key(prefix, key): key for key in changed}
             with self._connection(host, port) as client:
-                client.set(key, json.dumps(cache_data, cls=DCJSONEncoder))
+                if failed := client.set_many({
+                    item_key: json.dumps(changed[key], cls=DCJSONEncoder) for item_key, key in item_keys.items()
+                }, expire=expire):
+                    logging.error(f"Failed to save cache to Memcached for keys: {failed}")
+                    changed = {key: changed[key] for item_key, key in item_keys.items() if item_key not in failed}
+                if deleted:
+                    client.delete_many([self._item_key(prefix, key) for key in deleted])
+                self._update_index(client, prefix, changed, deleted)
+                client.set(prefix, json.dumps({'format': _MEMCACHED_FORMAT, 'updated': int(time.time())}))
+            mark_saved(cache_data, changed, deleted)
 
         except pymemcache.exceptions.MemcacheError as e:  # pragma: no cover
             logging.error(f"Memcached error: {e}")
         except Exception as e:
             logging.error(f"Failed to save cache to Memcached: {e}")
 
+    def scan(self, config: Config, arguments: Arguments, section: str) -> Iterator[tuple[str, Any, int]]:
+        """
+        Iterates over the entries listed in the key index.
+        Keys whose items Memcached has expired or evicted are skipped and removed from the index.
 
-_CacheBackendRegistry.register('json', _JSONCacheBackend())
-_CacheBackendRegistry.register('redis', _RedisCacheBackend())
-_CacheBackendRegistry.register('tarantool', _TarantoolCacheBackend())
-_CacheBackendRegistry.register('memcached', _MemcachedCacheBackend())
-
+        Args:
+            config (Config): Configuration dictionary parsed from YAML.
+            arguments (Arguments): Command-line arguments.
+            section (str): Configuration section to use (e.g., 'base' or 'vulnerability').
 
-def load_cache(config: Config, arguments: Arguments, section: str = 'base') -> Dict[str, Any]:
+        Yields:
+            tuple[str, Any, int]: The key, the value and the stored size of the entry in bytes.
+        """
+        host, port, prefix = self._config(config, arguments, section)
+        with self._connection(host, port) as client:
+            data = client.get(f"{prefix}#keys")
+            keys = json.loads(data) if data else []
+            gone = []
+            for start in range(0, len(keys), _MEMCACHED_SCAN_CHUNK):
+                item_keys = {self._item_key(prefix, key): key for key in keys[start:start + _MEMCACHED_SCAN_CHUNK]}
+                values = client.get_many(list(item_keys))
+                for item_key, key in item_keys.items():
+                    if (value := values.get(item_key)) is None:
+                        gone.append(key)
+                    else:
+                        yield key, json.loads(value), len(value)
+            self._update_index(client, prefix, (), gone)
+
+
+class _SQLiteCacheBackend(_CacheBackend):
+    """
+    Backend for caching data in a local SQLite database.
+    Each section uses its own table of (key, value, ts) rows in a WAL-journaled file,
+    so concurrent processes on the same host can share it. Entries are loaded lazily by key.
     """
-    Loads the cache data from the specified backend based on the configuration.
-    Supports JSON, Redis, Tarantool, and Memcached backends.
 
-    Args:
-        config (Config): Configuration dictionary parsed from YAML.
+    @staticmethod
+    def _config(config: Config, arguments: Arguments, section: str) -> tuple:
+        """
+        Retrieves the SQLite parameters from the configuration.
+
+        Args:
+            config (Config): Configuration dictionary parsed from YAML.
+            arguments (Arguments): Command-line arguments.
+            section (str): Configuration section to use (e.g., 'base' or 'vulnerability').
+
+        Returns:
+            tuple: A tuple containing (file, table, ttl).
+        """
+        return (
+            _config.get_config_value(config, arguments, 'sqlite_file', section=section, default=_SQLITE_FILE),
+            _config.get_config_value(config, arguments, 'sqlite_table', section=section, default=_default_key(section)),
+            int(_config.get_config_value(config, arguments, 'sqlite_ttl', section=section, default=0))
+        )
+
+    @contextmanager
+    def _connection(self, file: str, table: str):
+        """
+        Context manager for the SQLite connection, creating the table and its timestamp index if required.
+
+        Args:
+            file (str): Path to the database file.
+            table (str): Table name.
+
+        Yields:
+            tuple[sqlite3.Connection, str]: The connection and the quoted table name.
+        """
+        conn = sqlite3.connect(file, timeout=30)
+        try:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            quoted = '"' + table.replace('"', '""') + '"'
+            index = '"' + (table + '_ts').replace('"', '""') + '"'
+            with conn:
+                conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {quoted} "
+                    '(key TEXT PRIMARY KEY, value TEXT NOT NULL, ts INTEGER NOT NULL) WITHOUT ROWID')
+                conn.execute(f"CREATE INDEX IF NOT EXISTS {index} ON {quoted} (ts)")
+            yield conn, quoted
+        finally:
+            conn.close()
+
+    def load(self, config: Config, arguments: Arguments, section: str) -> Dict[str, Any]:
+        return CacheData(fetch=lambda keys: self.fetch(config, arguments, section, keys))
+
+    def fetch(self, config: Config, arguments: Arguments, section: str, keys: list[str]) -> Dict[str, Any]:
+        """
+        Loads the given keys, skipping rows older than 'sqlite_ttl' seconds if it is set.
+
+        Args:
+            config (Config): Configuration dictionary parsed from YAML.
+            arguments (Arguments): Command-line arguments.
+            section (str): Configuration section to use (e.g., 'base' or 'vulnerability').
+            keys (list[str]): Keys to load.
+
+        Returns:
+            Dict[str, Any]: The entries found. Returns an empty dictionary if loading fails.
+        """
+        try:
+            file, table, ttl = self._config(config, arguments, section)
+            expire_before = int(time.time()) - ttl if ttl > 0 else 0
+
+            with self._connection(file, table) as (conn, quoted):
+                cache_data: Dict[str, Any] = {}
+                for i in range(0, len(keys), _SQLITE_BATCH):
+                    batch = keys[i:i + _SQLITE_BATCH]
+                    rows = conn.execute(
+                        f"SELECT key, value FROM {quoted} WHERE ts >= ? AND key IN ({','.join('?' * len(batch))})",
+                        [expire_before, *batch])
+                    for key, value in rows:
+                        try:
+                            cache_data[key] = json.loads(value)
+                        except json.JSONDecodeError as e:
+                            logging.error(f"Failed to decode SQLite data for key {key}: {e}")
+                return cache_data
+
+        except sqlite3.Error as e:
+            logging.error(f"SQLite error: {e}")
+        except Exception as e:  # pragma: no cover
+            logging.error(f"Failed to load cache from SQLite: {e}")
+        return {}
+
+    def save(
+            self, config: Config, arguments: Arguments, cache_data: Dict[str, Any], section: str
+    ) -> None:
+        try:
+            file, table, ttl = self._config(config, arguments, section)
+            changed, deleted = get_changes(cache_data)
+            if not changed and not deleted:
+                return
+
+            now = int(time.time())
+            with self._connection(file, table) as (conn, quoted):
+                with conn:
+                    conn.executemany(
+                        f"INSERT OR REPLACE INTO {quoted} (key, value, ts) VALUES (?, ?, ?)",
+                        [(key, json.dumps(value, cls=DCJSONEncoder), now) for key, value in changed.items()])
+                    conn.executemany(f"DELETE FROM {quoted} WHERE key = ?", [(key,) for key in deleted])
+                    if ttl > 0:
+                        conn.execute(f"DELETE FROM {quoted} WHERE ts < ?", (now - ttl,))
+            mark_saved(cache_data, changed, deleted)
+
+        except sqlite3.Error as e:
+            logging.error(f"SQLite error: {e}")
+        except Exception as e:  # pragma: no cover
+            logging.error(f"Failed to save cache to SQLite: {e}")
+
+    def scan(self, config: Config, arguments: Arguments, section: str) -> Iterator[tuple[str, Any, int]]:
+        """
+        Iterates over all entries of the SQLite table.
+
+        Args:
+            config (Config): Configuration dictionary parsed from YAML.
+            arguments (Arguments): Command-line arguments.
+            section (str): Configuration section to use (e.g., 'base' or 'vulnerability').
+
+        Yields:
+            tuple[str, Any, int]: The key, the value and the stored size of the entry in bytes.
+        """
+        file, table, _ = self._config(config, arguments, section)
+        with self._connection(file, table) as (conn, quoted):
+            for key, value in conn.execute(f"SELECT key, value FROM {quoted}"):
+                yield key, json.loads(value), len(value)
+
+
+class _BinaryCacheBackend(_CacheBackend):
+    """
+    Backend for caching data in a compact binary file that is read through mmap.
+
+    Layout: a header (magic, format version, entry count), an index of (key hash, offset, length) entries
+    sorted by hash, then the records, each a length-prefixed UTF-8 key followed by the JSON-encoded value.
+    Lookups binary-search the index and decode only the records they touch. Files of another format version
+    are ignored, and replaced by the next save.
+    """
+    _VERSION = 2
+
+    @staticmethod
+    def _file(config: Config, arguments: Arguments, section: str) -> str:
+        """
+        Retrieves the path of the cache file from the configuration.
+
+        Args:
+            config (Config): Configuration dictionary parsed from YAML.
+            arguments (Arguments): Command-line arguments.
+            section (str): Configuration section to use (e.g., 'base' or 'vulnerability').
+
+        Returns:
+            str: The path of the cache file.
+        """
+        return _config.get_config_value(
+            config, arguments, 'cache_file', section=section, default=_default_key(section) + '.bin')
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        """
+        Returns the 64-bit index hash of a key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            int: The hash.
+        """
+        return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), 'little')
+
+    @contextmanager
+    def _mapping(self, cache_file: str):
+        """
+        Context manager for a read-only memory mapping of the cache file.
+
+        Args:
+            cache_file (str): Path to the cache file.
+
+        Yields:
+            Optional[tuple[mmap.mmap, int]]: The mapping and the entry count,
+                or None if there is no cache file or it has another format version.
+
+        Raises:
+            ValueError: If the file is not a binary cache file.
+        """
+        if not os.path.exists(cache_file) or not os.path.getsize(cache_file):
+            yield None
+            return
+        with open(cache_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic, version, count = _BINARY_HEADER.unpack_from(mm, 0)
+            if magic != _BINARY_MAGIC:
+                raise ValueError(f"Unsupported binary cache file {cache_file}")
+            if version != self._VERSION:
+                logging.warning(f"Ignoring binary cache file {cache_file} of format version {version}")
+                yield None
+                return
+            yield mm, count
+
+    @staticmethod
+    def _records(mm: mmap.mmap, count: int, key_hash: int) -> list[tuple[int, int]]:
+        """
+        Finds the records whose key has the given hash by binary search over the index.
+
+        Args:
+            mm (mmap.mmap): The mapping of the cache file.
+            count (int): Number of index entries.
+            key_hash (int): The key hash.
+
+        Returns:
+            list[tuple[int, int]]: Offsets and lengths of the matching records.
+        """
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _BINARY_ENTRY.unpack_from(mm, _BINARY_HEADER.size + mid * _BINARY_ENTRY.size)[0] < key_hash:
+                lo = mid + 1
+            else:
+                hi = mid
+        result = []
+        while lo < count:
+            entry_hash, offset, length = _BINARY_ENTRY.unpack_from(mm, _BINARY_HEADER.size + lo * _BINARY_ENTRY.size)
+            if entry_hash != key_hash:
+                break
+            result.append((offset, length))
+            lo += 1
+        return result
+
+    @staticmethod
+    def _record_key(mm: mmap.mmap, offset: int) -> tuple[str, int]:
+        """
+        Reads the key of a record.
+
+        Args:
+            mm (mmap.mmap): The mapping of the cache file.
+            offset (int): Offset of the record.
+
+        Returns:
+            tuple[str, int]: The key and the offset of the encoded value.
+        """
+        (key_length,) = _BINARY_KEY.unpack_from(mm, offset)
+        start = offset + _BINARY_KEY.size
+        return mm[start:start + key_length].decode(), start + key_length
+
+    def load(self, config: Config, arguments: Arguments, section: str) -> Dict[str, Any]:
+        return CacheData(fetch=lambda keys: self.fetch(config, arguments, section, keys))
+
+    def fetch(self, config: Config, arguments: Arguments, section: str, keys: list[str]) -> Dict[str, Any]:
+        """
+        Looks up the given keys in the index and decodes only their records.
+
+        Args:
+            config (Config): Configuration dictionary parsed from YAML.
+            arguments (Arguments): Command-line arguments.
+            section (str): Configuration section to use (e.g., 'base' or 'vulnerability').
+            keys (list[str]): Keys to load.
+
+        Returns:
+            Dict[str, Any]: The entries found. Returns an empty dictionary if loading fails.
+        """
+        cache_file = self._file(config, arguments, section)
+        try:
+            with self._mapping(cache_file) as mapping:
+                cache_data: Dict[str, Any] = {}
+                if mapping is not None:
+                    mm, count = mapping
+                    for key in keys:
+                        for offset, length in self._records(mm, count, self._hash(key)):
+                            record_key, value_offset = self._record_key(mm, offset)
+                            if record_key == key:
+                                cache_data[key] = json.loads(mm[value_offset:offset + length])
+                                break
+                return cache_data
+        except Exception as e:
+            logging.error(f"Failed to load cache from binary file {cache_file}: {e}")
+        return {}
+
+    def save(
+            self, config: Config, arguments: Arguments, cache_data: Dict[str, Any], section: str
+    ) -> None:
+        cache_file = self._file(config, arguments, section)
+        changed, deleted = get_changes(cache_data)
+        if not changed and not deleted:
+            return
+
+        try:
+            with _file_lock(cache_file):
+                self._write(cache_file, changed, deleted)
+            mark_saved(cache_data, changed, deleted)
+        except Exception as e:
+            logging.error(f"Failed to save cache to binary file {cache_file}: {e}")
+
+    def _write(self, cache_file: str, changed: Dict[str, Any], deleted: set) -> None:
+        """
+        Rewrites the cache file with the changes applied to the records it holds.
+        Must be called with the file lock held, so concurrent saves do not drop each other's records.
+
+        Args:
+            cache_file (str): Path to the cache file.
+            changed (Dict[str, Any]): Changed entries.
+            deleted (set): Deleted keys.
+        """
+        records: dict[str, tuple[int, bytes]] = {}
+        with self._mapping(cache_file) as mapping:
+            if mapping is not None:
+                mm, count = mapping
+                for i in range(count):
+                    entry_hash, offset, length = _BINARY_ENTRY.unpack_from(
+                        mm, _BINARY_HEADER.size + i * _BINARY_ENTRY.size)
+                    key, _ = self._record_key(mm, offset)
+                    if key not in changed and key not in deleted:
+                        records[key] = entry_hash, mm[offset:offset + length]
+        for key, value in changed.items():
+            encoded = key.encode()
+            records[key] = self._hash(key), \
+                _BINARY_KEY.pack(len(encoded)) + encoded + json.dumps(value, cls=DCJSONEncoder).encode()
+
+        logging.info(f"Save Cache file: {Path(cache_file).absolute()}")
+        entries = sorted(records.values(), key=lambda entry: entry[0])
+        offset = _BINARY_HEADER.size + len(entries) * _BINARY_ENTRY.size
+        with _atomic_write(cache_file) as f:
+            f.write(_BINARY_HEADER.pack(_BINARY_MAGIC, self._VERSION, len(entries)))
+            for entry_hash, record in entries:
+                f.write(_BINARY_ENTRY.pack(entry_hash, offset, len(record)))
+                offset += len(record)
+            for _, record in entries:
+                f.write(record)
+
+    def scan(self, config: Config, arguments: Arguments, section: str) -> Iterator[tuple[str, Any, int]]:
+        """
+        Iterates over all entries of the cache file.
+
+        Args:
+            config (Config): Configuration dictionary parsed from YAML.
+            arguments (Arguments): Command-line arguments.
+            section (str): Configuration section to use (e.g., 'base' or 'vulnerability').
+
+        Yields:
+            tuple[str, Any, int]: The key, the value and the stored size of the entry in bytes.
+        """
+        with self._mapping(self._file(config, arguments, section)) as mapping:
+            if mapping is not None:
+                mm, count = mapping
+                for i in range(count):
+                    _, offset, length = _BINARY_ENTRY.unpack_from(mm, _BINARY_HEADER.size + i * _BINARY_ENTRY.size)
+                    key, value_offset = self._record_key(mm, offset)
+                    yield key, json.loads(mm[value_offset:offset + length]), length
+
+
+class _TieredCacheBackend(_CacheBackend):
+    """
+    Backend that layers an in-process LRU and a local backend in front of a remote backend.
+    Lookups go through the tiers in that order and fill the faster tiers with what they find.
+    Saves update the LRU and write to the local and remote backends on a background thread;
+    the saved keys are marked clean once both writes have succeeded.
+    Entries filled from the remote tier are written to the local tier with the next save or flush.
+    """
+    _memory: dict[str, OrderedDict] = {}
+    _memory_lock = threading.Lock()
+    _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='cache-writer')
+    _pending: set[Future] = set()
+    _fills: dict[tuple[str, str], tuple[Config, Arguments, Dict[str, Any]]] = {}
+
+    @staticmethod
+    def _config(config: Config, arguments: Arguments, section: str) -> tuple:
+        """
+        Retrieves the tier parameters from the configuration.
+
+        Args:
+            config (Config): Configuration dictionary parsed from YAML.
+            arguments (Arguments): Command-line arguments.
+            section (str): Configuration section to use (e.g., 'base' or 'vulnerability').
+
+        Returns:
+            tuple: A tuple containing (local backend name, remote backend name, LRU size).
+        """
+        return (
+            _config.get_config_value(config, arguments, 'tiered_local', section=section, default='sqlite'),
+            _config.get_config_value(config, arguments, 'tiered_remote', section=section, default='redis'),
+            int(_config.get_config_value(
+                config, arguments, 'tiered_memory_size', section=section, default=_TIERED_MEMORY_SIZE))
+        )
+
+    @classmethod
+    def _remember(cls, section: str, size: int, entries: Dict[str, Any], deleted: Iterable[str] = ()) -> None:
+        """
+        Stores entries in the in-process LRU of a section and evicts the least recently used ones.
+
+        Args:
+            section (str): Configuration section.
+            size (int): Maximum number of entries.
+            entries (Dict[str, Any]): Entries to store.
+            deleted (Iterable[str], optional): Keys to remove.
+        """
+        with cls._memory_lock:
+            memory = cls._memory.setdefault(section, OrderedDict())
+            for key in deleted:
+                memory.pop(key, None)
+            for key, value in entries.items():
+                memory[key] = value
+                memory.move_to_end(key)
+            while len(memory) > size:
+                memory.popitem(last=False)
+
+    @classmethod
+    def _recall(cls, section: str, keys: list[str]) -> Dict[str, Any]:
+        """
+        Looks up keys in the in-process LRU of a section.
+
+        Args:
+            section (str): Configuration section.
+            keys (list[str]): Keys to look up.
+
+        Returns:
+            Dict[str, Any]: The entries found.
+        """
+        with cls._memory_lock:
+            memory = cls._memory.get(section, OrderedDict())
+            result = {}
+            for key in keys:
+                if key in memory:
+                    memory.move_to_end(key)
+                    result[key] = memory[key]
+            return result
+
+    @classmethod
+    def _submit(cls, fn: Callable[..., Any], *args: Any) -> Future:
+        """
+        Runs a function on the background thread and tracks it until it has finished.
+
+        Args:
+            fn (Callable[..., Any]): Function to run.
+            *args (Any): Arguments of the function.
+
+        Returns:
+            Future: The background task.
+        """
+        future = cls._executor.submit(fn, *args)
+        with cls._memory_lock:
+            cls._pending.add(future)
+        future.add_done_callback(cls._done)
+        return future
+
+    @classmethod
+    def _write(
+            cls, config: Config, arguments: Arguments, section: str, backend: str,
+            changed: Dict[str, Any], deleted: set[str]
+    ) -> CacheData:
+        """
+        Saves changes to a tier backend on the background thread.
+
+        Args:
+            config (Config): Configuration dictionary parsed from YAML.
+            arguments (Arguments): Command-line arguments.
+            section (str): Configuration section to use (e.g., 'base' or 'vulnerability').
+            backend (str): Name of the tier backend.
+            changed (Dict[str, Any]): Entries to write.
+            deleted (set[str]): Keys to delete.
+
+        Returns:
+            CacheData: The changes given to the backend, marked clean by it once they are saved.
+        """
+        delta = CacheData(changed)
+        delta.dirty.update(changed)
+        delta.deleted.update(deleted)
+        cls._submit(_CacheBackendRegistry.get(backend).save, config, arguments, delta, section)
+        return delta
+
+    @staticmethod
+    def _mark_written(
+            writes: list[CacheData], cache_data: Dict[str, Any], changed: Dict[str, Any], deleted: set[str]
+    ) -> None:
+        """
+        Marks saved changes as clean if all their background writes have succeeded.
+        Runs on the background thread after the writes, so they have finished.
+        Backends log their errors instead of raising them and only mark saved changes clean,
+        so a write has succeeded if its changes have no dirty or deleted keys left.
+
+        Args:
+            writes (list[CacheData]): The changes given to each tier backend.
+            cache_data (Dict[str, Any]): Cache data.
+            changed (Dict[str, Any]): Saved entries.
+            deleted (set[str]): Deleted keys.
+        """
+        if not any(write.dirty or write.deleted for write in writes):
+            mark_saved(cache_data, changed, deleted)
+
+    @classmethod
+    def _done(cls, future: Future) -> None:
+        """
+        Forgets a finished background write and logs its error, if any.
+
+        Args:
+            future (Future): The finished write.
+        """
+        with cls._memory_lock:
+            cls._pending.discard(future)
+        if (e := future.exception()) is not None:
+            logging.error(f"Failed to write cache tier: {e}")
+
+    @classmethod
+    def _fill(
+            cls, config: Config, arguments: Arguments, section: str, backend: str, entries: Dict[str, Any]
+    ) -> None:
+        """
+        Queues entries found in the remote tier for the next write to the local tier.
+
+        Args:
+            config (Config): Configuration dictionary parsed from YAML.
+            arguments (Arguments): Command-line arguments.
+            section (str): Configuration section to use (e.g., 'base' or 'vulnerability').
+            backend (str): Name of the local tier backend.
+            entries (Dict[str, Any]): Entries to write.
+        """
+        with cls._memory_lock:
+            cls._fills.setdefault((section, backend), (config, arguments, {}))[2].update(entries)
+
+    @classmethod
+    def _take_fills(cls, section: str, backend: str) -> Dict[str, Any]:
+        """
+        Removes and returns the queued entries of a local tier.
+
+        Args:
+            section (str): Configuration section.
+            backend (str): Name of the local tier backend.
+
+        Returns:
+            Dict[str, Any]: The queued entries.
+        """
+        with cls._memory_lock:
+            return cls._fills.pop((section, backend), (None, None, {}))[2]
+
+    @classmethod
+    def flush(cls) -> None:
+        """
+        Writes the queued local tier entries and waits until the pending background writes have finished.
+        """
+        with cls._memory_lock:
+            fills, cls._fills = cls._fills, {}
+        for (section, backend), (config, arguments, entries) in fills.items():
+            cls._write(config, arguments, section, backend, entries, set())
+        with cls._memory_lock:
+            pending = list(cls._pending)
+        for future in pending:
+            future.exception()
+
+    def load(self, config: Config, arguments: Arguments, section: str) -> Dict[str, Any]:
+        local_name, remote_name, _ = self._config(config, arguments, section)
+        local = _load_tier(_CacheBackendRegistry.get(local_name), config, arguments, section)
+        remote = _load_tier(_CacheBackendRegistry.get(remote_name), config, arguments, section)
+        return CacheData(fetch=lambda keys: self.fetch(config, arguments, section, keys, local, remote))
+
+    def fetch(
+            self, config: Config, arguments: Arguments, section: str, keys: list[str],
+            local: CacheData, remote: CacheData
+    ) -> Dict[str, Any]:
+        """
+        Looks up keys in the LRU, then in the local tier, then in the remote tier,
+        and fills the faster tiers with the entries found.
+
+        Args:
+            config (Config): Configuration dictionary parsed from YAML.
+            arguments (Arguments): Command-line arguments.
+            section (str): Configuration section to use (e.g., 'base' or 'vulnerability').
+            keys (list[str]): Keys to load.
+            local (CacheData): Cache data of the local tier.
+            remote (CacheData): Cache data of the remote tier.
+
+        Returns:
+            Dict[str, Any]: The entries found.
+        """
+        local_name, _, size = self._config(config, arguments, section)
+        result = self._recall(section, keys)
+        missing = [key for key in keys if key not in result]
+        local.prefetch(missing)
+        from_local = {key: dict.__getitem__(local, key) for key in missing if dict.__contains__(local, key)}
+        missing = [key for key in missing if key not in from_local]
+        remote.prefetch(missing)
+        from_remote = {key: dict.__getitem__(remote, key) for key in missing if dict.__contains__(remote, key)}
+
+        if from_remote:
+            self._fill(config, arguments, section, local_name, from_remote)
+        self._remember(section, size, from_local | from_remote)
+        return result | from_local | from_remote
+
+    def save(
+            self, config: Config, arguments: Arguments, cache_data: Dict[str, Any], section: str
+    ) -> None:
+        changed, deleted = get_changes(cache_data)
+        local_name, remote_name, size = self._config(config, arguments, section)
+        fills = self._take_fills(section, local_name)
+        if not changed and not deleted:
+            if fills:
+                self._write(config, arguments, section, local_name, fills, set())
+            return
+
+        self._remember(section, size, changed, deleted)
+        writes = [
+            self._write(config, arguments, section, local_name, fills | changed, set(deleted)),
+            self._write(config, arguments, section, remote_name, dict(changed), set(deleted))
+        ]
+        self._submit(self._mark_written, writes, cache_data, changed, deleted)
+
+    def scan(self, config: Config, arguments: Arguments, section: str) -> Iterator[tuple[str, Any, int]]:
+        """
+        Iterates over all entries of the remote tier, which holds every entry.
+
+        Args:
+            config (Config): Configuration dictionary parsed from YAML.
+            arguments (Arguments): Command-line arguments.
+            section (str): Configuration section to use (e.g., 'base' or 'vulnerability').
+
+        Yields:
+            tuple[str, Any, int]: The key, the value and the stored size of the entry in bytes.
+        """
+        _, remote_name, _ = self._config(config, arguments, section)
+        yield from _CacheBackendRegistry.get(remote_name).scan(config, arguments, section)
+
+
+def _load_tier(backend: _CacheBackend, config: Config, arguments: Arguments, section: str) -> CacheData:
+    """
+    Loads the cache data of a tier backend as a CacheData.
+
+    Args:
+        backend (_CacheBackend): The tier backend.
+        config (Config): Configuration dictionary parsed from YAML.
+        arguments (Arguments): Command-line arguments.
+        section (str): Configuration section to use (e.g., 'base' or 'vulnerability').
+
+    Returns:
+        CacheData: The cache data of the tier.
+    """
+    data = backend.load(config, arguments, section)
+    return data if isinstance(data, CacheData) else CacheData(data)
+
+
+_CacheBackendRegistry.register('json', _JSONCacheBackend())
+_CacheBackendRegistry.register('redis', _RedisCacheBackend())
+_CacheBackendRegistry.register('tarantool', _TarantoolCacheBackend())
+_CacheBackendRegistry.register('memcached', _MemcachedCacheBackend())
+_CacheBackendRegistry.register('sqlite', _SQLiteCacheBackend())
+_CacheBackendRegistry.register('binary', _BinaryCacheBackend())
+_CacheBackendRegistry.register('tiered', _TieredCacheBackend())
+
+_load_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='cache-loader')
+
+
+def load_cache(config: Config, arguments: Arguments, section: str = 'base') -> Dict[str, Any]:
+    """
+    Loads the cache data from the specified backend based on the configuration.
+    Supports JSON, Redis, Tarantool, Memcached, SQLite, binary file and tiered backends.
+
+    Args:
+        config (Config): Configuration dictionary parsed from YAML.
         arguments (Arguments): Command-line arguments.
         section (str, optional): Configuration section to use, such as 'base' or 'vulnerability'.
             Defaults to 'base'.
 
     Returns:
-        Dict[str, Any]: Cache data as a dictionary.
+        Dict[str, Any]: Cache data as a CacheData dictionary that tracks changes.
             Returns an empty dictionary if the backend fails or no data is available.
             If the specified backend is not found, defaults to JSON backend.
     """
     key = _config.get_config_value(config, arguments, 'cache_backend', section=section, default='json')
     if backend := _CacheBackendRegistry.get(key):
-        return backend.load(config, arguments, section)
+        return _load_tier(backend, config, arguments, section)
     else:  # pragma: no cover
         raise AssertionError('Invalid cache backend')
 
 
+def load_cache_async(config: Config, arguments: Arguments, section: str = 'base') -> CacheData:
+    """
+    Starts loading the cache data on a background thread and returns at once.
+    The result loads lazily: a lookup waits for the backend only when it needs a key,
+    so slow backends load while POM files are parsed.
+
+    Args:
+        config (Config): Configuration dictionary parsed from YAML.
+        arguments (Arguments): Command-line arguments.
+        section (str, optional): Configuration section to use, such as 'base' or 'vulnerability'.
+            Defaults to 'base'.
+
+    Returns:
+        CacheData: Cache data that tracks changes and fetches entries from the loaded data.
+    """
+    future = _load_executor.submit(load_cache, config, arguments, section)
+
+    def fetch(keys: list[str]) -> Dict[str, Any]:
+        try:
+            loaded = future.result()
+        except Exception as e:
+            logging.error(f"Failed to load cache: {e}")
+            return {}
+        prefetch_cache(loaded, keys)
+        return {key: dict.__getitem__(loaded, key) for key in keys if dict.__contains__(loaded, key)}
+
+    return CacheData(fetch=fetch)
+
+
 def save_cache(
         config: Config, arguments: Arguments, cache_data: Optional[Dict[str, Any]],
         section: str = 'base'
 ) -> None:
     """
     Saves the cache data to the specified backend based on the configuration.
-    Supports JSON, Redis, Tarantool, and Memcached backends.
+    Supports JSON, Redis, Tarantool, Memcached, SQLite, binary file and tiered backends.
+    Only the changes of a CacheData are saved; the saved keys are then marked clean.
 
     Args:
         config (Config): Configuration dictionary parsed from YAML.
@@ -452,10 +1804,182 @@ def save_cache(
         key = _config.get_config_value(config, arguments, 'cache_backend', section=section, default='json')
         if backend := _CacheBackendRegistry.get(key):
             backend.save(config, arguments, cache_data, section)
+            save_lookups(config, arguments, cache_data, section)
         else:  # pragma: no cover
             raise AssertionError('Invalid cache backend')
 
 
+def _stats_file(config: Config, arguments: Arguments) -> str:
+    """
+    Retrieves the path of the file that accumulates the lookup statistics.
+
+    Args:
+        config (Config): Configuration dictionary parsed from YAML.
+        arguments (Arguments): Command-line arguments.
+
+    Returns:
+        str: The path of the statistics file.
+    """
+    return _config.get_config_value(config, arguments, 'cache_stats_file', default=_STATS_FILE)
+
+
+def save_lookups(config: Config, arguments: Arguments, cache_data: Dict[str, Any], section: str = 'base') -> None:
+    """
+    Adds the hits and misses counted by a CacheData since the last call to the statistics file.
+
+    Args:
+        config (Config): Configuration dictionary parsed from YAML.
+        arguments (Arguments): Command-line arguments.
+        cache_data (Dict[str, Any]): Cache data.
+        section (str, optional): Configuration section, such as 'base' or 'vulnerability'. Defaults to 'base'.
+    """
+    if not isinstance(cache_data, CacheData) or not any(counters := cache_data.take_lookups()):
+        return
+    stats_file = _stats_file(config, arguments)
+    try:
+        with _file_lock(stats_file):
+            stats = load_lookups(config, arguments)
+            hits, misses = stats.get(section, (0, 0))
+            stats[section] = (hits + counters[0], misses + counters[1])
+            with _atomic_write(stats_file, 'w', encoding='utf-8') as f:
+                json.dump({key: {'hits': hits, 'misses': misses} for key, (hits, misses) in stats.items()}, f)
+    except Exception as e:
+        logging.error(f"Failed to save cache statistics to {stats_file}: {e}")
+
+
+def load_lookups(config: Config, arguments: Arguments) -> dict[str, tuple[int, int]]:
+    """
+    Loads the accumulated lookup statistics.
+
+    Args:
+        config (Config): Configuration dictionary parsed from YAML.
+        arguments (Arguments): Command-line arguments.
+
+    Returns:
+        dict[str, tuple[int, int]]: The hits and misses by section.
+    """
+    stats_file = _stats_file(config, arguments)
+    try:
+        if os.path.exists(stats_file):
+            with open(stats_file, encoding='utf-8') as f:
+                return {key: (value['hits'], value['misses']) for key, value in json.load(f).items()}
+    except (ValueError, KeyError, TypeError) as e:
+        logging.error(f"Failed to load cache statistics from {stats_file}: {e}")
+    return {}
+
+
+def scan_cache(config: Config, arguments: Arguments, section: str = 'base') -> Iterator[tuple[str, Any, int]]:
+    """
+    Iterates over all entries of the configured backend, for maintenance commands.
+
+    Args:
+        config (Config): Configuration dictionary parsed from YAML.
+        arguments (Arguments): Command-line arguments.
+        section (str, optional): Configuration section, such as 'base' or 'vulnerability'. Defaults to 'base'.
+
+    Yields:
+        tuple[str, Any, int]: The key, the value and the stored size of the entry in bytes.
+    """
+    key = _config.get_config_value(config, arguments, 'cache_backend', section=section, default='json')
+    yield from _CacheBackendRegistry.get(key).scan(config, arguments, section)
+
+
+def delete_cache_keys(config: Config, arguments: Arguments, keys: Iterable[str], section: str = 'base') -> None:
+    """
+    Deletes entries from the configured backend and waits until the deletion is written.
+
+    Args:
+        config (Config): Configuration dictionary parsed from YAML.
+        arguments (Arguments): Command-line arguments.
+        keys (Iterable[str]): Keys to delete.
+        section (str, optional): Configuration section, such as 'base' or 'vulnerability'. Defaults to 'base'.
+    """
+    cache_data = CacheData()
+    cache_data.deleted.update(keys)
+    if cache_data.deleted:
+        save_cache(config, arguments, cache_data, section)
+        flush_cache()
+
+
+def flush_cache() -> None:
+    """
+    Waits until the background writes of the tiered backend have finished.
+    """
+    _TieredCacheBackend.flush()
+
+
+class CacheFlusher:
+    """
+    Saves the dirty entries of cache data on a background thread every 'flush_interval' seconds,
+    or as soon as 'flush_entries' entries are dirty, so an interrupted run keeps what it resolved.
+    Used as a context manager, it saves the remaining changes on exit, also when an exception is raised.
+    """
+    _POLL = 0.5
+
+    def __init__(
+            self, config: Config, arguments: Arguments, cache_data: Optional[Dict[str, Any]],
+            section: str = 'base'
+    ):
+        self.config = config
+        self.arguments = arguments
+        self.cache_data = cache_data
+        self.section = section
+        self.interval = float(_config.get_config_value(
+            config, arguments, 'flush_interval', default=_FLUSH_INTERVAL))
+        self.entries = int(_config.get_config_value(config, arguments, 'flush_entries', default=_FLUSH_ENTRIES))
+        self._stop = threading.Event()
+        self._save_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> 'CacheFlusher':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """
+        Starts the background thread if there is cache data and periodic flushing is enabled.
+        """
+        if isinstance(self.cache_data, CacheData) and (self.interval > 0 or self.entries > 0):
+            self._thread = threading.Thread(target=self._run, name=f"cache-flusher-{self.section}", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the background thread and saves the remaining changes.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+        flush_cache()
+
+    def flush(self) -> None:
+        """
+        Saves the changes of the cache data.
+        """
+        with self._save_lock:
+            save_cache(self.config, self.arguments, self.cache_data, self.section)
+
+    def _run(self) -> None:
+        """
+        Flushes the cache data when the interval has passed or enough entries are dirty.
+        """
+        last = time.monotonic()
+        while not self._stop.wait(self._POLL):
+            dirty = len(self.cache_data.dirty) + len(self.cache_data.deleted)  # type: ignore
+            if dirty and ((self.entries > 0 and dirty >= self.entries) or
+                          (self.interval > 0 and time.monotonic() - last >= self.interval)):
+                try:
+                    self.flush()
+                except Exception as e:  # pragma: no cover
+                    logging.error(f"Failed to flush cache: {e}")
+                last = time.monotonic()
+
+
 def process_cache_artifact(
         config: Config, arguments: Arguments, cache_data: Optional[Dict[str, Any]],
         artifact: str, group: str, version: Optional[str]
@@ -475,10 +1999,14 @@ def process_cache_artifact(
         bool: True if the cache exists and either the cached version matches the provided version
             or the cache timestamp is within the configured time threshold, False otherwise.
     """
-    if cache_data is None or (data := cache_data.get(f"{group}:{artifact}")) is None:
+    if cache_data is None:
+        return False
+    if (data := cache_data.get(key := f"{group}:{artifact}")) is None:
+        _count_lookup(cache_data, False)
         return False
-    cached_time, cached_version, cached_key, cached_date, cached_versions = data
+    cached_time, cached_version, cached_key, cached_date, cached_versions = data[:5]
     if cached_version == version:
+        _touch_cache_artifact(cache_data, key, data)
         return True
 
     ct_threshold = int(_config.get_config_value(config, arguments, 'cache_time', default=600))
@@ -488,10 +2016,40 @@ def process_cache_artifact(
         logging.info(message_format.format(
             cached_key, group, artifact, version, ', '.join(cached_versions),
             cached_date if cached_date is not None else '').rstrip())
+        _touch_cache_artifact(cache_data, key, data)
         return True
+    _count_lookup(cache_data, False)
     return False
 
 
+def _count_lookup(cache_data: Dict[str, Any], hit: bool) -> None:
+    """
+    Counts a lookup if the cache data is a CacheData.
+
+    Args:
+        cache_data (Dict[str, Any]): Cache data.
+        hit (bool): True if the entry was found and valid.
+    """
+    if isinstance(cache_data, CacheData):
+        cache_data.count_lookup(hit)
+
+
+def _touch_cache_artifact(cache_data: Dict[str, Any], key: str, data: Any) -> None:
+    """
+    Counts a cache hit and records the access time of the entry for LRU eviction.
+    The access time is written at most once per day per entry to keep saves small.
+
+    Args:
+        cache_data (Dict[str, Any]): Cache data.
+        key (str): Cache key.
+        data (Any): Cached entry.
+    """
+    _count_lookup(cache_data, True)
+    now = int(time.time())
+    if isinstance(cache_data, CacheData) and now - (entry_access(data) or 0) >= _ACCESS_RESOLUTION:
+        cache_data[key] = (*data[:5], now)
+
+
 def update_cache_artifact(
         cache_data: Optional[Dict[str, Any]], versions: list, artifact: str, group,
         item: str, last_modified: Optional[str], repository_key: str
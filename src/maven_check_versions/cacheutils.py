@@ -0,0 +1,246 @@
+#!/usr/bin/python3
+"""This file provides cache maintenance commands"""
+
+import gzip
+import json
+import logging
+import os
+import time
+from typing import Any, Iterable
+
+import maven_check_versions.cache as _cache
+import maven_check_versions.config as _config
+from maven_check_versions.config import Config, Arguments
+
+_SECTIONS = ('base', 'vulnerability', 'pom')
+_SNAPSHOT_SECTIONS = ('base', 'vulnerability')
+_SNAPSHOT_FILE = 'cache_maven_check_versions_snapshot.json.gz'
+_SNAPSHOT_FORMAT = 1
+
+
+def process_cache_command(arguments: Arguments) -> None:
+    """
+    Runs the cache maintenance action given by 'cache_action' for each cache section.
+
+    Args:
+        arguments (Arguments): Command-line arguments.
+            'cache_action' is 'stats', 'compact', 'purge', 'export' or 'import';
+            'cache_section' optionally limits the sections and 'cache_snapshot' is the snapshot file.
+    """
+    config = _config.get_config(arguments)
+    action = arguments.get('cache_action')
+    if action in ('export', 'import'):
+        path = arguments.get('cache_snapshot') or _SNAPSHOT_FILE
+        sections = arguments.get('cache_section') or _SNAPSHOT_SECTIONS
+        if action == 'export':
+            counts = export_cache(config, arguments, path, sections)
+        else:
+            counts = import_cache(config, arguments, path, sections)
+        for section, count in counts.items():
+            logging.info(f"Cache {section}: {action}ed {count} entries ({path})")
+        return
+    if action not in ('stats', 'compact', 'purge'):
+        raise ValueError(f"Invalid cache action: {action}")
+
+    for section in arguments.get('cache_section') or _SECTIONS:
+        backend = _config.get_config_value(config, arguments, 'cache_backend', section, default='json')
+        try:
+            if action == 'stats':
+                stats = cache_stats(config, arguments, section)
+                ratio = f"{stats['hit_ratio']:.1%}" if stats['hit_ratio'] is not None else 'n/a'
+                logging.info(
+                    f"Cache {section} ({backend}): {stats['entries']} entries, {stats['bytes']} bytes, "
+                    f"hit ratio {ratio} ({stats['hits']} hits, {stats['misses']} misses)")
+            elif action == 'purge':
+                purged = purge_cache(config, arguments, section)
+                logging.info(f"Cache {section} ({backend}): purged {purged} entries")
+            else:
+                removed = compact_cache(config, arguments, section)
+                logging.info(f"Cache {section} ({backend}): removed {removed} entries")
+        except Exception as e:
+            logging.error(f"Cache {section} ({backend}): {action} failed: {e}")
+
+
+def cache_stats(config: Config, arguments: Arguments, section: str = 'base') -> dict:
+    """
+    Computes the statistics of a cache section.
+
+    Args:
+        config (Config): Parsed YAML as dict.
+        arguments (Arguments): Command-line arguments.
+        section (str, optional): Cache section. Defaults to 'base'.
+
+    Returns:
+        dict: Entry count ('entries'), stored size ('bytes'), accumulated 'hits' and 'misses',
+            and 'hit_ratio' (None if there were no lookups).
+    """
+    entries = size = 0
+    for _, _, length in _cache.scan_cache(config, arguments, section):
+        entries += 1
+        size += length
+    hits, misses = _cache.load_lookups(config, arguments).get(section, (0, 0))
+    return {
+        'entries': entries, 'bytes': size, 'hits': hits, 'misses': misses,
+        'hit_ratio': hits / (hits + misses) if hits + misses else None
+    }
+
+
+def purge_cache(config: Config, arguments: Arguments, section: str = 'base') -> int:
+    """
+    Deletes the artifact entries that were last updated more than 'cache_time' seconds ago,
+    or the vulnerability entries fetched more than 'cve_retention' seconds ago.
+    Nothing is purged if that time is 0 (entries never expire).
+    POM entries are not purged by age, since an old file that is unchanged keeps a valid entry;
+    the entries of files that were deleted or changed since they were cached are purged instead.
+
+    Args:
+        config (Config): Parsed YAML as dict.
+        arguments (Arguments): Command-line arguments.
+        section (str, optional): Cache section. Defaults to 'base'.
+
+    Returns:
+        int: Number of deleted entries.
+    """
+    if section == 'pom':
+        keys = [key for key, value, _ in _cache.scan_cache(config, arguments, section) if _is_stale_pom(key, value)]
+        _cache.delete_cache_keys(config, arguments, keys, section)
+        return len(keys)
+    if not (cache_time := _cache_time(config, arguments, section)):
+        return 0
+    expire_before = time.time() - cache_time
+    keys = [
+        key for key, value, _ in _cache.scan_cache(config, arguments, section)
+        if isinstance(value, (list, tuple)) and (updated := _cache.entry_time(value)) is not None
+        and updated < expire_before]
+    _cache.delete_cache_keys(config, arguments, keys, section)
+    return len(keys)
+
+
+def compact_cache(config: Config, arguments: Arguments, section: str = 'base') -> int:
+    """
+    Purges expired entries (see purge_cache), then evicts the least recently accessed entries
+    until at most 'cache_max_entries' remain (0: unlimited). Entries without an access time are evicted first.
+
+    Args:
+        config (Config): Parsed YAML as dict.
+        arguments (Arguments): Command-line arguments.
+        section (str, optional): Cache section. Defaults to 'base'.
+
+    Returns:
+        int: Number of deleted entries.
+    """
+    purged = purge_cache(config, arguments, section)
+    max_entries = int(_config.get_config_value(
+        config, arguments, 'cache_max_entries', section,
+        default=_config.get_config_value(config, arguments, 'cache_max_entries', default=0)))
+    if not max_entries:
+        return purged
+
+    accessed = sorted(
+        ((_cache.entry_access(value) or 0, key) for key, value, _ in _cache.scan_cache(config, arguments, section)))
+    keys = [key for _, key in accessed[:max(len(accessed) - max_entries, 0)]]
+    _cache.delete_cache_keys(config, arguments, keys, section)
+    return purged + len(keys)
+
+
+def export_cache(config: Config, arguments: Arguments, path: str, sections: Iterable[str]) -> dict[str, int]:
+    """
+    Writes the entries of the given sections to a gzip-compressed, versioned JSON snapshot,
+    independent of the backends they are stored in. Sections whose backend cannot enumerate
+    its entries are skipped.
+
+    Args:
+        config (Config): Parsed YAML as dict.
+        arguments (Arguments): Command-line arguments.
+        path (str): Path to the snapshot file.
+        sections (Iterable[str]): Cache sections.
+
+    Returns:
+        dict[str, int]: Number of exported entries by section.
+    """
+    snapshot: dict = {'format': _SNAPSHOT_FORMAT, 'created': int(time.time()), 'sections': {}}
+    for section in sections:
+        snapshot['sections'][section] = {key: value for key, value, _ in _cache.scan_cache(config, arguments, section)}
+
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        json.dump(snapshot, f, cls=_cache.DCJSONEncoder)
+    return {section: len(entries) for section, entries in snapshot['sections'].items()}
+
+
+def import_cache(config: Config, arguments: Arguments, path: str, sections: Iterable[str]) -> dict[str, int]:
+    """
+    Merges a snapshot written by export_cache into the configured backends.
+    An entry replaces the stored one unless the stored one has a newer timestamp.
+
+    Args:
+        config (Config): Parsed YAML as dict.
+        arguments (Arguments): Command-line arguments.
+        path (str): Path to the snapshot file.
+        sections (Iterable[str]): Cache sections.
+
+    Returns:
+        dict[str, int]: Number of imported entries by section.
+
+    Raises:
+        ValueError: If the file is not a snapshot in a supported format.
+    """
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        snapshot = json.load(f)
+    if not isinstance(snapshot, dict) or snapshot.get('format') != _SNAPSHOT_FORMAT:
+        raise ValueError(f"Unsupported cache snapshot {path}")
+
+    result = {}
+    for section in sections:
+        if (entries := snapshot['sections'].get(section)) is None:
+            continue
+        cache_data = _cache.load_cache(config, arguments, section)
+        _cache.prefetch_cache(cache_data, entries)
+        for key, value in entries.items():
+            current = cache_data.get(key)
+            if current is None or (current != value and _cache.merge_newest(current, value) is value):
+                cache_data[key] = value
+        result[section] = len(_cache.get_changes(cache_data)[0])
+        _cache.save_cache(config, arguments, cache_data, section)
+    _cache.flush_cache()
+    return result
+
+
+def _is_stale_pom(key: str, value: Any) -> bool:
+    """
+    Checks if a POM entry can no longer be used because its file was deleted or changed.
+
+    Args:
+        key (str): Absolute path of the POM file.
+        value (Any): The cache value.
+
+    Returns:
+        bool: True if the file is missing or its modification time or size differ from the entry.
+    """
+    try:
+        stat = os.stat(key)
+    except OSError:
+        return True
+    return not isinstance(value, dict) or value.get('mtime') != stat.st_mtime_ns or value.get('size') != stat.st_size
+
+
+def _cache_time(config: Config, arguments: Arguments, section: str) -> int:
+    """
+    Retrieves the expiry time of a cache section, falling back to the base section.
+    Vulnerability entries expire after 'cve_retention' seconds (30 days by default). Entries older than
+    'cve_ttl' are still served while they are refreshed, so the retention is never shorter than 'cve_ttl'.
+
+    Args:
+        config (Config): Parsed YAML as dict.
+        arguments (Arguments): Command-line arguments.
+        section (str): Cache section.
+
+    Returns:
+        int: The expiry time in seconds, 0 if entries never expire.
+    """
+    if section == 'vulnerability':
+        retention = int(_config.get_config_value(config, arguments, 'cve_retention', section, default=2592000))
+        cve_ttl = int(_config.get_config_value(config, arguments, 'cve_ttl', section, default=86400))
+        return max(retention, cve_ttl) if retention else 0
+    return int(_config.get_config_value(
+        config, arguments, 'cache_time', section,
+        default=_config.get_config_value(config, arguments, 'cache_time', default=600)))
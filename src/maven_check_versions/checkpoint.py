@@ -0,0 +1,149 @@
+#!/usr/bin/python3
+"""This file provides resumable run checkpoint functions"""
+
+import logging
+import os
+import threading
+from typing import Optional
+
+import maven_check_versions.config as _config
+from maven_check_versions.config import Config, Arguments
+
+_CHECKPOINT_FILE = 'maven_check_versions.checkpoint'
+
+POM = 'pom'
+COORDINATE = 'coordinate'
+
+
+class Checkpoint:
+    """
+    Append-only record of the POM files and coordinates finished by a run.
+    Each finished item is one 'kind<TAB>key' line, so recording it is a single buffered write
+    and a run that crashes in the middle of a line loses only that line.
+    Only the items finished by a previous run are skipped; items recorded by this run are not.
+    Used as a context manager, it removes the file when the run completes and keeps it otherwise.
+    """
+
+    def __init__(self, path: str, resume: bool = True):
+        """
+        Opens the checkpoint file for appending.
+
+        Args:
+            path (str): Path to the checkpoint file.
+            resume (bool, optional): Load the items finished by a previous run (default is True),
+                or start from an empty checkpoint.
+        """
+        self.path = path
+        self.finished: set[tuple[str, str]] = load_checkpoint(path) if resume else set()
+        self.done: set[tuple[str, str]] = set()
+        self._lock = threading.Lock()
+        self._file = open(path, 'a' if resume else 'w', encoding='utf-8')
+        if self.finished:
+            logging.info(f"Resuming from {path}: {len(self.finished)} finished items")
+
+    def __enter__(self) -> 'Checkpoint':
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.clear()
+        else:
+            self.close()
+
+    def is_done(self, kind: str, key: str) -> bool:
+        """
+        Checks if an item was finished by a previous run.
+
+        Args:
+            kind (str): Item kind, POM or COORDINATE.
+            key (str): POM path, or coordinate key built by coordinate_key.
+
+        Returns:
+            bool: True if the item was finished.
+        """
+        return (kind, key) in self.finished
+
+    def mark_done(self, kind: str, key: str) -> None:
+        """
+        Records a finished item.
+
+        Args:
+            kind (str): Item kind, POM or COORDINATE.
+            key (str): POM path, or coordinate key built by coordinate_key.
+        """
+        with self._lock:
+            if (kind, key) in self.done or (kind, key) in self.finished or self._file.closed:
+                return
+            self.done.add((kind, key))
+            self._file.write(f"{kind}\t{key}\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        """
+        Closes the checkpoint file and keeps it for a later resume.
+        """
+        with self._lock:
+            self._file.close()
+
+    def clear(self) -> None:
+        """
+        Closes and removes the checkpoint file.
+        """
+        self.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:  # pragma: no cover
+            pass
+
+
+def coordinate_key(pom_path: str, coordinate: str) -> str:
+    """
+    Builds the checkpoint key of a coordinate, scoped to the POM file that declares it,
+    so the same coordinate in another POM file is still checked.
+
+    Args:
+        pom_path (str): Path or URL of the POM file.
+        coordinate (str): 'groupId:artifactId:version' coordinate.
+
+    Returns:
+        str: The key of the coordinate.
+    """
+    return f"{pom_path}\t{coordinate}"
+
+
+def load_checkpoint(path: str) -> set[tuple[str, str]]:
+    """
+    Loads the finished items from a checkpoint file.
+    A last line without a newline was cut off by a crash and is ignored.
+
+    Args:
+        path (str): Path to the checkpoint file.
+
+    Returns:
+        set[tuple[str, str]]: The (kind, key) pairs of the finished items.
+    """
+    done: set[tuple[str, str]] = set()
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if line.endswith('\n') and '\t' in line:
+                    kind, key = line[:-1].split('\t', maxsplit=1)
+                    done.add((kind, key))
+    return done
+
+
+def open_checkpoint(config: Config, arguments: Arguments) -> Optional[Checkpoint]:
+    """
+    Opens the checkpoint of the run if 'resume' is enabled.
+
+    Args:
+        config (Config): Parsed YAML as dict.
+        arguments (Arguments): Command-line arguments.
+
+    Returns:
+        Optional[Checkpoint]: The checkpoint, or None if 'resume' is disabled.
+    """
+    if not _config.get_config_value(config, arguments, 'resume', default=False):
+        return None
+    path = _config.get_config_value(config, arguments, 'checkpoint_file', default=_CHECKPOINT_FILE)
+    return Checkpoint(path)
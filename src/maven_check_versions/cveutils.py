@@ -3,19 +3,34 @@
 
 import logging
 import re
+import threading
+import time
 # noinspection PyPep8Naming
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
 from dataclasses import dataclass
 from itertools import islice
-from typing import Optional
+from typing import Any, Optional, Union
 
 import maven_check_versions.cache as _cache
 import maven_check_versions.config as _config
 import maven_check_versions.utils as _utils
 import requests
 from maven_check_versions.config import Config, Arguments
+from maven_check_versions.pomutils import PomDependency, PomIndex
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 
+_CVE_TTL = 86400
+_RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+_refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='cve-refresh')
+_refresh_lock = threading.Lock()
+_refresh_queued: dict[str, None] = {}
+_refreshed: set[str] = set()
+_refresh_future: Optional[Future] = None
+_refresh_running = False
+
 
 @dataclass
 class Vulnerability:
@@ -35,9 +50,123 @@ class Vulnerability:
     versionRanges: Optional[list] = None  # NOSONAR # noqa: N815
 
 
+class VulnerabilityStore:
+    """
+    Run-scoped vulnerability store. The cache is loaded once and queried by every POM file and module;
+    each coordinate is converted to Vulnerability objects once, and fetched from OSS Index by only one caller
+    while concurrent callers wait for the result. Fetched results are kept in cache_data, which is saved once
+    by save() (or by a CacheFlusher) instead of after each POM file.
+    """
+
+    def __init__(self, config: Config, arguments: Arguments, cache_data: Optional[dict] = None):
+        """
+        Initializes the store.
+
+        Args:
+            config (Config): Parsed YAML as dict.
+            arguments (Arguments): Command-line arguments.
+            cache_data (Optional[dict], optional): Vulnerability cache data
+                (e.g., loaded by load_cache_async), or None to load it.
+        """
+        self.config = config
+        self.arguments = arguments
+        self.cache_data = cache_data if cache_data is not None else \
+            _cache.load_cache(config, arguments, 'vulnerability')
+        self.ttl = int(_config.get_config_value(config, arguments, 'cve_ttl', 'vulnerability', default=_CVE_TTL))
+        self._results: dict[str, Optional[list[Vulnerability]]] = {}
+        self._pending: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def get(self, coordinates: list[str]) -> dict[str, list[Vulnerability]]:
+        """
+        Retrieves the vulnerabilities of coordinates, fetching those that are not known yet.
+        Stale cache entries are returned at once and refreshed in the background.
+
+        Args:
+            coordinates (list[str]): Coordinates.
+
+        Returns:
+            dict[str, list[Vulnerability]]: CVE Data of the cached and fetched coordinates.
+        """
+        owned: dict[str, Future] = {}
+        waiting: dict[str, Future] = {}
+        with self._lock:
+            for coordinate in coordinates:
+                if coordinate in self._results:
+                    continue
+                if (future := self._pending.get(coordinate)) is not None:
+                    waiting[coordinate] = future
+                else:
+                    owned[coordinate] = self._pending[coordinate] = Future()
+
+        resolved: dict[str, Optional[list[Vulnerability]]] = {}
+        try:
+            resolved = self._resolve(list(owned))
+        finally:
+            with self._lock:
+                self._results.update(resolved)
+                for coordinate, future in owned.items():
+                    del self._pending[coordinate]
+                    future.set_result(None)
+
+        for future in waiting.values():
+            future.result()
+        with self._lock:
+            return {c: cves for c in coordinates if (cves := self._results.get(c)) is not None}
+
+    def _resolve(self, coordinates: list[str]) -> dict[str, Optional[list[Vulnerability]]]:
+        """
+        Looks coordinates up in the cache and fetches the missing ones.
+
+        Args:
+            coordinates (list[str]): Coordinates owned by the caller.
+
+        Returns:
+            dict[str, Optional[list[Vulnerability]]]: Vulnerabilities of the coordinates,
+                None for safe coordinates that are not cached. Coordinates whose batch failed are omitted.
+        """
+        result: dict[str, Optional[list[Vulnerability]]] = {}
+        if not coordinates:
+            return result
+        _cache.prefetch_cache(self.cache_data, coordinates)
+        now = time.time()
+
+        missing, stale = [], []
+        for coordinate in coordinates:
+            if (entry := self.cache_data.get(coordinate)) is None:
+                missing.append(coordinate)
+                continue
+            fetched, result[coordinate] = _split_entry(entry)
+            if self.ttl and now - fetched >= self.ttl:
+                stale.append(coordinate)
+        if isinstance(self.cache_data, _cache.CacheData):
+            self.cache_data.count_lookup(True, len(coordinates) - len(missing))
+            self.cache_data.count_lookup(False, len(missing))
+
+        if missing:
+            keep_safe = _oss_index_config(self.config, self.arguments)[4]
+            fetched_data = _fetch_cve_data(self.config, self.arguments, missing, keep_safe=True)
+            for coordinate, cves in fetched_data.items():
+                if cves or keep_safe:
+                    self.cache_data[coordinate] = [int(now), cves]
+                    result[coordinate] = cves
+                else:
+                    result[coordinate] = None
+
+        if stale:
+            _schedule_refresh(self.config, self.arguments, stale)
+        return result
+
+    def save(self) -> None:
+        """
+        Saves the fetched results to the vulnerability cache.
+        """
+        _cache.save_cache(self.config, self.arguments, self.cache_data, 'vulnerability')
+
+
 def get_cve_data(
-        config: Config, arguments: Arguments, dependencies: list[ET.Element],
-        root: ET.Element, ns_mapping: dict
+        config: Config, arguments: Arguments, dependencies: list[PomDependency],
+        root: Union[ET.Element, PomIndex], ns_mapping: dict, cve_store: Optional[VulnerabilityStore] = None
 ) -> dict[str, list[Vulnerability]]:
     """
     Retrieves CVE (Common Vulnerabilities and Exposures) data for the given dependencies
@@ -46,30 +175,122 @@ def get_cve_data(
     Args:
         config (Config): Parsed YAML as dict.
         arguments (Arguments): Command-line arguments.
-        dependencies (list[ET.Element]): Dependencies.
-        root (ET.Element): Root element of the POM file.
+        dependencies (list[PomDependency]): Dependencies.
+        root (Union[ET.Element, PomIndex]): Root element of the POM file, or its index.
         ns_mapping (dict): XML namespace mapping.
+        cve_store (Optional[VulnerabilityStore], optional): Vulnerability store shared by the run,
+            which saves its results once; or None to load and save the cache for this call.
 
     Returns:
         dict[str, list[Vulnerability]]: CVE Data.
     """
-    section = 'vulnerability'
-    if not _config.get_config_value(config, arguments, 'oss_index', section, default=False):
+    if not _config.get_config_value(config, arguments, 'oss_index', 'vulnerability', default=False):
         return {}
 
-    coordinates = _get_coordinates(config, arguments, dependencies, ns_mapping, root)
-    cve_data = _cache.load_cache(config, arguments, section) or {}
+    coordinates = list(dict.fromkeys(_get_coordinates(config, arguments, dependencies, ns_mapping, root)))
+    if cve_store is not None:
+        return cve_store.get(coordinates)
 
-    for key, data in cve_data.items():
-        cve_data[key] = [Vulnerability(**item) for item in data]
+    cve_store = VulnerabilityStore(config, arguments)
+    result = cve_store.get(coordinates)
+    cve_store.save()
+    return result
 
-    coordinates = [coord for coord in coordinates if coord not in cve_data]
 
-    if new_cve_data := _fetch_cve_data(config, arguments, coordinates):
-        cve_data.update(new_cve_data)
-        _cache.save_cache(config, arguments, cve_data, section)
+def _split_entry(entry: Any) -> tuple[float, list[Vulnerability]]:
+    """
+    Splits a vulnerability cache entry into its fetch time and vulnerabilities.
+    Entries are [fetch time, vulnerabilities]; a plain list of vulnerabilities (written by earlier versions)
+    has fetch time 0, so it is served but refreshed.
 
-    return cve_data
+    Args:
+        entry (Any): The cache entry.
+
+    Returns:
+        tuple[float, list[Vulnerability]]: The fetch time and the vulnerabilities.
+    """
+    fetched: float = 0
+    if isinstance(entry, (list, tuple)) and len(entry) == 2 and isinstance(entry[0], (int, float)):
+        fetched, entry = entry
+    return fetched, [cve if isinstance(cve, Vulnerability) else Vulnerability(**cve) for cve in entry]
+
+
+def _schedule_refresh(config: Config, arguments: Arguments, coordinates: list[str]) -> None:
+    """
+    Queues stale coordinates for a background refresh. Coordinates queued by concurrent calls
+    are fetched together in OSS Index batches, and each coordinate is refreshed at most once per process.
+
+    Args:
+        config (Config): Parsed YAML as dict.
+        arguments (Arguments): Command-line arguments.
+        coordinates (list[str]): Stale coordinates.
+    """
+    global _refresh_future, _refresh_running
+    with _refresh_lock:
+        _refresh_queued.update(dict.fromkeys(c for c in coordinates if c not in _refreshed))
+        if _refresh_queued and not _refresh_running:
+            _refresh_running = True
+            _refresh_future = _refresh_executor.submit(_refresh_worker, config, arguments)
+
+
+def _refresh_worker(config: Config, arguments: Arguments) -> None:
+    """
+    Refreshes queued coordinates until the queue is empty.
+
+    Args:
+        config (Config): Parsed YAML as dict.
+        arguments (Arguments): Command-line arguments.
+    """
+    global _refresh_running
+    while True:
+        with _refresh_lock:
+            if not (coordinates := list(_refresh_queued)):
+                _refresh_running = False
+                return
+            _refresh_queued.clear()
+            _refreshed.update(coordinates)
+        try:
+            _refresh_cve_data(config, arguments, coordinates)
+        except Exception as e:  # pragma: no cover
+            logging.error(f"Failed to refresh CVE data: {e}")
+
+
+def _refresh_cve_data(config: Config, arguments: Arguments, coordinates: list[str]) -> None:
+    """
+    Fetches stale coordinates again and saves the results with the current fetch time.
+    Coordinates that turned out safe are deleted unless 'oss_index_keep_safe' is set;
+    coordinates whose batch failed stay stale.
+
+    Args:
+        config (Config): Parsed YAML as dict.
+        arguments (Arguments): Command-line arguments.
+        coordinates (list[str]): Stale coordinates.
+    """
+    keep_safe = _oss_index_config(config, arguments)[4]
+    cve_cache = _cache.CacheData()
+    now = int(time.time())
+    fetched = _fetch_cve_data(config, arguments, coordinates, keep_safe=True)
+    for coordinate, cves in fetched.items():
+        if cves or keep_safe:
+            cve_cache[coordinate] = [now, cves]
+        else:
+            cve_cache.deleted.add(coordinate)
+    written, deleted = _cache.get_changes(cve_cache)
+    _cache.save_cache(config, arguments, cve_cache, 'vulnerability')
+    logging.info(
+        f"Refreshed CVE data: {len(written)} written, {len(deleted)} deleted as safe, "
+        f"{len(coordinates) - len(fetched)} failed")
+
+
+def wait_for_refresh() -> None:
+    """
+    Waits until the background refresh of stale vulnerability cache entries has finished.
+    """
+    while True:
+        with _refresh_lock:
+            if not _refresh_running or (future := _refresh_future) is None:
+                return
+        future.exception()
 
 
 def log_vulnerability(
@@ -110,8 +331,8 @@ def _get_coordinates(config, arguments, dependencies, ns_mapping, root) -> list[
     Args:
         config (Config): Parsed YAML as dict.
         arguments (Arguments): Command-line arguments.
-        dependencies (list[ET.Element]): List of dependency elements from the POM file.
-        root (ET.Element): The root element of the POM file's XML tree.
+        dependencies (list[PomDependency]): List of dependency records from the POM file.
+        root (Union[ET.Element, PomIndex]): The root element of the POM file's XML tree, or its index.
         ns_mapping (dict): A dictionary mapping XML namespaces for parsing.
 
     Returns:
@@ -145,7 +366,8 @@ def _oss_index_config(config: Config, arguments: Arguments) -> tuple:
         arguments (Arguments): Command-line arguments.
 
     Returns:
-        tuple: OSS Index parameters.
+        tuple: OSS Index parameters
+            (url, user, token, batch_size, keep_safe, max_requests, retries, backoff).
     """
     section = 'vulnerability'
     default_url = 'https://ossindex.sonatype.org/api/v3/component-report'
@@ -153,46 +375,105 @@ def _oss_index_config(config: Config, arguments: Arguments) -> tuple:
         _config.get_config_value(config, arguments, 'oss_index_url', section, default=default_url),
         _config.get_config_value(config, arguments, 'oss_index_user', section),
         _config.get_config_value(config, arguments, 'oss_index_token', section),
-        _config.get_config_value(config, arguments, 'oss_index_batch_size', section, default=128),
-        _config.get_config_value(config, arguments, 'oss_index_keep_safe', section, default=False)
+        int(_config.get_config_value(config, arguments, 'oss_index_batch_size', section, default=128)),
+        _config.get_config_value(config, arguments, 'oss_index_keep_safe', section, default=False),
+        max(1, int(_config.get_config_value(config, arguments, 'oss_index_max_requests', section, default=4))),
+        max(0, int(_config.get_config_value(config, arguments, 'oss_index_retries', section, default=3))),
+        float(_config.get_config_value(config, arguments, 'oss_index_backoff', section, default=1.0))
     )
 
 
 def _fetch_cve_data(
-        config: Config, arguments: Arguments, coordinates: list[str]
+        config: Config, arguments: Arguments, coordinates: list[str], keep_safe: Optional[bool] = None
 ) -> dict[str, list[Vulnerability]]:
     """
-    Get CVE data for coordinates.
+    Get CVE data for coordinates. Batches of 'oss_index_batch_size' coordinates are sent concurrently,
+    at most 'oss_index_max_requests' at a time, and failed batches are retried.
 
     Args:
         config (Config): Parsed YAML as dict.
         arguments (Arguments): Command-line arguments.
         coordinates (list[str]): Coordinates.
+        keep_safe (Optional[bool], optional): Includes safe coordinates in the result.
+            Defaults to 'oss_index_keep_safe'.
 
     Returns:
         dict[str, list[Vulnerability]]: CVE Data.
     """
     result = {}
     try:
-        url, user, token, batch_size, keep_safe = _oss_index_config(config, arguments)
+        url, user, token, batch_size, config_keep_safe, max_requests, retries, backoff = \
+            _oss_index_config(config, arguments)
+        keep_safe = config_keep_safe if keep_safe is None else keep_safe
+        it = iter(coordinates)
+        if not (batches := list(iter(lambda: list(islice(it, batch_size)), []))):
+            return result
 
         with requests.Session() as session:
-            it = iter(coordinates)
+            adapter = HTTPAdapter(pool_maxsize=max_requests)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
             auth = HTTPBasicAuth(user, token)
 
-            while batch := list(islice(it, batch_size)):
-                response = session.post(url, json={"coordinates": batch}, auth=auth)
-                if response.status_code != 200:
-                    logging.error(f"OSS Index API error: {response.status_code}")
-                    continue
-
-                for item in response.json():
-                    cves = []
-                    if data := item.get('vulnerabilities'):
-                        cves = [Vulnerability(**cve) for cve in data]
-                    if len(cves) or keep_safe:
-                        result.update({item['coordinates']: cves})
+            max_workers = min(max_requests, len(batches))
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='oss-index') as executor:
+                for future in as_completed([
+                    executor.submit(_post_batch, session, url, auth, batch, retries, backoff)
+                    for batch in batches
+                ]):
+                    try:
+                        items = future.result()
+                    except Exception as e:
+                        logging.error(f"Failed to _fetch_cve_data: {e}")
+                        continue
+
+                    for item in items:
+                        cves = []
+                        if data := item.get('vulnerabilities'):
+                            cves = [Vulnerability(**cve) for cve in data]
+                        if len(cves) or keep_safe:
+                            result.update({item['coordinates']: cves})
 
     except Exception as e:
         logging.error(f"Failed to _fetch_cve_data: {e}")
     return result
+
+
+def _post_batch(
+        session: requests.Session, url: str, auth: HTTPBasicAuth, batch: list[str], retries: int, backoff: float
+) -> list[dict]:
+    """
+    Posts a batch of coordinates to the OSS Index API. Connection errors, 429 and 5xx answers are retried
+    up to 'retries' times, waiting 'backoff' seconds doubled on each attempt, or as long as Retry-After asks.
+
+    Args:
+        session (requests.Session): HTTP session shared by the batches.
+        url (str): OSS Index API URL.
+        auth (HTTPBasicAuth): OSS Index credentials.
+        batch (list[str]): Coordinates.
+        retries (int): Number of retries.
+        backoff (float): Delay before the first retry in seconds.
+
+    Returns:
+        list[dict]: Component reports, or an empty list if the batch failed.
+    """
+    error = None
+    for attempt in range(retries + 1):
+        delay = backoff * 2 ** attempt
+        try:
+            response = session.post(url, json={"coordinates": batch}, auth=auth)
+        except requests.RequestException as e:
+            error = f"OSS Index API error: {e}"
+        else:
+            if response.status_code == 200:
+                return response.json()
+            error = f"OSS Index API error: {response.status_code}"
+            if response.status_code not in _RETRY_STATUS:
+                break
+            if (retry_after := response.headers.get('Retry-After', '')).isdigit():
+                delay = float(retry_after)
+        if attempt < retries:
+            logging.warning(f"{error}, retrying {len(batch)} coordinates in {delay:g}s")
+            time.sleep(delay)
+    logging.error(error)
+    return []
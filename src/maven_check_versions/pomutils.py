@@ -0,0 +1,399 @@
+#!/usr/bin/python3
+"""This file provides POM index functions"""
+
+import re
+import threading
+# noinspection PyPep8Naming
+import xml.etree.ElementTree as ET
+from dataclasses import asdict, dataclass, field, replace
+from typing import IO, Iterator, Optional, Union
+from weakref import WeakKeyDictionary
+
+import maven_check_versions.xmlutils as _xmlutils
+
+_PROPERTY_PATTERN = re.compile(r'^\${([^}]+)}$')
+_PROPERTY_DEPTH = 10
+
+_index_cache: WeakKeyDictionary = WeakKeyDictionary()
+_index_cache_lock = threading.Lock()
+
+
+@dataclass
+class PomDependency:
+    """
+    Dependency or plugin record extracted from a POM file.
+    """
+    group: str
+    artifact: str
+    version: Optional[str] = None
+    plugin: bool = False
+    scope: Optional[str] = None
+
+
+@dataclass
+class PomIndex:
+    """
+    Facts extracted from a POM file in a single walk of its XML tree.
+    """
+    group: Optional[str] = None
+    artifact: Optional[str] = None
+    version: Optional[str] = None
+    properties: dict[str, str] = field(default_factory=dict)
+    dependencies: list[PomDependency] = field(default_factory=list)
+    plugins: list[PomDependency] = field(default_factory=list)
+    modules: list[str] = field(default_factory=list)
+    parent: Optional[PomDependency] = None
+    parent_path: Optional[str] = None
+    managed: dict[str, PomDependency] = field(default_factory=dict)
+    imports: list[PomDependency] = field(default_factory=list)
+    elements: dict = field(default_factory=dict, repr=False, compare=False)
+
+    @property
+    def artifact_name(self) -> str:
+        """
+        Returns the artifact name in the format 'groupId:artifactId', or only the artifactId without groupId.
+        """
+        return (f"{self.group}:" if self.group is not None else '') + (self.artifact or '')
+
+
+def index_to_dict(index: PomIndex) -> dict:
+    """
+    Converts a POM index to plain data that can be stored in a cache.
+
+    Args:
+        index (PomIndex): The POM index.
+
+    Returns:
+        dict: The index fields without the element lookup table.
+    """
+    data = asdict(replace(index, elements={}))
+    del data['elements']
+    return data
+
+
+def index_from_dict(data: dict) -> PomIndex:
+    """
+    Restores a POM index from the plain data produced by index_to_dict.
+
+    Args:
+        data (dict): The index fields.
+
+    Returns:
+        PomIndex: The restored index. It has no element lookup table.
+    """
+    return PomIndex(**{
+        **data,
+        'dependencies': [PomDependency(**d) for d in data.get('dependencies', [])],
+        'plugins': [PomDependency(**d) for d in data.get('plugins', [])],
+        'parent': PomDependency(**data['parent']) if data.get('parent') else None,
+        'managed': {key: PomDependency(**d) for key, d in data.get('managed', {}).items()},
+        'imports': [PomDependency(**d) for d in data.get('imports', [])]
+    })
+
+
+def build_pom_index(root: ET.Element, ns_mapping: dict) -> PomIndex:
+    """
+    Builds the index of a POM file in one walk of its XML tree.
+
+    Args:
+        root (ET.Element): The root element of the POM file's XML tree.
+        ns_mapping (dict): A dictionary mapping XML namespaces for parsing.
+
+    Returns:
+        PomIndex: Project coordinates, parent, properties, dependencies, managed dependencies,
+            BOM imports, plugins and modules of the POM file.
+    """
+    ns = f"{{{ns_mapping['xmlns']}}}" if ns_mapping.get('xmlns') else ''
+    dependency_tag, plugin_tag, plugins_tag = ns + 'dependency', ns + 'plugin', ns + 'plugins'
+    index = PomIndex()
+
+    stack = [(child, root.tag, 1, False) for child in reversed(root)]
+    while stack:
+        element, parent_tag, depth, managed = stack.pop()
+        tag = element.tag
+
+        if tag == dependency_tag:
+            index.elements[element] = record = dependency_record(element, ns_mapping)
+            index.dependencies.append(record)
+            if managed and record.scope == 'import':
+                index.imports.append(record)
+            elif managed:
+                index.managed[f"{record.group}:{record.artifact}"] = record
+            continue
+        if tag == ns + 'modules':
+            _index_modules(element, ns, index)
+            continue
+        if tag == plugin_tag and parent_tag == plugins_tag:
+            index.elements[element] = record = dependency_record(element, ns_mapping, plugin=True)
+            index.plugins.append(record)
+        elif depth == 1:
+            if tag == ns + 'groupId':
+                index.group = str(element.text)
+            elif tag == ns + 'artifactId':
+                index.artifact = str(element.text)
+            elif tag == ns + 'version':
+                index.version = str(element.text)
+            elif tag == ns + 'properties':
+                for item in element:
+                    if isinstance(item.tag, str) and item.tag.startswith(ns):
+                        index.properties[item.tag[len(ns):]] = str(item.text)
+                continue
+            elif tag == ns + 'parent':
+                index.parent = dependency_record(element, ns_mapping)
+                if (relative_path := element.find(ns + 'relativePath')) is not None:
+                    index.parent_path = relative_path.text or ''
+                continue
+            elif tag == ns + 'dependencyManagement':
+                managed = True
+
+        stack.extend((child, tag, depth + 1, managed) for child in reversed(element))
+
+    return index
+
+
+def iter_pom_dependencies(
+        source: Union[str, IO[bytes]], ns_mapping: dict, index: PomIndex
+) -> Iterator[PomDependency]:
+    """
+    Parses a POM file incrementally and yields dependency and plugin records as soon as they are parsed.
+    Elements are cleared once their data is extracted, so memory use does not grow with the document size.
+    The index is filled while parsing; for effective-pom dumps with several projects,
+    the project coordinates are taken from the first one.
+
+    Args:
+        source (Union[str, IO[bytes]]): Path to the POM file or a binary stream of it.
+        ns_mapping (dict): A dictionary mapping XML namespaces for parsing.
+        index (PomIndex): The index to fill with the parsed facts.
+
+    Yields:
+        PomDependency: Dependency and plugin records in document order.
+    """
+    ns = f"{{{ns_mapping['xmlns']}}}" if ns_mapping.get('xmlns') else ''
+    dependency_tag, plugin_tag, plugins_tag = ns + 'dependency', ns + 'plugin', ns + 'plugins'
+    keep_tags = {dependency_tag, plugin_tag, ns + 'parent', ns + 'properties', ns + 'modules'}
+    tags: list[str] = []
+    nesting = 0
+
+    for event, element in _xmlutils.iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            if not tags and element.tag in ('projects', ns + 'projects'):
+                nesting = 1
+            tags.append(element.tag)
+            continue
+
+        tags.pop()
+        tag, depth = element.tag, len(tags) - nesting
+        parent_tag = tags[-1] if tags else None
+
+        if tag == dependency_tag:
+            record = dependency_record(element, ns_mapping)
+            index.dependencies.append(record)
+            if ns + 'dependencyManagement' in tags:
+                if record.scope == 'import':
+                    index.imports.append(record)
+                else:
+                    index.managed[f"{record.group}:{record.artifact}"] = record
+            element.clear()
+            yield record
+        elif tag == plugin_tag and parent_tag == plugins_tag:
+            record = dependency_record(element, ns_mapping, plugin=True)
+            index.plugins.append(record)
+            element.clear()
+            yield record
+        elif depth == 1:
+            _index_project_element(element, ns_mapping, index)
+            element.clear()
+        elif tag == ns + 'modules':
+            _index_modules(element, ns, index)
+            element.clear()
+        elif parent_tag not in keep_tags:
+            element.clear()
+
+
+def _index_project_element(element: ET.Element, ns_mapping: dict, index: PomIndex) -> None:
+    """
+    Adds a direct child of the project element to the index, keeping values that are already set.
+
+    Args:
+        element (ET.Element): The child element of the project.
+        ns_mapping (dict): A dictionary mapping XML namespaces for parsing.
+        index (PomIndex): The index to fill.
+    """
+    ns = f"{{{ns_mapping['xmlns']}}}" if ns_mapping.get('xmlns') else ''
+    tag = element.tag
+    if tag == ns + 'groupId' and index.group is None:
+        index.group = str(element.text)
+    elif tag == ns + 'artifactId' and index.artifact is None:
+        index.artifact = str(element.text)
+    elif tag == ns + 'version' and index.version is None:
+        index.version = str(element.text)
+    elif tag == ns + 'properties':
+        for item in element:
+            if isinstance(item.tag, str) and item.tag.startswith(ns):
+                index.properties.setdefault(item.tag[len(ns):], str(item.text))
+    elif tag == ns + 'modules':
+        _index_modules(element, ns, index)
+    elif tag == ns + 'parent' and index.parent is None:
+        index.parent = dependency_record(element, ns_mapping)
+        if (relative_path := element.find(ns + 'relativePath')) is not None:
+            index.parent_path = relative_path.text or ''
+
+
+def _index_modules(element: ET.Element, ns: str, index: PomIndex) -> None:
+    """
+    Adds the modules of a modules element, of the project or of a profile, to the index.
+
+    Args:
+        element (ET.Element): The modules element.
+        ns (str): The namespace prefix of the tags.
+        index (PomIndex): The index to fill.
+    """
+    for item in element:
+        if item.tag == ns + 'module' and (module := str(item.text)) not in index.modules:
+            index.modules.append(module)
+
+
+def is_resolvable(index: PomIndex, dependency: PomDependency) -> bool:
+    """
+    Checks whether the version of a dependency can already be resolved from the indexed facts.
+
+    Args:
+        index (PomIndex): The index of the POM file, possibly still being filled.
+        dependency (PomDependency): The dependency record.
+
+    Returns:
+        bool: True if the dependency has a version that is not an unresolved placeholder.
+    """
+    if (version := dependency.version) is None:
+        return False
+    if version == '${project.version}' and index.version is not None:
+        return True
+    return not _PROPERTY_PATTERN.match(resolve_property(index, version))
+
+
+def dependency_record(element: ET.Element, ns_mapping: dict, plugin: bool = False) -> PomDependency:
+    """
+    Creates a dependency record from a dependency or plugin element.
+
+    Args:
+        element (ET.Element): The dependency or plugin XML element from the POM file.
+        ns_mapping (dict): A dictionary mapping XML namespaces for parsing.
+        plugin (bool, optional): Whether the element is a plugin (default is False).
+
+    Returns:
+        PomDependency: The dependency record. The version is None if the element has no version.
+    """
+    ns = f"{{{ns_mapping['xmlns']}}}" if ns_mapping.get('xmlns') else ''
+    record = PomDependency('', '', plugin=plugin)
+    for child in element:
+        if child.tag == ns + 'groupId':
+            record.group = str(child.text)
+        elif child.tag == ns + 'artifactId':
+            record.artifact = str(child.text)
+        elif child.tag == ns + 'version':
+            record.version = str(child.text)
+        elif child.tag == ns + 'scope':
+            record.scope = str(child.text)
+    return record
+
+
+def get_pom_index(root: Union[ET.Element, PomIndex], ns_mapping: dict) -> PomIndex:
+    """
+    Returns the index of a POM file, building it once per root element.
+    Indexes are kept only while their root element is alive; lxml elements, which cannot be weakly
+    referenced, are indexed on each call.
+
+    Args:
+        root (Union[ET.Element, PomIndex]): The root element of the POM file's XML tree, or its index.
+        ns_mapping (dict): A dictionary mapping XML namespaces for parsing.
+
+    Returns:
+        PomIndex: The index of the POM file.
+    """
+    if isinstance(root, PomIndex):
+        return root
+
+    try:
+        with _index_cache_lock:
+            if (index := _index_cache.get(root)) is not None:
+                return index
+    except TypeError:
+        return build_pom_index(root, ns_mapping)
+
+    index = build_pom_index(root, ns_mapping)
+    with _index_cache_lock:
+        _index_cache[root] = index
+    return index
+
+
+def resolve_property(index: PomIndex, value: str) -> str:
+    """
+    Resolves a '${property}' placeholder with a value from the indexed POM properties.
+    Properties that refer to other properties are followed up to a fixed depth.
+
+    Args:
+        index (PomIndex): The index of the POM file.
+        value (str): The value, which may be a placeholder (e.g., '${version}').
+
+    Returns:
+        str: The property value if the placeholder is found in properties, otherwise the original value.
+    """
+    for _ in range(_PROPERTY_DEPTH):
+        if not (match := _PROPERTY_PATTERN.match(value)) or (resolved := index.properties.get(match.group(1))) is None:
+            break
+        value = resolved
+    return value
+
+
+def managed_version(index: PomIndex, dependency: PomDependency) -> Optional[str]:
+    """
+    Returns the version of a dependency from the indexed dependencyManagement section.
+
+    Args:
+        index (PomIndex): The index of the POM file.
+        dependency (PomDependency): The dependency record.
+
+    Returns:
+        Optional[str]: The managed version, or None if the dependency is not managed.
+    """
+    if (managed := index.managed.get(f"{dependency.group}:{dependency.artifact}")) is not None:
+        return managed.version
+    return None
+
+
+def effective_index(index: PomIndex, parent: Optional[PomIndex], boms: list[PomIndex]) -> PomIndex:
+    """
+    Merges a POM index with its effective parent index and the effective indexes of its imported BOMs.
+    Own properties and managed dependencies override inherited ones, which override BOM imports.
+    Inherited managed versions are resolved later against the child's properties, like Maven does,
+    while BOM versions are resolved in the context of the BOM.
+
+    Args:
+        index (PomIndex): The index of the POM file.
+        parent (Optional[PomIndex]): The effective index of the parent POM, if any.
+        boms (list[PomIndex]): The effective indexes of the imported BOMs, in declaration order.
+
+    Returns:
+        PomIndex: The effective index.
+    """
+    properties = dict(parent.properties) if parent is not None else {}
+    managed = dict(parent.managed) if parent is not None else {}
+
+    group, version = index.group, index.version
+    if index.parent is not None:
+        group = group if group is not None else index.parent.group
+        version = version if version is not None else index.parent.version
+        properties['project.parent.groupId'] = index.parent.group
+        properties['project.parent.version'] = str(index.parent.version)
+    for key, value in (('groupId', group), ('artifactId', index.artifact), ('version', version)):
+        if value is not None:
+            properties[f"project.{key}"] = properties[f"pom.{key}"] = value
+    properties.update(index.properties)
+    managed.update(index.managed)
+
+    for bom in boms:
+        for key, dependency in bom.managed.items():
+            if key not in managed:
+                managed[key] = replace(dependency, version=resolve_property(bom, str(dependency.version)))
+
+    return replace(index, group=group, version=version, properties=properties, managed=managed)
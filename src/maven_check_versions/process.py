@@ -7,18 +7,24 @@ import threading
 # noinspection PyPep8Naming
 import xml.etree.ElementTree as ET
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Optional
+from contextlib import nullcontext
+from typing import Optional, Union
 
 import maven_check_versions.cache as _cache
+import maven_check_versions.checkpoint as _checkpoint
 import maven_check_versions.config as _config
 import maven_check_versions.cveutils as _cveutils
 import maven_check_versions.logutils as _logutils
+import maven_check_versions.pomutils as _pomutils
 import maven_check_versions.utils as _utils
+import maven_check_versions.xmlutils as _xmlutils
 import requests
 import urllib3
 from bs4 import BeautifulSoup
+from maven_check_versions.checkpoint import Checkpoint
 from maven_check_versions.config import Config, Arguments
-from maven_check_versions.cveutils import Vulnerability
+from maven_check_versions.cveutils import Vulnerability, VulnerabilityStore
+from maven_check_versions.pomutils import PomDependency, PomIndex
 
 process_dependency_lock = threading.Lock()
 
@@ -36,23 +42,84 @@ def process_main(arguments: Arguments) -> None:
     if not _config.get_config_value(config, arguments, 'warnings', 'urllib3'):
         urllib3.disable_warnings()
 
+    _xmlutils.select_parser(_config.get_config_value(config, arguments, 'xml_parser', default='auto'))
+
     cache_disabled = _config.get_config_value(config, arguments, 'cache_off', default=False)
-    cache_data = _cache.load_cache(config, arguments) if not cache_disabled else None
+    cache_data = _cache.load_cache_async(config, arguments) if not cache_disabled else None
+    cve_store = None
+    if _config.get_config_value(config, arguments, 'oss_index', 'vulnerability', default=False):
+        cve_store = _cveutils.VulnerabilityStore(
+            config, arguments, _cache.load_cache_async(config, arguments, 'vulnerability'))
+    pom_cache = None
+    if not cache_disabled and _config.get_config_value(config, arguments, 'pom_cache', default=False):
+        pom_cache = _cache.load_cache(config, arguments, 'pom')
+
+    checkpoint = _checkpoint.open_checkpoint(config, arguments)
+
+    with checkpoint or nullcontext(), _cache.CacheFlusher(config, arguments, cache_data), \
+            _cache.CacheFlusher(config, arguments, pom_cache, 'pom'), \
+            _cache.CacheFlusher(config, arguments, cve_store.cache_data if cve_store else None, 'vulnerability'):
+        if pom_file := arguments.get('pom_file'):
+            process_pom(
+                cache_data, config, arguments, pom_file,
+                pom_cache=pom_cache, cve_store=cve_store, checkpoint=checkpoint)
+        elif artifact_to_find := arguments.get('find_artifact'):
+            process_artifact(cache_data, config, arguments, artifact_to_find)
+        elif scan_dir := arguments.get('scan_dir'):
+            process_scan_dir(cache_data, config, arguments, scan_dir, pom_cache, cve_store, checkpoint)
+        else:
+            for _, pom in _config.config_items(config, 'pom_files'):
+                process_pom(
+                    cache_data, config, arguments, pom,
+                    pom_cache=pom_cache, cve_store=cve_store, checkpoint=checkpoint)
+        _cveutils.wait_for_refresh()
 
-    if pom_file := arguments.get('pom_file'):
-        process_pom(cache_data, config, arguments, pom_file)
-    elif artifact_to_find := arguments.get('find_artifact'):
-        process_artifact(cache_data, config, arguments, artifact_to_find)
-    else:
-        for _, pom in _config.config_items(config, 'pom_files'):
-            process_pom(cache_data, config, arguments, pom)
 
-    _cache.save_cache(config, arguments, cache_data)
+def process_scan_dir(
+        cache_data: Optional[dict], config: Config, arguments: Arguments,
+        directory: str, pom_cache: Optional[dict] = None, cve_store: Optional[VulnerabilityStore] = None,
+        checkpoint: Optional[Checkpoint] = None
+) -> None:
+    """
+    Processes all POM files found under a directory tree. Each POM file is processed as soon as
+    the scan finds it; modules are not followed because the scan finds their POM files as well.
+
+    Args:
+        cache_data (Optional[dict]): Cache data.
+        config (Config): Parsed YAML as dict.
+        arguments (Arguments): Command-line arguments.
+        directory (str): Root directory of the scan.
+        pom_cache (Optional[dict], optional): Parsed POM cache data, or None if disabled.
+        cve_store (Optional[VulnerabilityStore], optional): Vulnerability store shared by the run,
+            or None to load the vulnerability cache for each POM file.
+        checkpoint (Optional[Checkpoint], optional): Checkpoint of finished items, or None if 'resume' is disabled.
+    """
+    ignore_patterns = _config.get_config_value(
+        config, arguments, 'scan_ignore', default=['target', 'node_modules', '.git'])
+    max_threads = _config.get_config_value(config, arguments, 'max_threads')
+    arguments = Arguments({**arguments, 'process_modules': False})
+    pom_files = _utils.scan_pom_files(directory, ignore_patterns, max_threads)
+
+    if _config.get_config_value(config, arguments, 'threading', default=True):
+        with ThreadPoolExecutor(max_workers=max_threads) as executor:
+            for future in as_completed([
+                executor.submit(
+                    process_pom, cache_data, config, arguments, pom_path, None, pom_cache, cve_store, checkpoint)
+                for pom_path in pom_files
+            ]):
+                try:
+                    future.result()
+                except Exception as e:  # pragma: no cover
+                    logging.error(f"Error processing POM file: {e}")
+    else:
+        for pom_path in pom_files:
+            process_pom(cache_data, config, arguments, pom_path, None, pom_cache, cve_store, checkpoint)
 
 
 def process_pom(
         cache_data: Optional[dict], config: Config, arguments: Arguments,
-        pom_path: str, prefix: Optional[str] = None
+        pom_path: str, prefix: Optional[str] = None, pom_cache: Optional[dict] = None,
+        cve_store: Optional[VulnerabilityStore] = None, checkpoint: Optional[Checkpoint] = None
 ) -> None:
     """
     Processes a single POM file by extracting dependencies, checking versions,
@@ -64,21 +131,35 @@ def process_pom(
         arguments (Arguments): Command-line arguments.
         pom_path (str): Local path or URL to the POM file to process.
         prefix (str, optional): Prefix to prepend to the artifact name in logs (default is None).
+        pom_cache (Optional[dict], optional): Parsed POM cache data, or None if disabled.
+        cve_store (Optional[VulnerabilityStore], optional): Vulnerability store shared by the run,
+            or None to load the vulnerability cache.
+        checkpoint (Optional[Checkpoint], optional): Checkpoint of finished items, or None if 'resume' is disabled.
     """
+    if checkpoint is not None and checkpoint.is_done(_checkpoint.POM, pom_path):
+        logging.info(f"Skip finished: {pom_path}")
+        return
+    if _config.get_config_value(config, arguments, 'stream_pom', default=False):
+        process_pom_stream(cache_data, config, arguments, pom_path, prefix, pom_cache, cve_store, checkpoint)
+        return
+
     verify_ssl = _config.get_config_value(config, arguments, 'verify', 'requests', default=True)
 
-    tree = _utils.get_pom_tree(pom_path, verify_ssl, config, arguments)
-    root = tree.getroot()
     ns_mapping = {'xmlns': 'http://maven.apache.org/POM/4.0.0'}  # NOSONAR
+    index = _utils.get_pom_index(pom_path, verify_ssl, config, arguments, ns_mapping, pom_cache)
 
-    artifact_name = _utils.get_artifact_name(root, ns_mapping)
+    artifact_name = index.artifact_name
     if prefix is not None:
         artifact_name = f"{prefix} / {artifact_name}"
     logging.info(f"=== Processing: {artifact_name} ===")
 
-    dependencies = _utils.collect_dependencies(root, ns_mapping, config, arguments)
+    if _config.get_config_value(config, arguments, 'effective_version', default=False):
+        index = _utils.get_effective_index(index, pom_path, config, arguments, verify_ssl, ns_mapping)
 
-    cve_data = _cveutils.get_cve_data(config, arguments, dependencies, root, ns_mapping)
+    dependencies = _utils.collect_dependencies(index, ns_mapping, config, arguments)
+    _cache.prefetch_cache(cache_data, (f"{dep.group}:{dep.artifact}" for dep in dependencies))
+
+    cve_data = _cveutils.get_cve_data(config, arguments, dependencies, index, ns_mapping, cve_store)
 
     if _config.get_config_value(config, arguments, 'threading', default=True):
         max_threads = _config.get_config_value(config, arguments, 'max_threads')
@@ -86,7 +167,8 @@ def process_pom(
         with ThreadPoolExecutor(max_workers=max_threads) as executor:
             for future in as_completed([
                 executor.submit(process_dependency,
-                                cache_data, config, arguments, dep, ns_mapping, root, verify_ssl, cve_data)
+                                cache_data, config, arguments, dep, ns_mapping, index, verify_ssl, cve_data, checkpoint,
+                                pom_path)
                 for dep in dependencies
             ]):
                 try:
@@ -95,14 +177,92 @@ def process_pom(
                     logging.error(f"Error processing dependency: {e}")
     else:
         for dep in dependencies:
-            process_dependency(cache_data, config, arguments, dep, ns_mapping, root, verify_ssl, cve_data)
+            process_dependency(
+                cache_data, config, arguments, dep, ns_mapping, index, verify_ssl, cve_data, checkpoint, pom_path)
+
+    process_modules_if_required(
+        cache_data, config, arguments, index, pom_path, ns_mapping, artifact_name, pom_cache, cve_store, checkpoint)
+    if checkpoint is not None:
+        checkpoint.mark_done(_checkpoint.POM, pom_path)
+
+
+def process_pom_stream(
+        cache_data: Optional[dict], config: Config, arguments: Arguments,
+        pom_path: str, prefix: Optional[str] = None, pom_cache: Optional[dict] = None,
+        cve_store: Optional[VulnerabilityStore] = None, checkpoint: Optional[Checkpoint] = None
+) -> None:
+    """
+    Processes a POM file in streaming mode: dependencies are checked as soon as they are parsed,
+    while the rest of the document is still being read. Dependencies whose versions depend on
+    facts that are not parsed yet, and vulnerability reports, are handled once parsing completes.
+
+    Args:
+        cache_data (Optional[dict]): Cache data.
+        config (Config): Parsed YAML as dict.
+        arguments (Arguments): Command-line arguments.
+        pom_path (str): Local path or URL to the POM file to process.
+        prefix (str, optional): Prefix to prepend to the artifact name in logs (default is None).
+        pom_cache (Optional[dict], optional): Parsed POM cache data for modules, or None if disabled.
+        cve_store (Optional[VulnerabilityStore], optional): Vulnerability store shared by the run,
+            or None to load the vulnerability cache.
+        checkpoint (Optional[Checkpoint], optional): Checkpoint of finished items, or None if 'resume' is disabled.
+    """
+    verify_ssl = _config.get_config_value(config, arguments, 'verify', 'requests', default=True)
+    ns_mapping = {'xmlns': 'http://maven.apache.org/POM/4.0.0'}  # NOSONAR
+    index = PomIndex()
+    logging.info(f"=== Processing: {prefix + ' / ' if prefix is not None else ''}{pom_path} ===")
+
+    accept = _utils.get_dependency_filter(config, arguments)
+    dependencies: list[PomDependency] = []
+    deferred: list[PomDependency] = []
+
+    threading_enabled = _config.get_config_value(config, arguments, 'threading', default=True)
+    max_threads = _config.get_config_value(config, arguments, 'max_threads')
+    with ThreadPoolExecutor(max_workers=max_threads if threading_enabled else 1) as executor:
+        futures = []
+        for dep in _utils.stream_pom_dependencies(pom_path, verify_ssl, config, arguments, ns_mapping, index):
+            if accept(dep):
+                dependencies.append(dep)
+                if _pomutils.is_resolvable(index, dep):
+                    futures.append(executor.submit(
+                        process_dependency, cache_data, config, arguments, dep, ns_mapping, index, verify_ssl,
+                        None, checkpoint, pom_path))
+                else:
+                    deferred.append(dep)
+
+        if _config.get_config_value(config, arguments, 'effective_version', default=False):
+            index = _utils.get_effective_index(index, pom_path, config, arguments, verify_ssl, ns_mapping)
+        futures.extend(
+            executor.submit(
+                process_dependency, cache_data, config, arguments, dep, ns_mapping, index, verify_ssl, None, checkpoint,
+                pom_path)
+            for dep in deferred)
+
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:  # pragma: no cover
+                logging.error(f"Error processing dependency: {e}")
+
+    if cve_data := _cveutils.get_cve_data(config, arguments, dependencies, index, ns_mapping, cve_store):
+        for dep in dependencies:
+            version, _ = _utils.get_version(config, arguments, ns_mapping, index, dep)
+            _cveutils.log_vulnerability(config, arguments, dep.group, dep.artifact, version, cve_data)
 
-    process_modules_if_required(cache_data, config, arguments, root, pom_path, ns_mapping, artifact_name)
+    artifact_name = index.artifact_name
+    if prefix is not None:
+        artifact_name = f"{prefix} / {artifact_name}"
+    process_modules_if_required(
+        cache_data, config, arguments, index, pom_path, ns_mapping, artifact_name, pom_cache, cve_store, checkpoint)
+    if checkpoint is not None:
+        checkpoint.mark_done(_checkpoint.POM, pom_path)
 
 
 def process_dependency(
-        cache_data: Optional[dict], config: Config, arguments: Arguments, dependency: ET.Element, ns_mapping: dict,
-        root: ET.Element, verify_ssl: bool, cve_data: Optional[dict[str, list[Vulnerability]]] = None
+        cache_data: Optional[dict], config: Config, arguments: Arguments, dependency: PomDependency,
+        ns_mapping: dict, root: Union[ET.Element, PomIndex], verify_ssl: bool,
+        cve_data: Optional[dict[str, list[Vulnerability]]] = None, checkpoint: Optional[Checkpoint] = None,
+        pom_path: str = ''
 ) -> None:
     """
     Processes dependency in a POM file.
@@ -111,11 +271,13 @@ def process_dependency(
         cache_data (Optional[dict]): Cache dictionary for storing dependency data, or None if disabled.
         config (Config): Configuration dictionary parsed from YAML.
         arguments (Arguments): Command-line arguments.
-        dependency (ET.Element): Dependency.
+        dependency (PomDependency): Dependency.
         ns_mapping (dict): XML namespace mapping.
-        root (ET.Element): Root element of the POM file.
+        root (Union[ET.Element, PomIndex]): Root element of the POM file, or its index.
         verify_ssl (bool): SSL verification flag.
         cve_data (dict[str, list[Vulnerability]]): CVE Data.
+        checkpoint (Optional[Checkpoint], optional): Checkpoint of finished items, or None if 'resume' is disabled.
+        pom_path (str, optional): Path or URL of the POM file, which scopes the checkpoint of the dependency.
     """
     group, artifact = _utils.get_dependency_identifiers(dependency, ns_mapping)
     if not artifact or not group:
@@ -126,6 +288,9 @@ def process_dependency(
     if skip_flag is True:
         _logutils.log_skip_if_required(config, arguments, group, artifact, version)
         return
+    coordinate = _checkpoint.coordinate_key(pom_path, f"{group}:{artifact}:{version}")
+    if checkpoint is not None and checkpoint.is_done(_checkpoint.COORDINATE, coordinate):
+        return
 
     with process_dependency_lock:
         _logutils.log_search_if_required(config, arguments, group, artifact, version)
@@ -141,6 +306,9 @@ def process_dependency(
 
         _cveutils.log_vulnerability(config, arguments, group, artifact, version, cve_data)
 
+    if checkpoint is not None:
+        checkpoint.mark_done(_checkpoint.COORDINATE, coordinate)
+
 
 def process_repositories(
         artifact: str, cache_data: Optional[dict], config: Config, group: str,
@@ -171,8 +339,9 @@ def process_repositories(
 
 
 def process_modules_if_required(
-        cache_data: Optional[dict], config: Config, arguments: Arguments, root: ET.Element,
-        pom_path: str, ns_mapping: dict, prefix: Optional[str] = None
+        cache_data: Optional[dict], config: Config, arguments: Arguments, root: Union[ET.Element, PomIndex],
+        pom_path: str, ns_mapping: dict, prefix: Optional[str] = None, pom_cache: Optional[dict] = None,
+        cve_store: Optional[VulnerabilityStore] = None, checkpoint: Optional[Checkpoint] = None
 ) -> None:
     """
     Processes modules in a POM file if required.
@@ -181,22 +350,28 @@ def process_modules_if_required(
         cache_data (Optional[dict]): Cache data.
         config (Config): Parsed YAML as dict.
         arguments (Arguments): Command-line arguments.
-        root (ET.Element): Root element of the POM file.
+        root (Union[ET.Element, PomIndex]): Root element of the POM file, or its index.
         pom_path (str): Path to the POM file.
         ns_mapping (dict): XML namespace mapping.
         prefix (str, optional): Prefix for the artifact name.
+        pom_cache (Optional[dict], optional): Parsed POM cache data, or None if disabled.
+        cve_store (Optional[VulnerabilityStore], optional): Vulnerability store shared by the run,
+            or None to load the vulnerability cache for each module.
+        checkpoint (Optional[Checkpoint], optional): Checkpoint of finished items, or None if 'resume' is disabled.
     """
     if _config.get_config_value(config, arguments, 'process_modules', default=False):
         directory_path = os.path.dirname(pom_path)
-        modules = root.findall('.//xmlns:modules/xmlns:module', namespaces=ns_mapping)
-        module_paths = [f"{directory_path}/{module.text}/pom.xml" for module in modules]
+        modules = _pomutils.get_pom_index(root, ns_mapping).modules
+        module_paths = [f"{directory_path}/{module}/pom.xml" for module in modules]
         valid_module_paths = [p for p in module_paths if p.startswith('http') or os.path.exists(p)]
 
         if _config.get_config_value(config, arguments, 'threading', default=True):
             max_threads = _config.get_config_value(config, arguments, 'max_threads', default=8)
             with ThreadPoolExecutor(max_workers=max_threads) as executor:
                 for future in as_completed([
-                    executor.submit(process_pom, cache_data, config, arguments, module_path, prefix)
+                    executor.submit(
+                        process_pom, cache_data, config, arguments, module_path, prefix, pom_cache, cve_store,
+                        checkpoint)
                     for module_path in valid_module_paths
                 ]):
                     try:
@@ -205,7 +380,7 @@ def process_modules_if_required(
                         logging.error(f"Error processing module: {e}")
         else:
             for module_path in valid_module_paths:
-                process_pom(cache_data, config, arguments, module_path, prefix)
+                process_pom(cache_data, config, arguments, module_path, prefix, pom_cache, cve_store, checkpoint)
 
 
 def process_artifact(
@@ -261,22 +436,13 @@ def process_repository(
         auth_info = _utils.get_auth_info(arguments, config, repository_key)
 
     base_url = _config.get_config_value(config, arguments, 'base', repository_key)
-    path_suffix = _config.get_config_value(config, arguments, 'path', repository_key)
-    repository_name = _config.get_config_value(config, arguments, 'repo', repository_key)
-
-    path = f"{base_url}/{path_suffix}"
-    if repository_name is not None:
-        path = f"{path}/{repository_name}"
-    path = f"{path}/{group.replace('.', '/')}/{artifact}"
+    path = _utils.get_repository_path(config, arguments, repository_key, group, artifact)
 
     with requests.Session() as session:
         response = session.get(path + '/maven-metadata.xml', auth=auth_info, verify=verify_ssl)
 
         if response.status_code == 200:
-            tree = ET.ElementTree(ET.fromstring(response.text))
-            version_elements = tree.getroot().findall('.//version')
-            available_versions = [v.text for v in version_elements if v.text]
-            available_versions.reverse()
+            available_versions = _xmlutils.find_versions(response.text)
 
             if _utils.check_versions(
                     cache_data, config, arguments, group, artifact, version, repository_key,
@@ -322,10 +488,7 @@ def service_rest(
         response = session.get(path + '/maven-metadata.xml', auth=auth_info, verify=verify_ssl)
 
         if response.status_code == 200:
-            tree = ET.ElementTree(ET.fromstring(response.text))
-            version_elements = tree.getroot().findall('.//version')
-            available_versions = [v.text for v in version_elements if v.text]
-            available_versions.reverse()
+            available_versions = _xmlutils.find_versions(response.text)
 
             if _utils.check_versions(
                     cache_data, config, arguments, group, artifact, version, repository_key,
@@ -343,7 +506,6 @@ def service_rest(
             version_links = table.find_all('a')[1:]  # type: ignore
             path = f"{base_url}/repository/{repo}/{group.replace('.', '/')}/{artifact}"
             available_versions = [v.text for v in version_links if v.text]
-            available_versions.reverse()
 
             if _utils.check_versions(
                     cache_data, config, arguments, group, artifact, version, repository_key,
@@ -3,18 +3,36 @@
 
 import logging
 import os
+import queue
 import re
+import threading
 # noinspection PyPep8Naming
 import xml.etree.ElementTree as ET
 from argparse import ArgumentParser
-from typing import Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+from functools import lru_cache
+from typing import Callable, Iterator, Optional, Union
 
 import dateutil.parser as parser
 import maven_check_versions.cache as _cache
 import maven_check_versions.config as _config
 import maven_check_versions.logutils as _logutils
+import maven_check_versions.pomutils as _pomutils
+import maven_check_versions.versionutils as _versionutils
+import maven_check_versions.xmlutils as _xmlutils
 import requests
 from maven_check_versions.config import Config, Arguments
+from maven_check_versions.pomutils import PomDependency, PomIndex
+
+_EFFECTIVE_CACHE_SIZE = 1024
+
+# Resolved parent POMs and BOMs, and the keys being resolved: key -> (owner thread, done event)
+_effective_indexes: OrderedDict = OrderedDict()
+_effective_pending: dict[str, tuple[int, threading.Event]] = {}
+_effective_waiting: dict[int, str] = {}
+_effective_lock = threading.Lock()
 
 
 def parse_command_line() -> Arguments:
@@ -33,6 +51,8 @@ def parse_command_line() -> Arguments:
     add_search_args(argument_parser)
     add_auth_args(argument_parser)
     add_threading_args(argument_parser)
+    add_queue_args(argument_parser)
+    add_command_args(argument_parser)
     return Arguments(vars(argument_parser.parse_args()))
 
 
@@ -46,9 +66,13 @@ def add_general_args(argument_parser: ArgumentParser) -> None:
     """
     argument_parser.add_argument('-ci', '--ci_mode', help='Enable CI Mode', action='store_true', default=False)
     argument_parser.add_argument('-pf', '--pom_file', help='Path to POM File')
+    argument_parser.add_argument('-sd', '--scan_dir', help='Directory to scan for POM files')
     argument_parser.add_argument('-fa', '--find_artifact', help='Artifact to find')
     argument_parser.add_argument('-cfg', '--config_file', help='Path to Config File')
     argument_parser.add_argument('-ll', '--log_level', help='Logging level', default=None)
+    argument_parser.add_argument(
+        '-rm', '--resume', help='Skip items finished by an interrupted run', action='store_true', default=None)
+    argument_parser.add_argument('-ckf', '--checkpoint_file', help='Path to Checkpoint File', default=None)
 
 
 def add_cache_args(argument_parser: ArgumentParser) -> None:
@@ -62,6 +86,10 @@ def add_cache_args(argument_parser: ArgumentParser) -> None:
     argument_parser.add_argument('-cf', '--cache_file', help='Path to Cache File')
     argument_parser.add_argument('-ct', '--cache_time', help='Cache expiration time in seconds')
     argument_parser.add_argument('-cb', '--cache_backend', help='Cache backend')
+    argument_parser.add_argument(
+        '-pc', '--pom_cache', help='Cache parsed POM files', action='store_true', default=None)
+    argument_parser.add_argument('-fi', '--flush_interval', help='Seconds between cache flushes', default=None)
+    argument_parser.add_argument('-fe', '--flush_entries', help='Dirty entries that trigger a flush', default=None)
 
     argument_parser.add_argument('-rsh', '--redis_host', help='Redis host', default=None)
     argument_parser.add_argument('-rsp', '--redis_port', help='Redis port', default=None)
@@ -74,11 +102,23 @@ def add_cache_args(argument_parser: ArgumentParser) -> None:
     argument_parser.add_argument('-tls', '--tarantool_space', help='Tarantool space', default=None)
     argument_parser.add_argument('-tlu', '--tarantool_user', help='Tarantool user', default=None)
     argument_parser.add_argument('-tlup', '--tarantool_password', help='Tarantool password', default=None)
+    argument_parser.add_argument('-tlt', '--tarantool_ttl', help='Tarantool entry expiry in seconds', default=None)
 
     argument_parser.add_argument('-mch', '--memcached_host', help='Memcached host', default=None)
     argument_parser.add_argument('-mcp', '--memcached_port', help='Memcached port', default=None)
     argument_parser.add_argument('-mck', '--memcached_key', help='Memcached key', default=None)
 
+    argument_parser.add_argument('-sqf', '--sqlite_file', help='SQLite database file', default=None)
+    argument_parser.add_argument('-sqt', '--sqlite_table', help='SQLite table', default=None)
+    argument_parser.add_argument('-sqx', '--sqlite_ttl', help='SQLite entry expiry in seconds', default=None)
+
+    argument_parser.add_argument('-tcl', '--tiered_local', help='Local backend of the tiered cache', default=None)
+    argument_parser.add_argument('-tcr', '--tiered_remote', help='Remote backend of the tiered cache', default=None)
+    argument_parser.add_argument(
+        '-tcm', '--tiered_memory_size', help='In-process LRU size of the tiered cache', default=None)
+    argument_parser.add_argument(
+        '-cme', '--cache_max_entries', help='Maximum number of entries kept by cache compact', default=None)
+
 
 def add_logging_args(argument_parser: ArgumentParser) -> None:
     """
@@ -117,6 +157,10 @@ def add_search_args(argument_parser: ArgumentParser) -> None:
     argument_parser.add_argument(
         '-ev', '--empty_version', help='Allow empty version', action='store_true', default=None)
     argument_parser.add_argument('-si', '--show_invalid', help='Show Invalid', action='store_true', default=None)
+    argument_parser.add_argument(
+        '-stp', '--stream_pom', help='Stream POM files with iterparse', action='store_true', default=None)
+    argument_parser.add_argument(
+        '-efv', '--effective_version', help='Resolve parent POMs and BOM imports', action='store_true', default=None)
 
 
 def add_auth_args(argument_parser: ArgumentParser) -> None:
@@ -139,66 +183,179 @@ def add_threading_args(argument_parser: ArgumentParser) -> None:
     """
     argument_parser.add_argument('-th', '--threading', help='Enable threading', action='store_true', default=None)
     argument_parser.add_argument('-mt', '--max_threads', help='Maximum number of threads', type=int)
+    argument_parser.add_argument(
+        '-xp', '--xml_parser', help='XML parser backend', choices=['auto', 'lxml', 'stdlib'], default=None)
+
+
+def add_queue_args(argument_parser: ArgumentParser) -> None:
+    """
+    Adds distributed work queue arguments to the parser.
+
+    Args:
+        argument_parser (ArgumentParser): The argument parser to which arguments are added.
+    """
+    argument_parser.add_argument(
+        '-qm', '--queue_mode', help='Work queue mode', choices=['coordinator', 'worker'], default=None)
+
+
+def add_command_args(argument_parser: ArgumentParser) -> None:
+    """
+    Adds the subcommands to the parser. Without a subcommand, the dependencies are checked.
+
+    Args:
+        argument_parser (ArgumentParser): The argument parser to which subcommands are added.
+    """
+    subparsers = argument_parser.add_subparsers(dest='command')
+    cache_parser = subparsers.add_parser('cache', help='Cache maintenance')
+    cache_parser.add_argument(
+        'cache_action', help='Report statistics, purge expired entries, compact, export or import the cache',
+        choices=['stats', 'compact', 'purge', 'export', 'import'])
+    cache_parser.add_argument(
+        'cache_snapshot', help='Snapshot file for export and import', nargs='?', default=None)
+    cache_parser.add_argument(
+        '-cs', '--cache_section', action='append', choices=['base', 'vulnerability', 'pom'], default=None,
+        help='Cache section (repeatable; default: all, or base and vulnerability for export and import)')
 
 
-def get_artifact_name(root: ET.Element, ns_mapping: dict) -> str:
+def get_artifact_name(root: Union[ET.Element, PomIndex], ns_mapping: dict) -> str:
     """
     Extracts the groupId and artifactId from the POM file's root element.
 
     Args:
-        root (ET.Element): The root element of the POM file's XML tree.
+        root (Union[ET.Element, PomIndex]): The root element of the POM file's XML tree, or its index.
         ns_mapping (dict): A dictionary mapping XML namespaces for parsing.
 
     Returns:
         str: The full artifact name in the format 'groupId:artifactId'.
             If groupId is not present, returns only the artifactId.
     """
-    artifact = root.find('./xmlns:artifactId', namespaces=ns_mapping)
-    artifact_text = str(artifact.text) if artifact is not None else ''
-    group = root.find('./xmlns:groupId', namespaces=ns_mapping)
-    return (str(group.text) + ':' if group is not None else '') + artifact_text
+    return _pomutils.get_pom_index(root, ns_mapping).artifact_name
 
 
 def collect_dependencies(
-        root: ET.Element, ns_mapping: dict, config: Config, arguments: Arguments
-) -> list:
+        root: Union[ET.Element, PomIndex], ns_mapping: dict, config: Config, arguments: Arguments
+) -> list[PomDependency]:
     """
-    Collects all dependency elements from the POM file.
-    Optionally includes plugin elements if 'search_plugins' is enabled in the configuration.
+    Collects all dependency records from the POM file.
+    Optionally includes plugin records if 'search_plugins' is enabled in the configuration.
 
     Args:
-        root (ET.Element): The root element of the POM file's XML tree.
+        root (Union[ET.Element, PomIndex]): The root element of the POM file's XML tree, or its index.
         ns_mapping (dict): A dictionary mapping XML namespaces for parsing.
         config (Config): Configuration dictionary parsed from YAML.
         arguments (Arguments): Command-line arguments.
 
     Returns:
-        list[ET.Element]: A list of dependency elements (and plugin elements if specified).
+        list[PomDependency]: A list of dependency records (and plugin records if specified).
     """
-    dependencies = root.findall('.//xmlns:dependency', namespaces=ns_mapping)
-    if _config.get_config_value(config, arguments, 'search_plugins', default=False):
-        plugins = root.findall('.//xmlns:plugins/xmlns:plugin', namespaces=ns_mapping)
-        dependencies.extend(plugins)
+    index = _pomutils.get_pom_index(root, ns_mapping)
+    accept = get_dependency_filter(config, arguments)
+    return [d for d in index.dependencies + index.plugins if accept(d)]
 
+
+def get_dependency_filter(config: Config, arguments: Arguments) -> Callable[[PomDependency], bool]:
+    """
+    Creates a predicate that accepts the dependency records to check.
+    Plugin records are accepted only if 'search_plugins' is enabled,
+    and records matching 'skip_checks' are rejected.
+
+    Args:
+        config (Config): Configuration dictionary parsed from YAML.
+        arguments (Arguments): Command-line arguments.
+
+    Returns:
+        Callable[[PomDependency], bool]: The predicate.
+    """
+    search_plugins = _config.get_config_value(config, arguments, 'search_plugins', default=False)
+    combined = None
     if skip := _config.get_config_value(config, arguments, 'skip_checks', default=[]):
         logging.warning(f"Skip checking dependency versions for {skip}")
-        result: list = []
-        combined = '(' + ')|('.join(skip) + ')'
-        for dependency in dependencies:
-            (group, artifact) = get_dependency_identifiers(dependency, ns_mapping)
-            if not re.match(combined, f"{group}:{artifact}"):
-                result.append(dependency)
-        return result
+        combined = re.compile('(' + ')|('.join(skip) + ')')
+
+    def accept(dependency: PomDependency) -> bool:
+        if dependency.plugin and not search_plugins:
+            return False
+        return combined is None or not combined.match(f"{dependency.group}:{dependency.artifact}")
+
+    return accept
+
+
+def filter_versions(
+        config: Config, arguments: Arguments, repository_key: str,
+        available_versions: list[str], version: Optional[str]
+) -> list[str]:
+    """
+    Applies the 'include_qualifiers' and 'exclude_qualifiers' rules to the available versions,
+    so versions that would never be an upgrade (e.g., '-SNAPSHOT' or '-rc1') are not probed.
+    Rules from the repository section take precedence over those from the base section.
+    The current version is always kept.
+
+    Args:
+        config (Config): Configuration dictionary parsed from YAML.
+        arguments (Arguments): Command-line arguments.
+        repository_key (str): Repository section key.
+        available_versions (list[str]): List of available versions.
+        version (Optional[str]): Current version.
+
+    Returns:
+        list[str]: The versions that pass the rules, in their original order.
+    """
+    include = _get_qualifier_pattern(config, arguments, 'include_qualifiers', repository_key)
+    exclude = _get_qualifier_pattern(config, arguments, 'exclude_qualifiers', repository_key)
+    if include is None and exclude is None:
+        return available_versions
+    return [
+        item for item in available_versions
+        if item == version or (
+            (include is None or include.search(item)) and (exclude is None or not exclude.search(item)))
+    ]
 
-    return dependencies
 
+def _get_qualifier_pattern(
+        config: Config, arguments: Arguments, key: str, repository_key: str
+) -> Optional[re.Pattern]:
+    """
+    Retrieves the compiled qualifier rule from the repository section, or from the base section.
 
-def get_dependency_identifiers(dependency: ET.Element, ns_mapping: dict) -> tuple[str, str]:
+    Args:
+        config (Config): Configuration dictionary parsed from YAML.
+        arguments (Arguments): Command-line arguments.
+        key (str): 'include_qualifiers' or 'exclude_qualifiers'.
+        repository_key (str): Repository section key.
+
+    Returns:
+        Optional[re.Pattern]: The compiled rule, or None if no rule is configured.
     """
-    Extracts the groupId and artifactId from a dependency element.
+    patterns = _config.get_config_value(config, arguments, key, repository_key)
+    if patterns is None:
+        patterns = _config.get_config_value(config, arguments, key, default=[])
+    if isinstance(patterns, str):
+        patterns = [patterns]
+    return _compile_qualifier_pattern(tuple(patterns)) if patterns else None
+
+
+@lru_cache(maxsize=64)
+def _compile_qualifier_pattern(patterns: tuple[str, ...]) -> re.Pattern:
+    """
+    Compiles qualifier regular expressions into a single case-insensitive pattern.
 
     Args:
-        dependency (ET.Element): The dependency XML element from the POM file.
+        patterns (tuple[str, ...]): Regular expressions searched in version strings.
+
+    Returns:
+        re.Pattern: The combined pattern.
+    """
+    return re.compile('(' + ')|('.join(patterns) + ')', re.IGNORECASE)
+
+
+def get_dependency_identifiers(
+        dependency: Union[ET.Element, PomDependency], ns_mapping: dict
+) -> tuple[str, str]:
+    """
+    Extracts the groupId and artifactId from a dependency record or element.
+
+    Args:
+        dependency (Union[ET.Element, PomDependency]): The dependency record or XML element from the POM file.
         ns_mapping (dict): A dictionary mapping XML namespaces for parsing.
 
     Returns:
@@ -206,12 +363,9 @@ def get_dependency_identifiers(dependency: ET.Element, ns_mapping: dict) -> tupl
             - group (str): The groupId, or an empty string if not present.
             - artifact (str): The artifactId, or an empty string if not present.
     """
-    artifact = dependency.find('xmlns:artifactId', namespaces=ns_mapping)
-    group = dependency.find('xmlns:groupId', namespaces=ns_mapping)
-    return (
-        str(group.text) if group is not None else '',
-        str(artifact.text) if artifact is not None else ''
-    )
+    if not isinstance(dependency, PomDependency):
+        dependency = _pomutils.dependency_record(dependency, ns_mapping)
+    return dependency.group, dependency.artifact
 
 
 def fail_mode_if_required(
@@ -234,11 +388,7 @@ def fail_mode_if_required(
         version (Optional[str]): The current version of the artifact (e.g., '1.0.0').
     """
     if _config.get_config_value(config, arguments, 'fail_mode', default=False):
-        item_major_version = 0
-        item_minor_version = 0
-
-        if item and (item_match := re.match(r'^(\d+).(\d+).?', item)):
-            item_major_version, item_minor_version = int(item_match.group(1)), int(item_match.group(2))
+        item_major_version, item_minor_version = _versionutils.major_minor(item)
 
         if item_major_version - current_major_version > major_version_threshold or \
                 item_minor_version - current_minor_version > minor_version_threshold:
@@ -246,31 +396,26 @@ def fail_mode_if_required(
             raise AssertionError
 
 
-def resolve_version(version: str, root: ET.Element, ns_mapping: dict) -> str:
+def resolve_version(version: str, root: Union[ET.Element, PomIndex], ns_mapping: dict) -> str:
     """
     Resolves the version string by replacing placeholders with values from POM properties.
     Handles placeholders like '${property}' or '${project.version}'.
 
     Args:
         version (str): The version string, which may contain placeholders (e.g., '${version}').
-        root (ET.Element): The root element of the POM file's XML tree.
+        root (Union[ET.Element, PomIndex]): The root element of the POM file's XML tree, or its index.
         ns_mapping (dict): A dictionary mapping XML namespaces for parsing.
 
     Returns:
         str: The resolved version string if a placeholder is matched and found in properties,
             otherwise the original version string.
     """
-    if match := re.match(r'^\${([^}]+)}$', version):
-        property_xpath = f"./xmlns:properties/xmlns:{match.group(1)}"
-        property_element = root.find(property_xpath, namespaces=ns_mapping)
-        if property_element is not None:
-            version = str(property_element.text)
-    return version
+    return _pomutils.resolve_property(_pomutils.get_pom_index(root, ns_mapping), version)
 
 
 def get_version(
-        config: Config, arguments: Arguments, ns_mapping: dict, root: ET.Element,
-        dependency: ET.Element
+        config: Config, arguments: Arguments, ns_mapping: dict, root: Union[ET.Element, PomIndex],
+        dependency: Union[ET.Element, PomDependency]
 ) -> tuple[Optional[str], bool]:
     """
     Extracts version information from a dependency.
@@ -279,25 +424,29 @@ def get_version(
         config (Config): Parsed YAML as dict.
         arguments (Arguments): Command-line arguments.
         ns_mapping (dict): XML namespace mapping.
-        root (ET.Element): Root element of the POM file.
-        dependency (ET.Element): Dependency element.
+        root (Union[ET.Element, PomIndex]): Root element of the POM file, or its index.
+        dependency (Union[ET.Element, PomDependency]): Dependency record or element.
 
     Returns:
         tuple[Optional[str], bool]: Tuple of version (or None) and skip flag.
     """
-    version_text = ''
-    version = dependency.find('xmlns:version', namespaces=ns_mapping)
+    index = _pomutils.get_pom_index(root, ns_mapping)
+    if not isinstance(dependency, PomDependency):
+        dependency = index.elements.get(dependency) or _pomutils.dependency_record(dependency, ns_mapping)
 
+    version = dependency.version
+    if version is None:
+        version = _pomutils.managed_version(index, dependency)
+
+    version_text = ''
     if version is None:
         if not _config.get_config_value(config, arguments, 'empty_version', default=False):
             return None, True
     else:
-        version_text = resolve_version(str(version.text), root, ns_mapping)
+        version_text = _pomutils.resolve_property(index, version)
 
         if version_text == '${project.version}':
-            project_version = root.find('xmlns:version', namespaces=ns_mapping)
-            project_version_text = str(project_version.text) if project_version is not None else ''
-            version_text = resolve_version(project_version_text, root, ns_mapping)
+            version_text = _pomutils.resolve_property(index, index.version or '')
 
         if version_text and re.match(r'^\${([^}]+)}$', version_text):
             if not _config.get_config_value(config, arguments, 'empty_version', default=False):
@@ -325,7 +474,7 @@ def check_versions(
         path (str): Path to the dependency in the repository.
         auth_info (Optional[tuple[str, str]]): Authentication credentials.
         verify_ssl (bool): SSL verification flag.
-        available_versions (list[str]): List of available versions.
+        available_versions (list[str]): List of available versions, in any order.
         response (requests.Response): Repository response.
 
     Returns:
@@ -338,9 +487,10 @@ def check_versions(
         major_threshold = int(_config.get_config_value(config, arguments, 'fail_major', default=0))
         minor_threshold = int(_config.get_config_value(config, arguments, 'fail_minor', default=0))
 
-        if version and (version_match := re.match(r'^(\d+)\.(\d+).?', version)):
-            current_major, current_minor = int(version_match.group(1)), int(version_match.group(2))
+        current_major, current_minor = _versionutils.major_minor(version)
 
+    available_versions = _versionutils.sort_versions(
+        filter_versions(config, arguments, repository_key, available_versions, version))
     skip_current = _config.get_config_value(config, arguments, 'skip_current', default=True)
     invalid_flag = False
 
@@ -414,21 +564,154 @@ def get_pom_tree(
         ET.ElementTree: Parsed XML tree of the POM file.
     """
     if pom_path.startswith('http'):
-        auth_info: Optional[tuple[str, str]] = None
-        if _config.get_config_value(config, arguments, 'auth', 'pom_http', default=False):
-            auth_info = (
-                _config.get_config_value(config, arguments, 'user', 'pom_http'),
-                _config.get_config_value(config, arguments, 'password', 'pom_http')
-            )
+        auth_info = _get_pom_http_auth(config, arguments)
         with requests.Session() as session:
             response = session.get(pom_path, auth=auth_info, verify=verify_ssl)
             if response.status_code != 200:
                 raise FileNotFoundError(f"Failed to get_pom_tree {pom_path}: HTTP {response.status_code}")
-            return ET.ElementTree(ET.fromstring(response.text))
+            return ET.ElementTree(_xmlutils.fromstring(response.text))
     else:
         if not os.path.exists(pom_path) or not os.path.isfile(pom_path):
             raise FileNotFoundError(f"Failed to get_pom_tree {pom_path}")
-        return ET.parse(pom_path)
+        return _xmlutils.parse(pom_path)
+
+
+def get_pom_index(
+        pom_path: str, verify_ssl: bool, config: Config, arguments: Arguments,
+        ns_mapping: dict, pom_cache: Optional[dict] = None
+) -> PomIndex:
+    """
+    Loads the index of a POM file, reusing the cached index of a local file that is unchanged.
+    Local files are keyed by absolute path and validated by modification time and size.
+
+    Args:
+        pom_path (str): Path or URL to the POM file.
+        verify_ssl (bool): SSL verification flag.
+        config (Config): Parsed YAML as dict.
+        arguments (Arguments): Command-line arguments.
+        ns_mapping (dict): XML namespace mapping.
+        pom_cache (Optional[dict], optional): Parsed POM cache data, or None if disabled.
+
+    Returns:
+        PomIndex: The index of the POM file.
+    """
+    if pom_cache is None or pom_path.startswith('http') or not os.path.isfile(pom_path):
+        return _pomutils.build_pom_index(get_pom_tree(pom_path, verify_ssl, config, arguments).getroot(), ns_mapping)
+
+    key = os.path.abspath(pom_path)
+    stat = os.stat(pom_path)
+    if (data := pom_cache.get(key)) and data.get('mtime') == stat.st_mtime_ns and data.get('size') == stat.st_size:
+        try:
+            return _pomutils.index_from_dict(data['index'])
+        except (KeyError, TypeError) as e:
+            logging.error(f"Failed to restore cached POM index {key}: {e}")
+
+    index = _pomutils.build_pom_index(get_pom_tree(pom_path, verify_ssl, config, arguments).getroot(), ns_mapping)
+    pom_cache[key] = {'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'index': _pomutils.index_to_dict(index)}
+    return index
+
+
+def scan_pom_files(
+        directory: str, ignore_patterns: list[str], max_workers: Optional[int] = None
+) -> Iterator[str]:
+    """
+    Finds pom.xml files under a directory tree. Directories are scanned in parallel with os.scandir
+    and paths are yielded as soon as they are found, before the walk has finished.
+
+    Args:
+        directory (str): Root directory of the scan.
+        ignore_patterns (list[str]): fnmatch patterns of names or relative paths to skip (e.g., 'target').
+        max_workers (Optional[int], optional): Maximum number of scanning threads.
+
+    Returns:
+        Iterator[str]: Paths of the POM files found.
+    """
+    found: queue.Queue = queue.Queue()
+    done = object()
+    pending = [1]
+    lock = threading.Lock()
+
+    def _ignored(path: str, name: str) -> bool:
+        relative = os.path.relpath(path, directory).replace(os.sep, '/')
+        return any(fnmatch(name, pattern) or fnmatch(relative, pattern) for pattern in ignore_patterns)
+
+    def _scan(path: str) -> None:
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if _ignored(entry.path, entry.name):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        with lock:
+                            pending[0] += 1
+                        executor.submit(_scan, entry.path)
+                    elif entry.name == 'pom.xml' and entry.is_file():
+                        found.put(entry.path)
+        except OSError as e:
+            logging.warning(f"Failed to scan {path}: {e}")
+        finally:
+            with lock:
+                pending[0] -= 1
+                if not pending[0]:
+                    found.put(done)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        executor.submit(_scan, directory)
+        while (path := found.get()) is not done:
+            yield path
+
+
+def stream_pom_dependencies(
+        pom_path: str, verify_ssl: bool, config: Config, arguments: Arguments,
+        ns_mapping: dict, index: PomIndex
+) -> Iterator[PomDependency]:
+    """
+    Streams dependency records from a POM file without loading its whole XML tree.
+    Remote POM files are read from the HTTP response as it arrives.
+
+    Args:
+        pom_path (str): Path or URL to the POM file.
+        verify_ssl (bool): SSL verification flag.
+        config (Config): Parsed YAML as dict.
+        arguments (Arguments): Command-line arguments.
+        ns_mapping (dict): XML namespace mapping.
+        index (PomIndex): The index to fill while parsing.
+
+    Yields:
+        PomDependency: Dependency and plugin records in document order.
+    """
+    if pom_path.startswith('http'):
+        auth_info = _get_pom_http_auth(config, arguments)
+        with requests.Session() as session:
+            with session.get(pom_path, auth=auth_info, verify=verify_ssl, stream=True) as response:
+                if response.status_code != 200:
+                    raise FileNotFoundError(
+                        f"Failed to stream_pom_dependencies {pom_path}: HTTP {response.status_code}")
+                response.raw.decode_content = True
+                yield from _pomutils.iter_pom_dependencies(response.raw, ns_mapping, index)
+    else:
+        if not os.path.exists(pom_path) or not os.path.isfile(pom_path):
+            raise FileNotFoundError(f"Failed to stream_pom_dependencies {pom_path}")
+        yield from _pomutils.iter_pom_dependencies(pom_path, ns_mapping, index)
+
+
+def _get_pom_http_auth(config: Config, arguments: Arguments) -> Optional[tuple[str, str]]:
+    """
+    Retrieves authentication data for http-based POM files.
+
+    Args:
+        config (Config): Parsed YAML as dict.
+        arguments (Arguments): Command-line arguments.
+
+    Returns:
+        Optional[tuple[str, str]]: Authentication data, or None if authentication is disabled.
+    """
+    if _config.get_config_value(config, arguments, 'auth', 'pom_http', default=False):
+        return (
+            _config.get_config_value(config, arguments, 'user', 'pom_http'),
+            _config.get_config_value(config, arguments, 'password', 'pom_http')
+        )
+    return None
 
 
 def get_auth_info(arguments, config, repository_key) -> tuple[str, str]:
@@ -449,3 +732,233 @@ def get_auth_info(arguments, config, repository_key) -> tuple[str, str]:
         _config.get_config_value(config, arguments, 'user', repository_key, default=user),
         _config.get_config_value(config, arguments, 'password', repository_key, default=password)
     )
+
+
+def get_repository_path(
+        config: Config, arguments: Arguments, repository_key: str, group: str, artifact: str
+) -> str:
+    """
+    Builds the path to an artifact in a repository.
+
+    Args:
+        config (Config): Parsed YAML as dict.
+        arguments (Arguments): Command-line arguments.
+        repository_key (str): Repository section key.
+        group (str): Group ID.
+        artifact (str): Artifact ID.
+
+    Returns:
+        str: Path to the artifact directory in the repository.
+    """
+    base_url = _config.get_config_value(config, arguments, 'base', repository_key)
+    path_suffix = _config.get_config_value(config, arguments, 'path', repository_key)
+    repository_name = _config.get_config_value(config, arguments, 'repo', repository_key)
+
+    path = f"{base_url}/{path_suffix}"
+    if repository_name is not None:
+        path = f"{path}/{repository_name}"
+    return f"{path}/{group.replace('.', '/')}/{artifact}"
+
+
+def get_effective_index(
+        index: PomIndex, pom_path: str, config: Config, arguments: Arguments,
+        verify_ssl: bool, ns_mapping: dict
+) -> PomIndex:
+    """
+    Resolves the effective index of a POM file by following its parent (relativePath or remote)
+    and its imported BOMs. Parent POMs and BOMs are resolved once and shared between all POM files.
+
+    Args:
+        index (PomIndex): The index of the POM file.
+        pom_path (str): Local path or URL to the POM file.
+        config (Config): Parsed YAML as dict.
+        arguments (Arguments): Command-line arguments.
+        verify_ssl (bool): SSL verification flag.
+        ns_mapping (dict): XML namespace mapping.
+
+    Returns:
+        PomIndex: The effective index with inherited properties and managed dependencies.
+    """
+    parent = None
+    if (coordinates := index.parent) is not None:
+        relative_path = index.parent_path if index.parent_path is not None else '../pom.xml'
+        if relative_path and not pom_path.startswith('http'):
+            parent_path = os.path.join(os.path.dirname(pom_path), relative_path)
+            if os.path.isdir(parent_path):
+                parent_path = os.path.join(parent_path, 'pom.xml')
+            if os.path.isfile(parent_path):
+                parent = _get_memoized_index(
+                    os.path.abspath(parent_path), parent_path, config, arguments, verify_ssl, ns_mapping)
+                if parent is not None and parent.artifact != coordinates.artifact:
+                    parent = None
+        if parent is None:
+            parent = _get_remote_index(
+                coordinates.group, coordinates.artifact, str(coordinates.version),
+                config, arguments, verify_ssl, ns_mapping)
+
+    effective = _pomutils.effective_index(index, parent, [])
+    if not index.imports:
+        return effective
+
+    boms = []
+    for bom in index.imports:
+        bom_version = _pomutils.resolve_property(effective, str(bom.version))
+        bom_group = _pomutils.resolve_property(effective, bom.group)
+        if (bom_index := _get_remote_index(
+                bom_group, bom.artifact, bom_version, config, arguments, verify_ssl, ns_mapping)) is not None:
+            boms.append(bom_index)
+    return _pomutils.effective_index(index, parent, boms)
+
+
+def _get_remote_index(
+        group: str, artifact: str, version: str, config: Config, arguments: Arguments,
+        verify_ssl: bool, ns_mapping: dict
+) -> Optional[PomIndex]:
+    """
+    Resolves the effective index of a POM file from the first repository that has it.
+
+    Args:
+        group (str): Group ID.
+        artifact (str): Artifact ID.
+        version (str): Version.
+        config (Config): Parsed YAML as dict.
+        arguments (Arguments): Command-line arguments.
+        verify_ssl (bool): SSL verification flag.
+        ns_mapping (dict): XML namespace mapping.
+
+    Returns:
+        Optional[PomIndex]: The effective index, or None if no repository has the POM file.
+    """
+    for repository_key in _config.config_items(config, 'repositories'):
+        path = get_repository_path(config, arguments, repository_key, group, artifact)
+        url = f"{path}/{version}/{artifact}-{version}.pom"
+        if (index := _get_memoized_index(
+                f"{group}:{artifact}:{version}", url, config, arguments, verify_ssl, ns_mapping,
+                repository_key)) is not None:
+            return index
+    logging.warning(f"Failed to resolve POM: {group}:{artifact}:{version}")
+    with _effective_lock:
+        if f"{group}:{artifact}:{version}" not in _effective_indexes:
+            _memoize_index(f"{group}:{artifact}:{version}", None)
+    return None
+
+
+def _get_memoized_index(
+        key: str, pom_path: str, config: Config, arguments: Arguments, verify_ssl: bool,
+        ns_mapping: dict, repository_key: Optional[str] = None
+) -> Optional[PomIndex]:
+    """
+    Loads and resolves the effective index of a parent POM or BOM once per key.
+
+    Args:
+        key (str): Memoization key: the absolute path or 'groupId:artifactId:version'.
+        pom_path (str): Local path or URL to the POM file.
+        config (Config): Parsed YAML as dict.
+        arguments (Arguments): Command-line arguments.
+        verify_ssl (bool): SSL verification flag.
+        ns_mapping (dict): XML namespace mapping.
+        repository_key (Optional[str]): Repository section key for remote POM files.
+
+    Returns:
+        Optional[PomIndex]: The effective index, or None if it can not be loaded or is part of a cycle.
+    """
+    thread = threading.get_ident()
+    with _effective_lock:
+        if key in _effective_indexes:
+            _effective_indexes.move_to_end(key)
+            return _effective_indexes[key]
+        if (pending := _effective_pending.get(key)) is not None:
+            if _waits_for(pending[0], thread):
+                logging.warning(f"Cyclic POM inheritance: {key}")
+                return None
+            _effective_waiting[thread] = key
+        else:
+            _effective_pending[key] = (thread, threading.Event())
+
+    if pending is not None:
+        pending[1].wait()
+        with _effective_lock:
+            del _effective_waiting[thread]
+            return _effective_indexes.get(key)
+
+    index = None
+    try:
+        if repository_key is None:
+            root = get_pom_tree(pom_path, verify_ssl, config, arguments).getroot()
+        else:
+            root = _get_remote_pom_root(pom_path, config, arguments, verify_ssl, repository_key)
+        if root is not None:
+            index = _pomutils.build_pom_index(root, ns_mapping)
+            index = get_effective_index(index, pom_path, config, arguments, verify_ssl, ns_mapping)
+    except Exception as e:
+        logging.error(f"Failed to resolve POM {pom_path}: {e}")
+    finally:
+        with _effective_lock:
+            if repository_key is None or index is not None:
+                _memoize_index(key, index)
+            _effective_pending.pop(key)[1].set()
+    return index
+
+
+def _waits_for(owner: int, thread: int) -> bool:
+    """
+    Checks if waiting for a key resolved by another thread would close a cycle, that is,
+    if the owner of the key is the thread itself or (transitively) waits for a key the thread resolves.
+    Must be called with _effective_lock held.
+
+    Args:
+        owner (int): Identifier of the thread resolving the key.
+        thread (int): Identifier of the calling thread.
+
+    Returns:
+        bool: True if waiting would deadlock.
+    """
+    seen = set()
+    while owner != thread:
+        if owner in seen or (key := _effective_waiting.get(owner)) is None or key not in _effective_pending:
+            return False
+        seen.add(owner)
+        owner = _effective_pending[key][0]
+    return True
+
+
+def _memoize_index(key: str, index: Optional[PomIndex]) -> None:
+    """
+    Stores a resolved index, dropping the least recently used ones beyond the cache size.
+    Must be called with _effective_lock held.
+
+    Args:
+        key (str): Memoization key.
+        index (Optional[PomIndex]): The effective index, or None if it can not be loaded.
+    """
+    _effective_indexes[key] = index
+    _effective_indexes.move_to_end(key)
+    while len(_effective_indexes) > _EFFECTIVE_CACHE_SIZE:
+        _effective_indexes.popitem(last=False)
+
+
+def _get_remote_pom_root(
+        url: str, config: Config, arguments: Arguments, verify_ssl: bool, repository_key: str
+) -> Optional[ET.Element]:
+    """
+    Loads a POM file from a repository.
+
+    Args:
+        url (str): URL of the POM file.
+        config (Config): Parsed YAML as dict.
+        arguments (Arguments): Command-line arguments.
+        verify_ssl (bool): SSL verification flag.
+        repository_key (str): Repository section key.
+
+    Returns:
+        Optional[ET.Element]: Root element of the POM file, or None if the repository does not have it.
+    """
+    auth_info: Optional[tuple[str, str]] = None
+    if _config.get_config_value(config, arguments, 'auth', repository_key, default=False):
+        auth_info = get_auth_info(arguments, config, repository_key)
+
+    with requests.Session() as session:
+        response = session.get(url, auth=auth_info, verify=verify_ssl)
+        if response.status_code != 200:
+            return None
+        return _xmlutils.fromstring(response.text)
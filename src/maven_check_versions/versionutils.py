@@ -0,0 +1,263 @@
+#!/usr/bin/python3
+"""This file provides version comparison functions"""
+
+from functools import lru_cache, total_ordering
+from typing import Optional, Union
+
+_QUALIFIERS = ['alpha', 'beta', 'milestone', 'rc', 'snapshot', '', 'sp']
+_ALIASES = {'ga': '', 'final': '', 'release': '', 'cr': 'rc'}
+_RELEASE_INDEX = str(_QUALIFIERS.index(''))
+_PARSE_CACHE_SIZE = 8192
+
+# Items are tagged tuples: (_INT, int), (_STRING, comparable qualifier) and (_LIST, tuple of items)
+_STRING, _LIST, _INT = 0, 1, 2
+
+Item = tuple[int, Union[int, str, tuple]]
+
+
+@total_ordering
+class ComparableVersion:
+    """
+    Version parsed once with the semantics of Maven's ComparableVersion.
+    Instances are interned by parse_version, compare by their parsed items and are hashable.
+    """
+    __slots__ = ('value', 'items')
+
+    def __init__(self, value: str, items: tuple):
+        self.value = value
+        self.items = items
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ComparableVersion) and self.items == other.items
+
+    def __lt__(self, other: 'ComparableVersion') -> bool:
+        return _compare_list(self.items, other.items) < 0
+
+    def __hash__(self) -> int:
+        return hash(self.items)
+
+    def __repr__(self) -> str:
+        return f"ComparableVersion({self.value!r})"
+
+    @property
+    def major_minor(self) -> tuple[int, int]:
+        """
+        Returns the major and minor numbers of the version, 0 for missing or non-numeric parts.
+        """
+        numbers = [value if kind == _INT else 0 for kind, value in self.items[:2]]
+        return (numbers + [0, 0])[0], (numbers + [0, 0])[1]  # type: ignore
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def parse_version(version: str) -> ComparableVersion:
+    """
+    Parses a version string into its comparable form. Results are memoized.
+
+    Args:
+        version (str): The version string (e.g., '1.2.3-rc1').
+
+    Returns:
+        ComparableVersion: The parsed version.
+    """
+    return ComparableVersion(version, _parse_items(version.lower()))
+
+
+def sort_versions(versions: list[str], reverse: bool = True) -> list[str]:
+    """
+    Sorts version strings in Maven order.
+
+    Args:
+        versions (list[str]): The version strings.
+        reverse (bool, optional): Newest first if True (default), oldest first otherwise.
+
+    Returns:
+        list[str]: The sorted version strings.
+    """
+    return sorted(versions, key=parse_version, reverse=reverse)
+
+
+def major_minor(version: Optional[str]) -> tuple[int, int]:
+    """
+    Returns the major and minor numbers of a version string.
+
+    Args:
+        version (Optional[str]): The version string (e.g., '1.2.3').
+
+    Returns:
+        tuple[int, int]: The major and minor numbers, 0 for missing or non-numeric parts.
+    """
+    return parse_version(version).major_minor if version else (0, 0)
+
+
+def _parse_items(version: str) -> tuple:
+    """
+    Splits a lower-cased version string into normalized items, as ComparableVersion.parseVersion does.
+
+    Args:
+        version (str): The lower-cased version string.
+
+    Returns:
+        tuple: The top-level list of items.
+    """
+    root: list = []
+    current = root
+    stack = [root]
+    is_digit = False
+    start = 0
+
+    def _push() -> list:
+        item: list = []
+        current.append(item)
+        stack.append(item)
+        return item
+
+    for i, c in enumerate(version):
+        if c == '.' or c == '-':
+            current.append((_INT, 0) if i == start else _parse_item(is_digit, version[start:i], False))
+            start = i + 1
+            if c == '-':
+                current = _push()
+        elif c.isdigit():
+            if not is_digit and i > start:
+                current.append(_parse_item(False, version[start:i], True))
+                start = i
+                current = _push()
+            is_digit = True
+        else:
+            if is_digit and i > start:
+                current.append(_parse_item(True, version[start:i], False))
+                start = i
+                current = _push()
+            is_digit = False
+
+    if len(version) > start:
+        current.append(_parse_item(is_digit, version[start:], False))
+
+    while stack:
+        _normalize(stack.pop())
+    return _freeze(root)
+
+
+def _parse_item(is_digit: bool, text: str, followed_by_digit: bool) -> Item:
+    """
+    Creates an integer or qualifier item.
+
+    Args:
+        is_digit (bool): True if the text is numeric.
+        text (str): The item text.
+        followed_by_digit (bool): True if a digit follows the text, so 'a', 'b' and 'm' are abbreviations.
+
+    Returns:
+        Item: The tagged item.
+    """
+    if is_digit:
+        return _INT, int(text)
+    if followed_by_digit and len(text) == 1:
+        text = {'a': 'alpha', 'b': 'beta', 'm': 'milestone'}.get(text, text)
+    text = _ALIASES.get(text, text)
+    index = _QUALIFIERS.index(text) if text in _QUALIFIERS else None
+    return _STRING, str(index) if index is not None else f"{len(_QUALIFIERS)}-{text}"
+
+
+def _normalize(items: list) -> None:
+    """
+    Removes trailing null items (0, release qualifiers, empty lists) up to the last non-list item.
+
+    Args:
+        items (list): The list of items, normalized in place.
+    """
+    for i in range(len(items) - 1, -1, -1):
+        if _is_null(items[i]):
+            del items[i]
+        elif isinstance(items[i], tuple):
+            break
+
+
+def _is_null(item: Union[Item, list]) -> bool:
+    """
+    Checks if an item equals the null item.
+
+    Args:
+        item (Union[Item, list]): The item.
+
+    Returns:
+        bool: True for 0, the release qualifier and empty lists.
+    """
+    if isinstance(item, list):
+        return not item
+    return item[1] == 0 if item[0] == _INT else item[1] == _RELEASE_INDEX
+
+
+def _freeze(items: list) -> tuple:
+    """
+    Converts nested item lists to tuples so parsed versions are hashable.
+
+    Args:
+        items (list): The list of items.
+
+    Returns:
+        tuple: The frozen list of items.
+    """
+    return tuple((_LIST, _freeze(item)) if isinstance(item, list) else item for item in items)
+
+
+def _compare_item(item: Optional[Item], other: Optional[Item]) -> int:
+    """
+    Compares two items, either of which may be the null item used to pad shorter lists.
+
+    Args:
+        item (Optional[Item]): The first item.
+        other (Optional[Item]): The second item.
+
+    Returns:
+        int: A negative number, zero or a positive number.
+    """
+    if item is None:
+        return -_compare_item(other, None) if other is not None else 0
+    kind, value = item
+    if other is None:
+        if kind == _INT:
+            return 1 if value else 0
+        if kind == _STRING:
+            return _compare_str(value, _RELEASE_INDEX)  # type: ignore
+        return _compare_item(value[0], None) if value else 0  # type: ignore
+    other_kind, other_value = other
+    if kind != other_kind:
+        return kind - other_kind
+    if kind == _INT:
+        return value - other_value  # type: ignore
+    if kind == _STRING:
+        return _compare_str(value, other_value)  # type: ignore
+    return _compare_list(value, other_value)  # type: ignore
+
+
+def _compare_list(items: tuple, other: tuple) -> int:
+    """
+    Compares two lists of items, padding the shorter one with null items.
+
+    Args:
+        items (tuple): The first list of items.
+        other (tuple): The second list of items.
+
+    Returns:
+        int: A negative number, zero or a positive number.
+    """
+    for i in range(max(len(items), len(other))):
+        result = _compare_item(items[i] if i < len(items) else None, other[i] if i < len(other) else None)
+        if result:
+            return result
+    return 0
+
+
+def _compare_str(value: str, other: str) -> int:
+    """
+    Compares two comparable qualifier strings.
+
+    Args:
+        value (str): The first qualifier.
+        other (str): The second qualifier.
+
+    Returns:
+        int: -1, 0 or 1.
+    """
+    return (value > other) - (value < other)
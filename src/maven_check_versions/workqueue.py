@@ -0,0 +1,341 @@
+#!/usr/bin/python3
+"""This file provides distributed work queue functions"""
+
+import logging
+import os
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+import maven_check_versions.cache as _cache
+import maven_check_versions.config as _config
+import maven_check_versions.logutils as _logutils
+import maven_check_versions.process as _process
+import maven_check_versions.utils as _utils
+import maven_check_versions.xmlutils as _xmlutils
+import redis
+import urllib3
+from maven_check_versions.config import Config, Arguments
+
+_QUEUE_KEY = 'maven_check_versions_queue'
+_HOST = 'localhost'
+_REDIS_PORT = 6379
+
+# Appends the coordinates that are not queued yet and marks them queued in one step
+_PUSH_SCRIPT = """
+local pushed = 0
+for _, coordinate in ipairs(ARGV) do
+    if redis.call('SADD', KEYS[2], coordinate) == 1 then
+        redis.call('RPUSH', KEYS[1], coordinate)
+        pushed = pushed + 1
+    end
+end
+return pushed
+"""
+
+# Moves the next coordinate to the processing list and records its deadline in one step
+_CLAIM_SCRIPT = """
+local coordinate = redis.call('LMOVE', KEYS[1], KEYS[2], 'LEFT', 'RIGHT')
+if coordinate then
+    redis.call('HSET', KEYS[3], coordinate, ARGV[1])
+end
+return coordinate
+"""
+
+# Removes a processed coordinate from the processing list, the claims and the queued set in one step
+_ACK_SCRIPT = """
+redis.call('LREM', KEYS[1], 1, ARGV[1])
+redis.call('HDEL', KEYS[2], ARGV[1])
+redis.call('SREM', KEYS[3], ARGV[1])
+"""
+
+# Moves the claimed coordinates whose deadline has passed back to the queue in one step,
+# and gives claims without a deadline one
+_REQUEUE_SCRIPT = """
+local requeued = {}
+for _, coordinate in ipairs(redis.call('LRANGE', KEYS[2], 0, -1)) do
+    local deadline = redis.call('HGET', KEYS[3], coordinate)
+    if not deadline then
+        redis.call('HSET', KEYS[3], coordinate, ARGV[2])
+    elseif tonumber(deadline) < tonumber(ARGV[1]) and redis.call('LREM', KEYS[2], 1, coordinate) > 0 then
+        redis.call('HDEL', KEYS[3], coordinate)
+        redis.call('RPUSH', KEYS[1], coordinate)
+        table.insert(requeued, coordinate)
+    end
+end
+return requeued
+"""
+
+
+def process_queue(arguments: Arguments) -> None:
+    """
+    Runs the distributed work queue in the mode given by 'queue_mode'.
+
+    Args:
+        arguments (Arguments): Command-line arguments.
+            'queue_mode' is either 'coordinator' or 'worker'.
+    """
+    config = _config.get_config(arguments)
+
+    if not _config.get_config_value(config, arguments, 'warnings', 'urllib3'):
+        urllib3.disable_warnings()
+
+    _xmlutils.select_parser(_config.get_config_value(config, arguments, 'xml_parser', default='auto'))
+
+    if (mode := arguments.get('queue_mode')) == 'coordinator':
+        run_coordinator(config, arguments)
+    elif mode == 'worker':
+        run_worker(config, arguments)
+    else:
+        raise ValueError(f"Invalid queue mode: {mode}")
+
+
+def _queue_config(config: Config, arguments: Arguments) -> tuple:
+    """
+    Retrieves the queue parameters from the configuration.
+
+    Args:
+        config (Config): Configuration dictionary parsed from YAML.
+        arguments (Arguments): Command-line arguments.
+
+    Returns:
+        tuple: A tuple containing (host, port, key, user, password, visibility_timeout, poll_interval).
+    """
+    section = 'queue'
+    return (
+        _config.get_config_value(config, arguments, 'redis_host', section, default=_HOST),
+        _config.get_config_value(config, arguments, 'redis_port', section, default=_REDIS_PORT),
+        _config.get_config_value(config, arguments, 'redis_key', section, default=_QUEUE_KEY),
+        _config.get_config_value(config, arguments, 'redis_user', section),
+        _config.get_config_value(config, arguments, 'redis_password', section),
+        float(_config.get_config_value(config, arguments, 'visibility_timeout', section, default=300)),
+        float(_config.get_config_value(config, arguments, 'poll_interval', section, default=1))
+    )
+
+
+@contextmanager
+def _connection(host: str, port: int, user: Optional[str], password: Optional[str]):
+    """
+    Context manager for the queue Redis connection, ensuring proper cleanup.
+
+    Args:
+        host (str): Redis server host.
+        port (int): Redis server port.
+        user (Optional[str]): Redis username, if required.
+        password (Optional[str]): Redis password, if required.
+
+    Yields:
+        redis.Redis: An instance of the Redis client.
+    """
+    inst = redis.Redis(host=host, port=port, username=user, password=password, decode_responses=True)
+    try:
+        yield inst
+    finally:
+        inst.close()
+
+
+def collect_coordinates(
+        config: Config, arguments: Arguments, pom_path: str, verify_ssl: bool
+) -> list[str]:
+    """
+    Collects 'groupId:artifactId:version' coordinates from a POM file and, if required, its modules.
+
+    Args:
+        config (Config): Parsed YAML as dict.
+        arguments (Arguments): Command-line arguments.
+        pom_path (str): Local path or URL to the POM file.
+        verify_ssl (bool): SSL verification flag.
+
+    Returns:
+        list[str]: Coordinates of the dependencies that are not skipped,
+            'groupId:artifactId' for dependencies without a resolved version.
+    """
+    ns_mapping = {'xmlns': 'http://maven.apache.org/POM/4.0.0'}  # NOSONAR
+    index = _utils.get_pom_index(pom_path, verify_ssl, config, arguments, ns_mapping)
+    if _config.get_config_value(config, arguments, 'effective_version', default=False):
+        index = _utils.get_effective_index(index, pom_path, config, arguments, verify_ssl, ns_mapping)
+
+    result: list[str] = []
+    for dependency in _utils.collect_dependencies(index, ns_mapping, config, arguments):
+        version, skip_flag = _utils.get_version(config, arguments, ns_mapping, index, dependency)
+        if dependency.group and dependency.artifact and not skip_flag:
+            coordinate = f"{dependency.group}:{dependency.artifact}"
+            result.append(f"{coordinate}:{version}" if version else coordinate)
+
+    if _config.get_config_value(config, arguments, 'process_modules', default=False):
+        directory_path = os.path.dirname(pom_path)
+        for module in index.modules:
+            module_path = f"{directory_path}/{module}/pom.xml"
+            if module_path.startswith('http') or os.path.exists(module_path):
+                result.extend(collect_coordinates(config, arguments, module_path, verify_ssl))
+
+    return result
+
+
+def split_coordinate(coordinate: str) -> tuple[str, str, Optional[str]]:
+    """
+    Splits a queued coordinate into its parts.
+
+    Args:
+        coordinate (str): Coordinate in 'groupId:artifactId:version' or 'groupId:artifactId' format.
+
+    Returns:
+        tuple[str, str, Optional[str]]: Group ID, artifact ID and version, or None without a version.
+    """
+    group, artifact, *version = coordinate.split(':', maxsplit=2)
+    return group, artifact, version[0] if version else None
+
+
+def push_coordinates(inst: redis.Redis, key: str, coordinates: list[str]) -> int:
+    """
+    Pushes coordinates onto the queue, skipping those that are already queued.
+    Marking a coordinate queued and pushing it run in one Lua script,
+    so a crash cannot leave a coordinate marked queued but missing from the queue.
+
+    Args:
+        inst (redis.Redis): Redis client.
+        key (str): Queue key.
+        coordinates (list[str]): Coordinates to push.
+
+    Returns:
+        int: Number of coordinates pushed.
+    """
+    if not (coordinates := list(dict.fromkeys(coordinates))):
+        return 0
+    return int(inst.eval(_PUSH_SCRIPT, 2, key, f"{key}:queued", *coordinates))
+
+
+def claim_coordinate(inst: redis.Redis, key: str, visibility_timeout: float) -> Optional[str]:
+    """
+    Atomically moves the next coordinate to the processing list and records its visibility deadline.
+    Both steps run in one Lua script, so a crash cannot leave a claim without a deadline.
+
+    Args:
+        inst (redis.Redis): Redis client.
+        key (str): Queue key.
+        visibility_timeout (float): Seconds before an unacknowledged coordinate is retried.
+
+    Returns:
+        Optional[str]: The claimed coordinate, or None if the queue is empty.
+    """
+    return inst.eval(
+        _CLAIM_SCRIPT, 3, key, f"{key}:processing", f"{key}:claims", time.time() + visibility_timeout)
+
+
+def ack_coordinate(inst: redis.Redis, key: str, coordinate: str) -> None:
+    """
+    Removes a processed coordinate from the queue bookkeeping in one Lua script.
+
+    Args:
+        inst (redis.Redis): Redis client.
+        key (str): Queue key.
+        coordinate (str): Processed coordinate.
+    """
+    inst.eval(_ACK_SCRIPT, 3, f"{key}:processing", f"{key}:claims", f"{key}:queued", coordinate)
+
+
+def requeue_expired(inst: redis.Redis, key: str, visibility_timeout: float) -> int:
+    """
+    Returns coordinates whose visibility deadline has passed back to the queue.
+    Coordinates without a deadline (claimed by an earlier version without the claim script) get one now.
+    The check and the move run in one Lua script, so a crash cannot lose a coordinate between the lists,
+    and a worker loop makes a single request.
+
+    Args:
+        inst (redis.Redis): Redis client.
+        key (str): Queue key.
+        visibility_timeout (float): Seconds before an unacknowledged coordinate is retried.
+
+    Returns:
+        int: Number of coordinates returned to the queue.
+    """
+    now = time.time()
+    requeued = inst.eval(
+        _REQUEUE_SCRIPT, 3, key, f"{key}:processing", f"{key}:claims", now, now + visibility_timeout)
+    for coordinate in requeued:
+        logging.warning(f"Requeue expired: {coordinate}")
+    return len(requeued)
+
+
+def run_coordinator(config: Config, arguments: Arguments) -> None:
+    """
+    Collects coordinates from the configured POM files and pushes those missing from the cache onto the queue.
+
+    Args:
+        config (Config): Parsed YAML as dict.
+        arguments (Arguments): Command-line arguments.
+    """
+    verify_ssl = _config.get_config_value(config, arguments, 'verify', 'requests', default=True)
+    cache_disabled = _config.get_config_value(config, arguments, 'cache_off', default=False)
+    cache_data = _cache.load_cache(config, arguments) if not cache_disabled else None
+
+    if pom_file := arguments.get('pom_file'):
+        pom_files = [pom_file]
+    else:
+        pom_files = [pom for _, pom in _config.config_items(config, 'pom_files')]
+
+    collected = [c for pom in pom_files for c in collect_coordinates(config, arguments, pom, verify_ssl)]
+    _cache.prefetch_cache(cache_data, (':'.join(split_coordinate(c)[:2]) for c in collected))
+
+    coordinates = []
+    for coordinate in collected:
+        group, artifact, version = split_coordinate(coordinate)
+        if not _cache.process_cache_artifact(config, arguments, cache_data, artifact, group, version):
+            coordinates.append(coordinate)
+
+    host, port, key, user, password, _, _ = _queue_config(config, arguments)
+    with _connection(host, port, user, password) as inst:
+        pushed = push_coordinates(inst, key, coordinates)
+    logging.info(f"Queue {key}: pushed {pushed} coordinates")
+
+
+def run_worker(config: Config, arguments: Arguments) -> None:
+    """
+    Pops coordinates from the queue and resolves them until the queue is drained.
+    Each result is saved to the cache right away, so workers should share the redis cache backend.
+
+    Args:
+        config (Config): Parsed YAML as dict.
+        arguments (Arguments): Command-line arguments.
+    """
+    verify_ssl = _config.get_config_value(config, arguments, 'verify', 'requests', default=True)
+    if _config.get_config_value(config, arguments, 'cache_backend', default='json') not in ('redis', 'tiered'):
+        logging.warning('Queue workers should use the redis or tiered cache backend to share results')
+
+    host, port, key, user, password, visibility_timeout, poll_interval = _queue_config(config, arguments)
+    with _connection(host, port, user, password) as inst:
+        while True:
+            requeue_expired(inst, key, visibility_timeout)
+            if (coordinate := claim_coordinate(inst, key, visibility_timeout)) is None:
+                if not inst.llen(f"{key}:processing"):
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            process_coordinate(config, arguments, coordinate, verify_ssl)
+            ack_coordinate(inst, key, coordinate)
+    _cache.flush_cache()
+
+
+def process_coordinate(config: Config, arguments: Arguments, coordinate: str, verify_ssl: bool) -> None:
+    """
+    Resolves a single queued coordinate through the repositories and saves the result to the cache.
+
+    Args:
+        config (Config): Parsed YAML as dict.
+        arguments (Arguments): Command-line arguments.
+        coordinate (str): Coordinate in 'groupId:artifactId:version' or 'groupId:artifactId' format.
+        verify_ssl (bool): SSL verification flag.
+    """
+    group, artifact, version = split_coordinate(coordinate)
+    _logutils.log_search_if_required(config, arguments, group, artifact, version)
+
+    cache_data: dict = {}
+    try:
+        if not _process.process_repositories(artifact, cache_data, config, group, arguments, verify_ssl, version):
+            logging.warning(f"Not Found: {group}:{artifact}:{version}")
+    except Exception as e:
+        logging.error(f"Error processing {coordinate}: {e}")
+
+    if not _config.get_config_value(config, arguments, 'cache_off', default=False):
+        _cache.save_cache(config, arguments, cache_data)
@@ -0,0 +1,133 @@
+#!/usr/bin/python3
+"""This file provides XML parser functions"""
+
+import logging
+# noinspection PyPep8Naming
+import xml.etree.ElementTree as ET
+from typing import IO, Iterator, Optional, Union
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # pragma: no cover
+    lxml_etree = None
+
+_VERSIONS_XPATH = lxml_etree.XPath('//version/text()', smart_strings=False) if lxml_etree is not None else None
+
+# Documents fetched from repositories are untrusted: lxml must not expand entities or load anything over the network
+_LXML_OPTIONS = {'resolve_entities': False, 'no_network': True}
+_LXML_PARSER = lxml_etree.XMLParser(**_LXML_OPTIONS) if lxml_etree is not None else None
+_LXML_UTF8_PARSER = lxml_etree.XMLParser(encoding='utf-8', **_LXML_OPTIONS) if lxml_etree is not None else None
+
+_parser = 'auto' if lxml_etree is not None else 'stdlib'
+
+
+def select_parser(name: Optional[str]) -> str:
+    """
+    Selects the XML parser backend.
+    With 'auto' lxml parses only 'maven-metadata.xml', where the compiled XPath query wins;
+    POM trees are walked element by element in Python, which is faster over xml.etree elements.
+
+    Args:
+        name (Optional[str]): 'auto', 'lxml' or 'stdlib' (None means 'auto').
+            'auto' and 'lxml' fall back to the standard library when lxml is not installed.
+
+    Returns:
+        str: The name of the selected backend.
+    """
+    global _parser
+    if name == 'lxml' and lxml_etree is None:
+        logging.warning('lxml is not installed, falling back to xml.etree')
+    if lxml_etree is None or name == 'stdlib':
+        _parser = 'stdlib'
+    else:
+        _parser = 'lxml' if name == 'lxml' else 'auto'
+    return _parser
+
+
+def get_parser() -> str:
+    """
+    Returns the name of the selected XML parser backend.
+
+    Returns:
+        str: 'auto', 'lxml' or 'stdlib'.
+    """
+    return _parser
+
+
+def fromstring(text: Union[str, bytes]) -> ET.Element:
+    """
+    Parses a POM document from a string.
+
+    Args:
+        text (Union[str, bytes]): The XML document.
+
+    Returns:
+        ET.Element: The root element of the document.
+    """
+    if _parser == 'lxml':
+        return _lxml_fromstring(text)
+    return ET.fromstring(text)
+
+
+def parse(path: str) -> ET.ElementTree:
+    """
+    Parses a POM file.
+
+    Args:
+        path (str): Path to the XML file.
+
+    Returns:
+        ET.ElementTree: The parsed XML tree.
+    """
+    with open(path, 'rb') as f:
+        if _parser == 'lxml':
+            return ET.ElementTree(lxml_etree.parse(f, _LXML_PARSER).getroot())
+        return ET.parse(f)
+
+
+def iterparse(source: Union[str, IO[bytes]], events: tuple) -> Iterator[tuple[str, ET.Element]]:
+    """
+    Parses a POM document incrementally.
+
+    Args:
+        source (Union[str, IO[bytes]]): Path to the XML file or a binary stream of it.
+        events (tuple): Events to report, e.g. ('start', 'end').
+
+    Returns:
+        Iterator[tuple[str, ET.Element]]: Pairs of event and element.
+    """
+    if _parser == 'lxml':
+        return lxml_etree.iterparse(source, events=events, remove_comments=True, **_LXML_OPTIONS)
+    return ET.iterparse(source, events=events)
+
+
+def find_versions(text: Union[str, bytes]) -> list[str]:
+    """
+    Finds the texts of all version elements below the root element of 'maven-metadata.xml'.
+
+    Args:
+        text (Union[str, bytes]): The XML document.
+
+    Returns:
+        list[str]: Non-empty version texts in document order.
+    """
+    if _parser != 'stdlib':
+        return [v for v in _VERSIONS_XPATH(_lxml_fromstring(text)) if v]
+    root = ET.fromstring(text)
+    return [v.text for v in root.iter('version') if v.text and v is not root]
+
+
+def _lxml_fromstring(text: Union[str, bytes]):
+    """
+    Parses an XML document with lxml, which rejects str input that carries an encoding declaration.
+    Entities are not expanded and no network access is allowed.
+
+    Args:
+        text (Union[str, bytes]): The XML document.
+
+    Returns:
+        lxml.etree._Element: The root element of the document.
+    """
+    if isinstance(text, str):
+        return lxml_etree.fromstring(text.encode(), _LXML_UTF8_PARSER)
+    return lxml_etree.fromstring(text, _LXML_PARSER)
@@ -1,9 +1,12 @@
 #!/usr/bin/python3
 """Tests for package cache functions"""
 
+import json
 import os
 import sys
+import threading
 import time
+from dataclasses import asdict
 from json import JSONDecodeError
 
 import pytest
@@ -14,10 +17,13 @@ os.chdir(os.path.dirname(__file__))
 sys.path.append('../src')
 
 from maven_check_versions.config import Config, Arguments
+import maven_check_versions.cache as _cache
 from maven_check_versions.cache import (
     load_cache, save_cache, update_cache_artifact,
-    process_cache_artifact, DCJSONEncoder
+    process_cache_artifact, DCJSONEncoder, CacheData, get_changes, flush_cache, _TieredCacheBackend,
+    scan_cache, delete_cache_keys, load_cache_async, CacheFlusher, mark_saved, _BINARY_HEADER, _BINARY_MAGIC
 )
+from maven_check_versions.cveutils import Vulnerability
 
 
 # noinspection PyShadowingNames
@@ -33,32 +39,73 @@ def test_load_cache(mocker):
     assert load_cache(Config(), Arguments()) == {}
 
     mock_redis = mocker.patch('redis.Redis')
-    mock_redis.return_value.hgetall.return_value = {'key': '{"k":"v"}'}
-    assert load_cache(Config({'base': {'cache_backend': 'redis'}}), Arguments()) == {'key': {'k': 'v'}}
+    mock_pipeline = mock_redis.return_value.pipeline.return_value
+    mock_pipeline.execute.return_value = [['{"k":"v"}', None]]
+    cache_data = load_cache(Config({'base': {'cache_backend': 'redis'}}), Arguments())
+    assert cache_data == {}
+    cache_data.prefetch(['key', 'missing'])
+    assert cache_data == {'key': {'k': 'v'}}
+    mock_pipeline.hmget.assert_called_once_with('cache_maven_check_versions_artifacts', ['key', 'missing'])
+    assert cache_data.get('missing') is None
+    assert mock_pipeline.execute.call_count == 1
 
     mock_loads = mocker.patch('json.loads')
     mock_loads.side_effect = JSONDecodeError('error', 'error', 0)
-    assert load_cache(Config({'base': {'cache_backend': 'redis'}}), Arguments()) == {}
+    assert load_cache(Config({'base': {'cache_backend': 'redis'}}), Arguments()).get('key') is None
     mocker.stop(mock_loads)
 
     mock_redis.side_effect = Exception
-    assert load_cache(Config({'base': {'cache_backend': 'redis'}}), Arguments()) == {}
+    assert load_cache(Config({'base': {'cache_backend': 'redis'}}), Arguments()).get('key') is None
 
     mock_tarantool = mocker.patch('tarantool.Connection')
-    mock_tarantool.return_value.select.return_value = [('key', '{"k":"v"}')]
-    assert load_cache(Config({'base': {'cache_backend': 'tarantool'}}), Arguments()) == {'key': {'k': 'v'}}
+    mock_tarantool.return_value.call.return_value.data = [[['key', '{"k":"v"}']]]
+    config = Config({'base': {'cache_backend': 'tarantool', 'tarantool_ttl': 60}})
+    cache_data = load_cache(config, Arguments())
+    cache_data.prefetch(['key', 'missing'])
+    assert cache_data == {'key': {'k': 'v'}}
+    assert mock_tarantool.return_value.call.call_args.args[0] == 'maven_check_versions_fetch'
+    space, keys, expire_before = mock_tarantool.return_value.call.call_args.args[1]
+    assert (space, keys) == ('cache_maven_check_versions_artifacts', ['key', 'missing'])
+    assert time.time() - 70 < expire_before <= time.time() - 60
 
     mock_loads = mocker.patch('json.loads')
     mock_loads.side_effect = JSONDecodeError('error', 'error', 0)
-    assert load_cache(Config({'base': {'cache_backend': 'tarantool'}}), Arguments()) == {}
+    assert load_cache(Config({'base': {'cache_backend': 'tarantool'}}), Arguments()).get('key') is None
     mocker.stop(mock_loads)
 
     mock_tarantool.side_effect = Exception
-    assert load_cache(Config({'base': {'cache_backend': 'tarantool'}}), Arguments()) == {}
+    assert load_cache(Config({'base': {'cache_backend': 'tarantool'}}), Arguments()).get('key') is None
 
     mock_memcache = mocker.patch('pymemcache.client.base.Client')
     mock_memcache.return_value.get.return_value = '{"k":"v"}'
-    assert load_cache(Config({'base': {'cache_backend': 'memcached'}}), Arguments()) == {'k': 'v'}
+    mock_memcache.return_value.set_many.return_value = []
+    mock_memcache.return_value.get_many.return_value = {}
+    mock_memcache.return_value.gets.return_value = (None, None)
+    cache_data = load_cache_async(Config({'base': {'cache_backend': 'memcached'}}), Arguments())
+    assert cache_data.get('k') == 'v'
+    assert not cache_data.dirty
+    mock_memcache.return_value.set_many.assert_called_once_with(
+        {'cache_maven_check_versions_artifacts:k': '"v"'}, expire=600)
+    manifest = json.loads(mock_memcache.return_value.set.call_args.args[1])
+    assert mock_memcache.return_value.set.call_args.args[0] == 'cache_maven_check_versions_artifacts'
+    assert manifest['format'] == 2
+
+    mock_memcache.return_value.set.reset_mock()
+    mock_memcache.return_value.set_many.return_value = ['cache_maven_check_versions_artifacts:k']
+    cache_data = load_cache(Config({'base': {'cache_backend': 'memcached'}}), Arguments())
+    assert cache_data == {'k': 'v'}
+    assert cache_data.dirty == {'k'}
+    mock_memcache.return_value.set.assert_not_called()
+
+    mock_memcache.return_value.get.return_value = '{"format": 2}'
+    mock_memcache.return_value.get_many.return_value = {'cache_maven_check_versions_artifacts:key': b'{"k":"v"}'}
+    cache_data = load_cache(Config({'base': {'cache_backend': 'memcached'}}), Arguments())
+    assert cache_data == {}
+    cache_data.prefetch(['key', 'x' * 300])
+    assert cache_data == {'key': {'k': 'v'}}
+    item_keys = mock_memcache.return_value.get_many.call_args.args[0]
+    assert item_keys[0] == 'cache_maven_check_versions_artifacts:key'
+    assert item_keys[1].startswith('cache_maven_check_versions_artifacts:sha1:') and len(item_keys[1]) < 250
 
     mock_loads = mocker.patch('json.loads')
     mock_loads.side_effect = JSONDecodeError('error', 'error', 0)
@@ -71,15 +118,19 @@ def test_load_cache(mocker):
 
 
 # noinspection PyShadowingNames
-def test_save_cache(mocker):
-    mock_open = mocker.patch('builtins.open')
-    mock_json = mocker.patch('json.dumps')
-    save_cache(Config(), Arguments(), {'k': 'v'})
-    mock_open.assert_called_once_with('cache_maven_check_versions_artifacts.json', 'w', encoding='utf-8')
+def test_save_cache(mocker, tmp_path):
+    cache_file = tmp_path / 'cache.json'
+    config = Config({'base': {'cache_file': str(cache_file)}})
+    mock_json = mocker.patch('json.dumps', return_value='{"k": "v"}')
+    save_cache(config, Arguments(), {'k': 'v'})
     mock_json.assert_called_once_with({'k': 'v'}, cls=DCJSONEncoder, indent=2)
+    assert cache_file.read_text() == '{"k": "v"}'
 
     mock_json.side_effect = Exception
-    save_cache(Config(), Arguments(), {'k': 'v'})
+    save_cache(config, Arguments(), {'k': 'x'})
+    mocker.stop(mock_json)
+    assert cache_file.read_text() == '{"k": "v"}'
+    assert sorted(os.listdir(tmp_path)) == ['cache.json', 'cache.json.lock']
 
     mock_redis = mocker.patch('redis.Redis')
     save_cache(Config({'base': {'cache_backend': 'redis'}}), Arguments(), {'k': 'v'})
@@ -89,18 +140,371 @@ def test_save_cache(mocker):
 
     mock_tarantool = mocker.patch('tarantool.Connection')
     save_cache(Config({'base': {'cache_backend': 'tarantool'}}), Arguments(), {'k': 'v'})
+    assert mock_tarantool.return_value.call.call_args.args[0] == 'maven_check_versions_save'
+    space, tuples, deleted = mock_tarantool.return_value.call.call_args.args[1]
+    assert (space, [t[:2] for t in tuples], deleted) == ('cache_maven_check_versions_artifacts', [('k', '"v"')], [])
 
     mock_tarantool.side_effect = Exception
     save_cache(Config({'base': {'cache_backend': 'tarantool'}}), Arguments(), {'k': 'v'})
 
     mock_memcache = mocker.patch('pymemcache.client.base.Client')
+    mock_memcache.return_value.gets.return_value = (None, None)
     save_cache(Config({'base': {'cache_backend': 'memcached'}}), Arguments(), {'k': 'v'})
+    mock_memcache.return_value.set_many.assert_called_once_with(
+        {'cache_maven_check_versions_artifacts:k': '"v"'}, expire=600)
+    mock_memcache.return_value.add.assert_called_once_with(
+        'cache_maven_check_versions_artifacts#keys', '["k"]', noreply=False)
+    for section in ('vulnerability', 'pom'):
+        save_cache(Config({section: {'cache_backend': 'memcached'}}), Arguments(), {'k': 'v'}, section)
+        assert mock_memcache.return_value.set_many.call_args.kwargs['expire'] == 0
+    save_cache(Config({'pom': {'cache_backend': 'memcached', 'cache_time': 60}}), Arguments(), {'k': 'v'}, 'pom')
+    assert mock_memcache.return_value.set_many.call_args.kwargs['expire'] == 60
 
     mock_memcache.side_effect = Exception
     save_cache(Config({'base': {'cache_backend': 'memcached'}}), Arguments(), {'k': 'v'})
     mocker.stopall()
 
 
+def test_cache_data():
+    cache_data = CacheData({'a': 1, 'b': 2, 'c': 3})
+    assert get_changes(cache_data) == ({}, set())
+    cache_data['a'] = 10
+    cache_data.setdefault('d', 4)
+    cache_data.update(e=5)
+    del cache_data['b']
+    cache_data.pop('c')
+    assert get_changes(cache_data) == ({'a': 10, 'd': 4, 'e': 5}, {'b', 'c'})
+
+    cache_data['b'] = 20
+    cache_data.mark_clean(['a', 'c'])
+    assert get_changes(cache_data) == ({'b': 20, 'd': 4, 'e': 5}, set())
+    cache_data.mark_clean()
+    assert get_changes(cache_data) == ({}, set())
+    assert get_changes({'k': 'v'}) == ({'k': 'v'}, set())
+
+
+# noinspection PyShadowingNames
+def test_save_cache_changes(mocker):
+    config = Config({'base': {'cache_backend': 'redis'}})
+    mock_redis = mocker.patch('redis.Redis')
+    cache_data = CacheData({'a': 1, 'b': 2, 'c': 3})
+    save_cache(config, Arguments(), cache_data)
+    mock_redis.assert_not_called()
+
+    cache_data['a'] = 10
+    del cache_data['b']
+    save_cache(config, Arguments(), cache_data)
+    mock_pipeline = mock_redis.return_value.pipeline.return_value
+    mock_pipeline.hset.assert_called_once_with('cache_maven_check_versions_artifacts', mapping={'a': '10'})
+    mock_pipeline.hdel.assert_called_once_with('cache_maven_check_versions_artifacts', 'b')
+    mock_pipeline.execute.assert_called_once()
+    assert get_changes(cache_data) == ({}, set())
+
+    mock_open = mocker.patch('builtins.open')
+    save_cache(Config(), Arguments(), cache_data)
+    mock_open.assert_not_called()
+    mocker.stopall()
+
+
+def test_json_cache_merge(tmp_path):
+    config = Config({'base': {'cache_file': str(tmp_path / 'cache.json')}})
+    save_cache(config, Arguments(), {'a': [1, '1.0'], 'b': [1, '1.0'], 'p': {'mtime': 5}})
+    first, second = load_cache(config, Arguments()), load_cache(config, Arguments())
+    first['a'] = [3, '3.0']
+    first['c'] = [1, '1.0']
+    second['a'] = [2, '2.0']
+    second['p'] = {'mtime': 4}
+    del second['b']
+    save_cache(config, Arguments(), first)
+    save_cache(config, Arguments(), second)
+    assert load_cache(config, Arguments()) == {'a': [3, '3.0'], 'c': [1, '1.0'], 'p': {'mtime': 5}}
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='POSIX permissions')
+def test_json_cache_file(tmp_path):
+    cache_file = tmp_path / 'cache.json'
+    config = Config({'base': {'cache_file': str(cache_file)}})
+    save_cache(config, Arguments(), {'a': [1, '1.0']})
+    assert cache_file.stat().st_mode & 0o777 == 0o666 & ~_cache._UMASK
+    cache_file.chmod(0o664)
+    save_cache(config, Arguments(), {'b': [1, '1.0']})
+    assert cache_file.stat().st_mode & 0o777 == 0o664
+
+    cache_file.write_bytes(b'\xff\xfe')
+    assert load_cache(config, Arguments()) == {}
+
+
+# noinspection PyShadowingNames
+def test_load_cache_async(mocker, tmp_path):
+    config = Config({'base': {'cache_file': str(tmp_path / 'cache.json')}})
+    save_cache(config, Arguments(), {'a': [1, '1.0'], 'b': [2, '2.0']})
+    cache_data = load_cache_async(config, Arguments())
+    assert cache_data.get('a') == [1, '1.0']
+    assert 'c' not in cache_data
+    cache_data['c'] = [3, '3.0']
+    assert get_changes(cache_data) == ({'c': [3, '3.0']}, set())
+    save_cache(config, Arguments(), cache_data)
+    assert load_cache(config, Arguments()) == {'a': [1, '1.0'], 'b': [2, '2.0'], 'c': [3, '3.0']}
+
+    mocker.patch('maven_check_versions.cache.load_cache', side_effect=Exception)
+    mock_logging = mocker.patch('logging.error')
+    assert load_cache_async(config, Arguments()).get('a') is None
+    mock_logging.assert_called_once()
+    mocker.stopall()
+
+
+def test_cache_flusher(tmp_path):
+    config = Config({'base': {'cache_file': str(tmp_path / 'cache.json'), 'flush_interval': 0, 'flush_entries': 2}})
+    cache_data = load_cache(config, Arguments())
+    with CacheFlusher(config, Arguments(), cache_data):
+        cache_data['a'] = [1, '1.0']
+        cache_data['b'] = [2, '2.0']
+        deadline = time.time() + 5
+        while cache_data.dirty and time.time() < deadline:
+            time.sleep(0.05)
+        assert load_cache(config, Arguments()) == {'a': [1, '1.0'], 'b': [2, '2.0']}
+        cache_data['c'] = [3, '3.0']
+    assert load_cache(config, Arguments())['c'] == [3, '3.0']
+
+    with pytest.raises(KeyboardInterrupt):
+        with CacheFlusher(config, Arguments(), cache_data):
+            cache_data['d'] = [4, '4.0']
+            raise KeyboardInterrupt
+    assert load_cache(config, Arguments())['d'] == [4, '4.0']
+
+    with CacheFlusher(config, Arguments(), None):
+        pass
+
+
+def test_mark_saved():
+    cache_data = CacheData()
+    cache_data['a'] = [1, '1.0']
+    cache_data['b'] = [1, '1.0']
+    changed, deleted = get_changes(cache_data)
+    cache_data['a'] = [2, '2.0']
+    mark_saved(cache_data, changed, deleted)
+    assert get_changes(cache_data) == ({'a': [2, '2.0']}, set())
+
+
+def test_sqlite_cache(tmp_path):
+    config = Config({'base': {'cache_backend': 'sqlite', 'sqlite_file': str(tmp_path / 'cache.sqlite3')}})
+    cache_data = load_cache(config, Arguments())
+    assert cache_data.get('key') is None
+    cache_data['key'] = (1, '1.0')
+    cache_data['other'] = (1, '2.0')
+    save_cache(config, Arguments(), cache_data)
+
+    cache_data = load_cache(config, Arguments())
+    cache_data.prefetch(['key', 'other', 'missing'])
+    assert cache_data == {'key': [1, '1.0'], 'other': [1, '2.0']}
+    del cache_data['other']
+    save_cache(config, Arguments(), cache_data)
+    assert 'other' not in load_cache(config, Arguments())
+
+    config['base']['sqlite_ttl'] = 60
+    assert load_cache(config, Arguments()).get('key') == [1, '1.0']
+    config['vulnerability'] = {'cache_backend': 'sqlite', 'sqlite_file': config['base']['sqlite_file']}
+    assert load_cache(config, Arguments(), 'vulnerability').get('key') is None
+
+
+def test_binary_cache(tmp_path):
+    cache_file = tmp_path / 'cache.bin'
+    config = Config({'base': {'cache_backend': 'binary', 'cache_file': str(cache_file)}})
+    cache_data = load_cache(config, Arguments())
+    assert cache_data.get('key') is None
+    cache_data.update({f"group:artifact{i}": (i, f"1.{i}", 'repo', None, ['1.0']) for i in range(100)})
+    cache_data['vulnerable'] = [Vulnerability(id='id', cvssScore=5.0)]
+    save_cache(config, Arguments(), cache_data)
+
+    cache_data = load_cache(config, Arguments())
+    cache_data.prefetch(['group:artifact7', 'vulnerable', 'missing'])
+    assert cache_data == {
+        'group:artifact7': [7, '1.7', 'repo', None, ['1.0']],
+        'vulnerable': [asdict(Vulnerability(id='id', cvssScore=5.0))]
+    }
+    del cache_data['group:artifact7']
+    cache_data['group:artifact8'] = (8, '2.0', 'repo', None, ['2.0'])
+    save_cache(config, Arguments(), cache_data)
+
+    cache_data = load_cache(config, Arguments())
+    assert 'group:artifact7' not in cache_data
+    assert cache_data['group:artifact8'][1] == '2.0'
+    assert cache_data['group:artifact99'][1] == '1.99'
+
+    assert cache_file.read_bytes()[_BINARY_HEADER.size:].count(b'"1.99"') == 1
+
+    cache_file.write_bytes(_BINARY_HEADER.pack(_BINARY_MAGIC, 1, 0))
+    assert load_cache(config, Arguments()).get('group:artifact8') is None
+    save_cache(config, Arguments(), {'key': 'value'})
+    assert load_cache(config, Arguments())['key'] == 'value'
+
+    cache_file.write_bytes(b'garbage-garbage')
+    assert load_cache(config, Arguments()).get('group:artifact8') is None
+
+
+def test_tiered_cache(tmp_path):
+    base = {'sqlite_file': str(tmp_path / 'local.sqlite3'), 'cache_file': str(tmp_path / 'remote.bin')}
+    config = Config({'base': {**base, 'cache_backend': 'tiered', 'tiered_remote': 'binary'}})
+    local = Config({'base': {**base, 'cache_backend': 'sqlite'}})
+    remote = Config({'base': {**base, 'cache_backend': 'binary'}})
+    _TieredCacheBackend._memory.clear()
+
+    save_cache(remote, Arguments(), {'remote': [1, '1.0']})
+    cache_data = load_cache(config, Arguments())
+    assert cache_data.get('remote') == [1, '1.0']
+    assert cache_data.get('missing') is None
+    cache_data['new'] = [2, '2.0']
+    save_cache(config, Arguments(), cache_data)
+    flush_cache()
+    assert load_cache(local, Arguments()).get('remote') == [1, '1.0']
+    assert load_cache(local, Arguments()).get('new') == [2, '2.0']
+    assert load_cache(remote, Arguments()).get('new') == [2, '2.0']
+
+    os.remove(base['sqlite_file'])
+    os.remove(base['cache_file'])
+    assert load_cache(config, Arguments()).get('new') == [2, '2.0']
+
+    config['base']['tiered_memory_size'] = 1
+    save_cache(config, Arguments(), {'other': [3, '3.0']})
+    flush_cache()
+    os.remove(base['sqlite_file'])
+    os.remove(base['cache_file'])
+    cache_data = load_cache(config, Arguments())
+    assert cache_data.get('other') == [3, '3.0']
+    assert cache_data.get('new') is None
+    _TieredCacheBackend._memory.clear()
+
+
+# noinspection PyShadowingNames
+def test_tiered_cache_writes(mocker, tmp_path):
+    base = {'sqlite_file': str(tmp_path / 'local.sqlite3'), 'cache_file': str(tmp_path / 'remote.bin')}
+    config = Config({'base': {**base, 'cache_backend': 'tiered', 'tiered_remote': 'binary'}})
+    local = Config({'base': {**base, 'cache_backend': 'sqlite'}})
+    remote = Config({'base': {**base, 'cache_backend': 'binary'}})
+    _TieredCacheBackend._memory.clear()
+
+    save_cache(remote, Arguments(), {'a': [1, '1.0'], 'b': [2, '2.0']})
+    cache_data = load_cache(config, Arguments())
+    mock_write = mocker.spy(_TieredCacheBackend, '_write')
+    assert cache_data.get('a') == [1, '1.0']
+    assert cache_data.get('b') == [2, '2.0']
+    assert mock_write.call_count == 0
+    flush_cache()
+    assert mock_write.call_count == 1
+    assert load_cache(local, Arguments()).get('b') == [2, '2.0']
+
+    cache_data['c'] = [3, '3.0']
+    mocker.patch.object(_cache._BinaryCacheBackend, 'save', side_effect=OSError('disk full'))
+    save_cache(config, Arguments(), cache_data)
+    flush_cache()
+    assert 'c' in cache_data.dirty
+    mocker.stopall()
+    config['base']['cache_file'] = str(tmp_path)
+    mock_error = mocker.patch('logging.error')
+    save_cache(config, Arguments(), cache_data)
+    flush_cache()
+    mock_error.assert_called()
+    assert 'c' in cache_data.dirty
+    mocker.stopall()
+    config['base']['cache_file'] = base['cache_file']
+    save_cache(config, Arguments(), cache_data)
+    flush_cache()
+    assert not cache_data.dirty
+    assert load_cache(remote, Arguments()).get('c') == [3, '3.0']
+    _TieredCacheBackend._memory.clear()
+
+
+# noinspection PyShadowingNames
+def test_scan_cache(mocker, tmp_path):
+    for backend in ('json', 'sqlite', 'binary'):
+        config = Config({'base': {
+            'cache_backend': backend, 'cache_file': str(tmp_path / f"cache.{backend}"),
+            'sqlite_file': str(tmp_path / 'cache.sqlite3'), 'cache_stats_file': str(tmp_path / 'stats.json')}})
+        save_cache(config, Arguments(), {'a': [1, '1.0'], 'b': [2, '2.0']})
+        delete_cache_keys(config, Arguments(), ['b'])
+        assert [(key, value) for key, value, _ in scan_cache(config, Arguments())] == [('a', [1, '1.0'])]
+
+    mock_redis = mocker.patch('redis.Redis')
+    mock_redis.return_value.hscan_iter.return_value = [('k', '"v"')]
+    assert list(scan_cache(Config({'base': {'cache_backend': 'redis'}}), Arguments())) == [('k', 'v', 3)]
+    mock_tarantool = mocker.patch('tarantool.Connection')
+    mock_tarantool.return_value.select.return_value.data = [('k', '"v"', 1)]
+    assert list(scan_cache(Config({'base': {'cache_backend': 'tarantool'}}), Arguments())) == [('k', 'v', 3)]
+    mocker.stopall()
+
+    class FakeMemcache:
+        items: dict = {}
+
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def close(self):
+            pass
+
+        def get(self, key):
+            return self.items.get(key)
+
+        def gets(self, key):
+            return self.items.get(key), self.items.get(key)
+
+        def add(self, key, value, noreply=None):
+            return self.items.setdefault(key, value.encode()) == value.encode()
+
+        def cas(self, key, value, cas):
+            if self.items.get(key) != cas:
+                return False
+            self.items[key] = value.encode()
+            return True
+
+        def set(self, key, value):
+            self.items[key] = value.encode()
+
+        def set_many(self, values, expire=0):
+            self.items.update({key: value.encode() for key, value in values.items()})
+            return []
+
+        def get_many(self, keys):
+            return {key: self.items[key] for key in keys if key in self.items}
+
+        def delete_many(self, keys):
+            for key in keys:
+                self.items.pop(key, None)
+
+    mocker.patch('pymemcache.client.base.Client', FakeMemcache)
+    config = Config({'base': {'cache_backend': 'memcached', 'cache_stats_file': str(tmp_path / 'stats.json')}})
+    save_cache(config, Arguments(), {'a': [1, '1.0'], 'b': [2, '2.0'], 'c': [3, '3.0']})
+    delete_cache_keys(config, Arguments(), ['b'])
+    del FakeMemcache.items['cache_maven_check_versions_artifacts:c']
+    assert list(scan_cache(config, Arguments())) == [('a', [1, '1.0'], 10)]
+    assert json.loads(FakeMemcache.items['cache_maven_check_versions_artifacts#keys']) == ['a']
+    mocker.stopall()
+
+
+def test_process_cache_artifact_access():
+    now = int(time.time())
+    cache_data = CacheData({'group:artifact': (now - 100000, '1.0', 'key', None, [])})
+    assert process_cache_artifact(Config(), Arguments(), cache_data, 'artifact', 'group', '1.0')
+    assert cache_data['group:artifact'][5] >= now
+    assert (cache_data.hits, cache_data.misses) == (1, 0)
+    cache_data.mark_clean()
+    assert process_cache_artifact(Config(), Arguments(), cache_data, 'artifact', 'group', '1.0')
+    assert not process_cache_artifact(Config(), Arguments(), cache_data, 'other', 'group', '1.0')
+    assert cache_data.take_lookups() == (2, 1)
+    assert not cache_data.dirty
+
+
+def test_count_lookup():
+    cache_data = CacheData()
+    threads = [
+        threading.Thread(target=lambda: [cache_data.count_lookup(True, 2) for _ in range(1000)]) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    cache_data.count_lookup(False, 3)
+    assert cache_data.take_lookups() == (16000, 3)
+
+
 # noinspection PyShadowingNames
 def test_process_cache_artifact(mocker):
     config = Config()
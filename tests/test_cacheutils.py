@@ -0,0 +1,182 @@
+#!/usr/bin/python3
+"""Tests for package cache maintenance functions"""
+
+import gzip
+import json
+import os
+import sys
+import time
+
+import pytest
+# noinspection PyUnresolvedReferences
+from pytest_mock import mocker
+
+os.chdir(os.path.dirname(__file__))
+sys.path.append('../src')
+
+from maven_check_versions.cache import load_cache, save_cache, process_cache_artifact, entry_time  # noqa: E402
+from maven_check_versions.cacheutils import (  # noqa: E402
+    process_cache_command, cache_stats, purge_cache, compact_cache, export_cache, import_cache
+)
+from maven_check_versions.config import Config, Arguments  # noqa: E402
+
+
+def make_config(tmp_path, **base) -> Config:
+    return Config({'base': {
+        'cache_file': str(tmp_path / 'cache.json'), 'cache_stats_file': str(tmp_path / 'stats.json'), **base}})
+
+
+def test_cache_stats(tmp_path):
+    config = make_config(tmp_path)
+    now = int(time.time())
+    save_cache(config, Arguments(), {'group:artifact': (now, '1.0', 'key', None, ['1.0'])})
+    cache_data = load_cache(config, Arguments())
+    assert process_cache_artifact(config, Arguments(), cache_data, 'artifact', 'group', '1.0')
+    assert not process_cache_artifact(config, Arguments(), cache_data, 'other', 'group', '1.0')
+    cache_data['group:other'] = (now, '1.0', 'key', None, ['1.0'])
+    save_cache(config, Arguments(), cache_data)
+
+    stats = cache_stats(config, Arguments())
+    assert stats['entries'] == 2
+    assert stats['bytes'] == 2 * len(json.dumps([now, '1.0', 'key', None, ['1.0']]))
+    assert (stats['hits'], stats['misses'], stats['hit_ratio']) == (1, 1, 0.5)
+    assert cache_stats(config, Arguments(), 'pom')['hit_ratio'] is None
+
+
+def test_purge_cache(tmp_path):
+    config = make_config(tmp_path, cache_time=100)
+    now = int(time.time())
+    save_cache(config, Arguments(), {
+        'old': [now - 200, '1.0', 'key', None, []],
+        'new': [now, '1.0', 'key', None, []],
+        'pom': {'mtime': 0, 'size': 0, 'index': {}}
+    })
+    assert purge_cache(config, Arguments()) == 1
+    assert set(load_cache(config, Arguments())) == {'new', 'pom'}
+
+    config['base']['cache_time'] = 0
+    assert purge_cache(config, Arguments()) == 0
+
+    config['vulnerability'] = {'cache_file': str(tmp_path / 'cve.json'), 'cve_ttl': 100}
+    config['base']['cache_time'] = 10
+    save_cache(config, Arguments(), {
+        'expired': [now - 40 * 86400, []], 'stale': [now - 200, []], 'new': [now - 50, []]}, 'vulnerability')
+    assert purge_cache(config, Arguments(), 'vulnerability') == 1
+    assert set(load_cache(config, Arguments(), 'vulnerability')) == {'stale', 'new'}
+    config['vulnerability']['cve_retention'] = 60
+    assert purge_cache(config, Arguments(), 'vulnerability') == 1
+    assert set(load_cache(config, Arguments(), 'vulnerability')) == {'new'}
+    config['vulnerability']['cve_retention'] = 0
+    config['vulnerability']['cve_ttl'] = 10
+    assert purge_cache(config, Arguments(), 'vulnerability') == 0
+
+
+def test_purge_cache_pom(tmp_path):
+    config = make_config(tmp_path, cache_time=100)
+    config['pom'] = {'cache_file': str(tmp_path / 'pom.json')}
+    entries = {}
+    for name in ('old', 'changed', 'deleted'):
+        path = tmp_path / f"{name}.xml"
+        path.write_text('<project/>')
+        os.utime(path, ns=(0, time.time_ns() - 11 * 86400 * 10 ** 9))
+        stat = os.stat(path)
+        entries[str(path)] = {'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'index': {}}
+    (tmp_path / 'changed.xml').write_text('<project></project>')
+    os.remove(tmp_path / 'deleted.xml')
+    save_cache(config, Arguments(), entries, 'pom')
+
+    assert entry_time(entries[str(tmp_path / 'old.xml')]) < time.time() - 10 * 86400
+    assert purge_cache(config, Arguments(), 'pom') == 2
+    assert set(load_cache(config, Arguments(), 'pom')) == {str(tmp_path / 'old.xml')}
+
+
+def test_compact_cache(tmp_path):
+    config = make_config(tmp_path, cache_time=1000, cache_max_entries=2)
+    now = int(time.time())
+    save_cache(config, Arguments(), {
+        'expired': [now - 2000, '1.0', 'key', None, []],
+        'accessed': [now - 500, '1.0', 'key', None, [], now],
+        'updated': [now - 100, '1.0', 'key', None, []],
+        'stale': [now - 900, '1.0', 'key', None, []]
+    })
+    assert compact_cache(config, Arguments()) == 2
+    assert set(load_cache(config, Arguments())) == {'accessed', 'updated'}
+
+    config['base']['cache_max_entries'] = 0
+    assert compact_cache(config, Arguments()) == 0
+
+
+# noinspection PyShadowingNames
+def test_process_cache_command(mocker, tmp_path):
+    config = make_config(tmp_path)
+    mocker.patch('maven_check_versions.config.get_config', return_value=config)
+    mock_info = mocker.patch('logging.info')
+    process_cache_command(Arguments({'cache_action': 'stats', 'cache_section': ['base']}))
+    mock_info.assert_called_once_with('Cache base (json): 0 entries, 0 bytes, hit ratio n/a (0 hits, 0 misses)')
+
+    process_cache_command(Arguments({'cache_action': 'purge', 'cache_section': ['base']}))
+    mock_info.assert_called_with('Cache base (json): purged 0 entries')
+    process_cache_command(Arguments({'cache_action': 'compact', 'cache_section': ['base']}))
+    mock_info.assert_called_with('Cache base (json): removed 0 entries')
+
+    config['base']['cache_backend'] = 'memcached'
+    mock_memcache = mocker.patch('pymemcache.client.base.Client')
+    mock_memcache.return_value.get.return_value = b'["a"]'
+    mock_memcache.return_value.get_many.return_value = {'cache_maven_check_versions_artifacts:a': b'[1, "1.0"]'}
+    process_cache_command(Arguments({'cache_action': 'stats', 'cache_section': ['base']}))
+    mock_info.assert_called_with('Cache base (memcached): 1 entries, 10 bytes, hit ratio n/a (0 hits, 0 misses)')
+
+    mocker.patch('maven_check_versions.cache.scan_cache', side_effect=Exception)
+    mock_error = mocker.patch('logging.error')
+    process_cache_command(Arguments({'cache_action': 'stats'}))
+    assert mock_error.call_count == 3
+
+    try:
+        process_cache_command(Arguments({'cache_action': 'invalid'}))
+        assert False
+    except ValueError:
+        pass
+    mocker.stopall()
+
+
+def test_export_import_cache(tmp_path):
+    source = Config({
+        'base': {'cache_file': str(tmp_path / 'source.json')},
+        'vulnerability': {'cache_file': str(tmp_path / 'source-cve.json')}
+    })
+    target = Config({
+        'base': {'cache_backend': 'sqlite', 'sqlite_file': str(tmp_path / 'target.sqlite3')},
+        'vulnerability': {'cache_backend': 'binary', 'cache_file': str(tmp_path / 'target-cve.bin')}
+    })
+    save_cache(source, Arguments(), {'a': [10, '1.0'], 'b': [10, '1.0'], 'c': [10, '1.0']})
+    save_cache(source, Arguments(), {'pkg:maven/group/artifact@1.0': [10, [{'id': '1'}]]}, 'vulnerability')
+    save_cache(target, Arguments(), {'a': [20, '2.0'], 'b': [5, '0.5']})
+
+    snapshot = str(tmp_path / 'snapshot.json.gz')
+    assert export_cache(source, Arguments(), snapshot, ['base', 'vulnerability']) == {
+        'base': 3, 'vulnerability': 1}
+    assert import_cache(target, Arguments(), snapshot, ['base', 'vulnerability']) == {
+        'base': 2, 'vulnerability': 1}
+    cache_data = load_cache(target, Arguments())
+    cache_data.prefetch(['a', 'b', 'c'])
+    assert cache_data == {'a': [20, '2.0'], 'b': [10, '1.0'], 'c': [10, '1.0']}
+    assert load_cache(target, Arguments(), 'vulnerability').get('pkg:maven/group/artifact@1.0') == [
+        10, [{'id': '1'}]]
+    assert import_cache(target, Arguments(), snapshot, ['base', 'pom']) == {'base': 0}
+
+    with gzip.open(snapshot, 'wt') as f:
+        json.dump({'format': 0}, f)
+    with pytest.raises(ValueError):
+        import_cache(target, Arguments(), snapshot, ['base'])
+
+
+# noinspection PyShadowingNames
+def test_process_cache_command_snapshot(mocker, tmp_path):
+    mocker.patch('maven_check_versions.config.get_config', return_value=make_config(tmp_path))
+    mock_info = mocker.patch('logging.info')
+    snapshot = str(tmp_path / 'snapshot.json.gz')
+    process_cache_command(Arguments({'cache_action': 'export', 'cache_snapshot': snapshot, 'cache_section': ['base']}))
+    mock_info.assert_called_with(f"Cache base: exported 0 entries ({snapshot})")
+    process_cache_command(Arguments({'cache_action': 'import', 'cache_snapshot': snapshot, 'cache_section': ['base']}))
+    mock_info.assert_called_with(f"Cache base: imported 0 entries ({snapshot})")
+    mocker.stopall()
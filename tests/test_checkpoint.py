@@ -0,0 +1,55 @@
+#!/usr/bin/python3
+"""Tests for package checkpoint functions"""
+
+import os
+import sys
+
+import pytest
+
+os.chdir(os.path.dirname(__file__))
+sys.path.append('../src')
+
+# noinspection PyUnresolvedReferences
+from maven_check_versions.checkpoint import (  # noqa: E402
+    Checkpoint, load_checkpoint, open_checkpoint, coordinate_key, POM, COORDINATE
+)
+# noinspection PyUnresolvedReferences
+from maven_check_versions.config import Arguments, Config  # noqa: E402
+
+
+def test_checkpoint(tmp_path):
+    path = str(tmp_path / 'run.checkpoint')
+    checkpoint = Checkpoint(path)
+    checkpoint.mark_done(POM, 'pom.xml')
+    checkpoint.mark_done(COORDINATE, 'group:artifact:1.0')
+    checkpoint.mark_done(COORDINATE, 'group:artifact:1.0')
+    assert not checkpoint.is_done(POM, 'pom.xml')
+    checkpoint.close()
+    with open(path, encoding='utf-8') as f:
+        assert f.read() == 'pom\tpom.xml\ncoordinate\tgroup:artifact:1.0\n'
+
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('coordinate\tgroup:cut')
+    assert load_checkpoint(path) == {(POM, 'pom.xml'), (COORDINATE, 'group:artifact:1.0')}
+
+    with pytest.raises(KeyboardInterrupt):
+        with Checkpoint(path) as checkpoint:
+            assert checkpoint.is_done(POM, 'pom.xml')
+            assert not checkpoint.is_done(POM, 'other.xml')
+            checkpoint.mark_done(POM, 'pom.xml')
+            raise KeyboardInterrupt
+    assert os.path.exists(path)
+    assert load_checkpoint(path) == {(POM, 'pom.xml'), (COORDINATE, 'group:artifact:1.0')}
+    assert coordinate_key('pom.xml', 'group:artifact:1.0') != coordinate_key('other.xml', 'group:artifact:1.0')
+
+    with Checkpoint(path, resume=False) as checkpoint:
+        assert not checkpoint.is_done(POM, 'pom.xml')
+    assert not os.path.exists(path)
+
+
+def test_open_checkpoint(tmp_path):
+    assert open_checkpoint(Config(), Arguments()) is None
+    path = str(tmp_path / 'run.checkpoint')
+    checkpoint = open_checkpoint(Config({'base': {'checkpoint_file': path}}), Arguments({'resume': True}))
+    assert checkpoint.path == path
+    checkpoint.clear()
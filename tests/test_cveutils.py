@@ -1,9 +1,13 @@
 #!/usr/bin/python3
 """Tests for package cve check functions"""
+import json
 import os
 import sys
+import threading
+import time
 # noinspection PyPep8Naming
 import xml.etree.ElementTree as ET
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
 # noinspection PyUnresolvedReferences
@@ -13,7 +17,11 @@ os.chdir(os.path.dirname(__file__))
 sys.path.append('../src')
 
 from maven_check_versions.config import Config, Arguments
-from maven_check_versions.cveutils import Vulnerability, log_vulnerability, get_cve_data
+from maven_check_versions.cache import load_cache, save_cache, CacheData
+from maven_check_versions.cveutils import (
+    Vulnerability, VulnerabilityStore, log_vulnerability, get_cve_data, wait_for_refresh
+)
+from maven_check_versions.pomutils import PomDependency, PomIndex
 from maven_check_versions.utils import collect_dependencies
 
 
@@ -81,6 +89,7 @@ def test_get_cve_data(mocker):
         'pkg:maven/group1/artifact@1.0': [Vulnerability(id='1', cvssScore=1)],
         'pkg:maven/group4/artifact@1.0': []
     }
+    wait_for_refresh()
 
     mock_load_cache.return_value = {}
     mock_requests.return_value.status_code = 404
@@ -88,3 +97,160 @@ def test_get_cve_data(mocker):
 
     mock_requests.return_value = Exception()
     assert get_cve_data(config, Arguments(), deps, root, ns_mappings) == {}
+
+
+# noinspection PyShadowingNames
+def test_get_cve_data_refresh(mocker, tmp_path):
+    index = PomIndex(dependencies=[
+        PomDependency(group='group1', artifact='artifact', version='1.0'),
+        PomDependency(group='group2', artifact='artifact', version='1.0'),
+        PomDependency(group='group3', artifact='artifact', version='1.0')
+    ])
+    ns_mappings = {'xmlns': 'http://maven.apache.org/POM/4.0.0'}  # NOSONAR
+    config = Config({
+        'base': {'cache_stats_file': str(tmp_path / 'stats.json')},
+        'vulnerability': {'oss_index': True, 'cve_ttl': 3600, 'cache_file': str(tmp_path / 'cve.json')}
+    })
+    now = int(time.time())
+    save_cache(config, Arguments(), {
+        'pkg:maven/group1/artifact@1.0': [now, [{'id': 'fresh'}]],
+        'pkg:maven/group2/artifact@1.0': [now - 7200, [{'id': 'stale'}]],
+        'pkg:maven/group3/artifact@1.0': [{'id': 'legacy'}]
+    }, 'vulnerability')
+    mock_requests = mocker.patch('requests.Session.post', return_value=mocker.Mock(status_code=200, json=lambda: [
+        {'coordinates': 'pkg:maven/group2/artifact@1.0', 'vulnerabilities': [{'id': 'new'}]},
+        {'coordinates': 'pkg:maven/group3/artifact@1.0', 'vulnerabilities': []}
+    ]))
+
+    mock_info = mocker.patch('logging.info')
+    mock_count = mocker.spy(CacheData, 'count_lookup')
+    assert get_cve_data(config, Arguments(), index.dependencies, index, ns_mappings) == {
+        'pkg:maven/group1/artifact@1.0': [Vulnerability(id='fresh')],
+        'pkg:maven/group2/artifact@1.0': [Vulnerability(id='stale')],
+        'pkg:maven/group3/artifact@1.0': [Vulnerability(id='legacy')]
+    }
+    wait_for_refresh()
+    mock_requests.assert_called_once()
+    mock_info.assert_any_call('Refreshed CVE data: 1 written, 1 deleted as safe, 0 failed')
+    assert [call.args[1:] for call in mock_count.call_args_list] == [(True, 3), (False, 0)]
+    assert mock_requests.call_args.kwargs['json'] == {
+        'coordinates': ['pkg:maven/group2/artifact@1.0', 'pkg:maven/group3/artifact@1.0']}
+
+    cache_data = load_cache(config, Arguments(), 'vulnerability')
+    assert cache_data['pkg:maven/group2/artifact@1.0'][0] >= now
+    assert [Vulnerability(**cve) for cve in cache_data['pkg:maven/group2/artifact@1.0'][1]] == [Vulnerability(id='new')]
+    assert 'pkg:maven/group3/artifact@1.0' not in cache_data
+
+    assert get_cve_data(config, Arguments(), index.dependencies, index, ns_mappings) == {
+        'pkg:maven/group1/artifact@1.0': [Vulnerability(id='fresh')],
+        'pkg:maven/group2/artifact@1.0': [Vulnerability(id='new')]
+    }
+    wait_for_refresh()
+    assert mock_requests.call_count == 2
+
+
+# noinspection PyShadowingNames
+def test_get_cve_data_batches(mocker):
+    lock = threading.Lock()
+    state = {'active': 0, 'peak': 0, 'failed': set()}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):  # noqa: N802
+            batch = json.loads(self.rfile.read(int(self.headers['Content-Length'])))['coordinates']
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+                retry = batch[0] not in state['failed']
+                state['failed'].add(batch[0])
+            time.sleep(0.05)
+            with lock:
+                state['active'] -= 1
+            if retry:
+                self.send_response(503)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            body = json.dumps([
+                {'coordinates': c, 'vulnerabilities': [{'id': c}] if c.endswith('@1') else []} for c in batch
+            ]).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        index = PomIndex(dependencies=[
+            PomDependency(group=f"group{i}", artifact='artifact', version=str(i % 2)) for i in range(40)
+        ])
+        config = Config({'vulnerability': {
+            'oss_index': True, 'oss_index_url': f"http://127.0.0.1:{server.server_port}/",
+            'oss_index_batch_size': 4, 'oss_index_max_requests': 5, 'oss_index_backoff': 0.01
+        }})
+        mocker.patch('maven_check_versions.cache.load_cache', side_effect=lambda *args: {})
+        mocker.patch('maven_check_versions.cache.save_cache')
+        ns_mappings = {'xmlns': 'http://maven.apache.org/POM/4.0.0'}  # NOSONAR
+        result = get_cve_data(config, Arguments(), index.dependencies, index, ns_mappings)
+        assert result == {
+            f"pkg:maven/group{i}/artifact@1": [Vulnerability(id=f"pkg:maven/group{i}/artifact@1")]
+            for i in range(1, 40, 2)
+        }
+        assert len(state['failed']) == 10
+        assert 1 < state['peak'] <= 5
+
+        config['vulnerability']['oss_index_retries'] = 0
+        state['failed'].clear()
+        mock_logging = mocker.patch('logging.error')
+        assert get_cve_data(config, Arguments(), index.dependencies, index, ns_mappings) == {}
+        assert mock_logging.call_count == 10
+        mock_logging.assert_called_with('OSS Index API error: 503')
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+# noinspection PyShadowingNames
+def test_vulnerability_store(mocker):
+    config = Config({'vulnerability': {'oss_index': True}})
+    mock_load_cache = mocker.patch(
+        'maven_check_versions.cache.load_cache', return_value={'pkg:maven/group/cached@1.0': [int(time.time()), []]})
+    mock_save_cache = mocker.patch('maven_check_versions.cache.save_cache')
+    fetched = []
+
+    def _fetch(*args, **kwargs):
+        fetched.append(sorted(args[2]))
+        time.sleep(0.05)
+        return {c: [Vulnerability(id=c)] if 'bad' in c else [] for c in args[2]}
+
+    mocker.patch('maven_check_versions.cveutils._fetch_cve_data', side_effect=_fetch)
+    store = VulnerabilityStore(config, Arguments())
+    modules = [
+        ['pkg:maven/group/cached@1.0', 'pkg:maven/group/bad@1.0', 'pkg:maven/group/safe@1.0'],
+        ['pkg:maven/group/bad@1.0', 'pkg:maven/group/other@1.0'],
+    ] * 4
+    results = [None] * len(modules)
+
+    def _module(i):
+        results[i] = store.get(modules[i])
+
+    threads = [threading.Thread(target=_module, args=(i,)) for i in range(len(modules))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    mock_load_cache.assert_called_once()
+    assert sorted(c for batch in fetched for c in batch) == [
+        'pkg:maven/group/bad@1.0', 'pkg:maven/group/other@1.0', 'pkg:maven/group/safe@1.0']
+    bad = [Vulnerability(id='pkg:maven/group/bad@1.0')]
+    assert results[0] == {'pkg:maven/group/cached@1.0': [], 'pkg:maven/group/bad@1.0': bad}
+    assert results[1] == {'pkg:maven/group/bad@1.0': bad}
+    assert list(store.cache_data) == ['pkg:maven/group/cached@1.0', 'pkg:maven/group/bad@1.0']
+    mock_save_cache.assert_not_called()
+    store.save()
+    mock_save_cache.assert_called_once_with(config, mocker.ANY, store.cache_data, 'vulnerability')
@@ -31,3 +31,13 @@ def test_main(mocker):
     main()
     mock_input.side_effect = KeyboardInterrupt
     main()
+
+    mock_pcl.return_value = {'ci_mode': True, 'queue_mode': 'worker'}
+    mock_process_queue = mocker.patch('maven_check_versions.workqueue.process_queue')
+    main()
+    mock_process_queue.assert_called_once()
+
+    mock_pcl.return_value = {'ci_mode': True, 'command': 'cache', 'cache_action': 'stats'}
+    mock_cache_command = mocker.patch('maven_check_versions.cacheutils.process_cache_command')
+    main()
+    mock_cache_command.assert_called_once()
@@ -0,0 +1,237 @@
+#!/usr/bin/python3
+"""Tests for package POM index functions"""
+
+import gc
+import io
+import os
+import sys
+# noinspection PyPep8Naming
+import xml.etree.ElementTree as ET
+
+os.chdir(os.path.dirname(__file__))
+sys.path.append('../src')
+
+# noinspection PyUnresolvedReferences
+import maven_check_versions.pomutils as _pomutils  # noqa: E402
+from maven_check_versions.pomutils import (  # noqa: E402
+    PomDependency, PomIndex, build_pom_index, dependency_record,
+    get_pom_index, resolve_property, managed_version, effective_index,
+    iter_pom_dependencies, is_resolvable, index_to_dict, index_from_dict
+)
+
+ns_mappings = {'xmlns': 'http://maven.apache.org/POM/4.0.0'}  # NOSONAR
+
+
+def test_build_pom_index():
+    root = ET.fromstring("""
+    <?xml version="1.0" encoding="UTF-8"?>
+    <project xmlns="http://maven.apache.org/POM/4.0.0">
+        <groupId>group</groupId>
+        <artifactId>artifact</artifactId>
+        <version>1.0</version>
+        <properties>
+            <lib.version>2.0</lib.version>
+        </properties>
+        <modules>
+            <module>module</module>
+        </modules>
+        <parent>
+            <groupId>group</groupId>
+            <artifactId>parent</artifactId>
+            <version>1.0</version>
+            <relativePath/>
+        </parent>
+        <dependencyManagement>
+            <dependencies>
+                <dependency>
+                    <groupId>bom</groupId>
+                    <artifactId>bom</artifactId>
+                    <version>1.0</version>
+                    <scope>import</scope>
+                </dependency>
+            </dependencies>
+        </dependencyManagement>
+        <dependencies>
+            <dependency>
+                <groupId>group1</groupId>
+                <artifactId>artifact1</artifactId>
+                <version>${lib.version}</version>
+            </dependency>
+        </dependencies>
+        <build>
+            <plugins>
+                <plugin>
+                    <groupId>plugin</groupId>
+                    <artifactId>plugin</artifactId>
+                    <dependencies>
+                        <dependency>
+                            <groupId>group2</groupId>
+                            <artifactId>artifact2</artifactId>
+                        </dependency>
+                    </dependencies>
+                </plugin>
+            </plugins>
+        </build>
+    </project>
+    """.lstrip())
+    index = build_pom_index(root, ns_mappings)
+    assert index.artifact_name == 'group:artifact'
+    assert index.version == '1.0'
+    assert index.properties == {'lib.version': '2.0'}
+    assert index.modules == ['module']
+    assert index.parent == PomDependency('group', 'parent', '1.0')
+    assert index.parent_path == ''
+    assert index.imports == [PomDependency('bom', 'bom', '1.0', scope='import')]
+    assert index.dependencies == [
+        PomDependency('bom', 'bom', '1.0', scope='import'),
+        PomDependency('group1', 'artifact1', '${lib.version}'),
+        PomDependency('group2', 'artifact2')
+    ]
+    assert index.plugins == [PomDependency('plugin', 'plugin', plugin=True)]
+
+    dependency = root.find('./xmlns:dependencies/xmlns:dependency', namespaces=ns_mappings)
+    assert index.elements[dependency] is index.dependencies[1]
+
+
+def test_index_to_dict_and_back():
+    index = PomIndex(
+        group='group', artifact='artifact', properties={'lib.version': '1.0'},
+        dependencies=[PomDependency('group', 'lib', '${lib.version}')],
+        parent=PomDependency('group', 'parent', '1.0'),
+        managed={'group:lib': PomDependency('group', 'lib', '1.0')},
+        elements={'element': None})
+    data = index_to_dict(index)
+    assert 'elements' not in data
+    assert data['parent'] == {'group': 'group', 'artifact': 'parent', 'version': '1.0', 'plugin': False, 'scope': None}
+    assert index_from_dict(data) == index
+    assert index_from_dict(index_to_dict(PomIndex())) == PomIndex()
+
+
+def test_dependency_record():
+    dependency = ET.fromstring("""
+    <?xml version="1.0" encoding="UTF-8"?>
+    <dependency xmlns="http://maven.apache.org/POM/4.0.0">
+        <groupId>group</groupId>
+        <artifactId>artifact</artifactId>
+    </dependency>
+    """.lstrip())
+    assert dependency_record(dependency, ns_mappings) == PomDependency('group', 'artifact')
+
+
+def test_get_pom_index():
+    cached = len(_pomutils._index_cache)
+    root = ET.fromstring('<project xmlns="http://maven.apache.org/POM/4.0.0"/>')
+    index = get_pom_index(root, ns_mappings)
+    assert get_pom_index(root, ns_mappings) is index
+    assert get_pom_index(index, ns_mappings) is index
+
+    del root, index
+    gc.collect()
+    assert len(_pomutils._index_cache) <= cached
+
+
+def test_profile_modules():
+    pom = """<?xml version="1.0" encoding="UTF-8"?>
+    <project xmlns="http://maven.apache.org/POM/4.0.0">
+        <modules>
+            <module>core</module>
+        </modules>
+        <profiles>
+            <profile>
+                <id>extra</id>
+                <modules>
+                    <module>extra</module>
+                    <module>core</module>
+                </modules>
+            </profile>
+        </profiles>
+    </project>
+    """
+    assert build_pom_index(ET.fromstring(pom), ns_mappings).modules == ['core', 'extra']
+    index = PomIndex()
+    list(iter_pom_dependencies(io.BytesIO(pom.encode()), ns_mappings, index))
+    assert index.modules == ['core', 'extra']
+
+
+def test_resolve_property():
+    index = PomIndex(properties={'lib.version': '1.0'})
+    assert resolve_property(index, '${lib.version}') == '1.0'
+    assert resolve_property(index, '${other.version}') == '${other.version}'
+    assert resolve_property(index, '2.0') == '2.0'
+
+    index = PomIndex(properties={'a': '${b}', 'b': '${a}'})
+    assert resolve_property(index, '${a}') in ('${a}', '${b}')
+
+
+def test_effective_index():
+    parent = PomIndex(
+        group='group', artifact='parent', version='1.0',
+        properties={'lib.version': '1.0', 'project.version': '1.0'},
+        managed={'group:lib': PomDependency('group', 'lib', '${lib.version}')})
+    bom = PomIndex(
+        properties={'bom.version': '3.0'},
+        managed={
+            'group:bom': PomDependency('group', 'bom', '${bom.version}'),
+            'group:lib': PomDependency('group', 'lib', '4.0')
+        })
+    index = PomIndex(
+        artifact='child', parent=PomDependency('group', 'parent', '1.0'),
+        properties={'lib.version': '2.0'})
+    effective = effective_index(index, parent, [bom])
+    assert effective.artifact_name == 'group:child'
+    assert effective.properties['project.version'] == '1.0'
+    assert effective.properties['project.parent.version'] == '1.0'
+    assert managed_version(effective, PomDependency('group', 'lib')) == '${lib.version}'
+    assert resolve_property(effective, '${lib.version}') == '2.0'
+    assert managed_version(effective, PomDependency('group', 'bom')) == '3.0'
+    assert managed_version(effective, PomDependency('group', 'other')) is None
+
+
+def test_iter_pom_dependencies():
+    source = io.BytesIO(b"""<?xml version="1.0" encoding="UTF-8"?>
+    <projects>
+        <project xmlns="http://maven.apache.org/POM/4.0.0">
+            <groupId>group</groupId>
+            <artifactId>first</artifactId>
+            <version>1.0</version>
+            <properties>
+                <lib.version>2.0</lib.version>
+            </properties>
+            <dependencies>
+                <dependency>
+                    <groupId>group1</groupId>
+                    <artifactId>artifact1</artifactId>
+                    <version>${lib.version}</version>
+                </dependency>
+            </dependencies>
+        </project>
+        <project xmlns="http://maven.apache.org/POM/4.0.0">
+            <artifactId>second</artifactId>
+            <build>
+                <plugins>
+                    <plugin>
+                        <groupId>plugin</groupId>
+                        <artifactId>plugin</artifactId>
+                        <configuration><large>text</large></configuration>
+                    </plugin>
+                </plugins>
+            </build>
+        </project>
+    </projects>
+    """)
+    index = PomIndex()
+    records = iter_pom_dependencies(source, ns_mappings, index)
+    assert next(records) == PomDependency('group1', 'artifact1', '${lib.version}')
+    assert index.properties == {'lib.version': '2.0'}
+    assert list(records) == [PomDependency('plugin', 'plugin', plugin=True)]
+    assert index.artifact_name == 'group:first'
+    assert index.elements == {}
+
+
+def test_is_resolvable():
+    index = PomIndex(version='1.0', properties={'lib.version': '1.0'})
+    assert is_resolvable(index, PomDependency('group', 'artifact', '1.0'))
+    assert is_resolvable(index, PomDependency('group', 'artifact', '${lib.version}'))
+    assert is_resolvable(index, PomDependency('group', 'artifact', '${project.version}'))
+    assert not is_resolvable(index, PomDependency('group', 'artifact', '${other.version}'))
+    assert not is_resolvable(index, PomDependency('group', 'artifact'))
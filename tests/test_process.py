@@ -17,9 +17,13 @@ sys.path.append('../src')
 from maven_check_versions.process import (  # noqa: E402
     service_rest, process_repository, process_repositories,
     process_modules_if_required, process_artifact,
-    process_dependency, process_pom, process_main
+    process_dependency, process_pom, process_main, process_pom_stream,
+    process_scan_dir
 )
 
+# noinspection PyUnresolvedReferences
+from maven_check_versions.checkpoint import Checkpoint, coordinate_key, POM, COORDINATE  # noqa: E402
+
 # noinspection PyUnresolvedReferences
 from maven_check_versions.logutils import (  # noqa: E402
     configure_logging, log_skip_if_required,
@@ -47,14 +51,21 @@ def test_process_main(mocker, monkeypatch):
     mock_exists.side_effect = [False, False, True]
     mocker.patch('builtins.open', mocker.mock_open(read_data="base.cache_off: false"))
     mocker.patch('maven_check_versions.cache.load_cache', return_value={})
-    mocker.patch('maven_check_versions.process.process_pom')
+    mock_process_pom = mocker.patch('maven_check_versions.process.process_pom')
     mocker.patch('maven_check_versions.cache.save_cache')
     process_main(Arguments({'pom_file': 'pom.xml'}))
+    mock_process_pom.assert_called_once_with(
+        mocker.ANY, mocker.ANY, mocker.ANY, 'pom.xml', pom_cache=None, cve_store=None, checkpoint=None)
 
     mock_exists.side_effect = [False, False, True]
     mocker.patch('maven_check_versions.process.process_artifact')
     process_main(Arguments({'find_artifact': 'pom.xml'}))
 
+    mock_exists.side_effect = [False, False, True]
+    mock_scan_dir = mocker.patch('maven_check_versions.process.process_scan_dir')
+    process_main(Arguments({'scan_dir': 'dir'}))
+    mock_scan_dir.assert_called_once()
+
     mock_exists.side_effect = [False, False, True]
     mock_config_items = mocker.patch('maven_check_versions.config.config_items')
     mock_config_items.return_value = [('key', 'pom.xml')]
@@ -301,3 +312,108 @@ def test_process_pom(mocker):
     mock_pd = mocker.patch('maven_check_versions.process.process_dependency')
     process_pom({}, config, Arguments(), 'pom.xml', 'prefix')
     mock_pd.assert_called_once()
+
+
+# noinspection PyShadowingNames
+def test_process_pom_stream(mocker, tmp_path):
+    (tmp_path / 'pom.xml').write_text("""<?xml version="1.0" encoding="UTF-8"?>
+    <project xmlns="http://maven.apache.org/POM/4.0.0">
+        <artifactId>artifact</artifactId>
+        <dependencies>
+            <dependency>
+                <groupId>group</groupId>
+                <artifactId>early</artifactId>
+                <version>1.0</version>
+            </dependency>
+            <dependency>
+                <groupId>group</groupId>
+                <artifactId>late</artifactId>
+                <version>${late.version}</version>
+            </dependency>
+        </dependencies>
+        <properties>
+            <late.version>2.0</late.version>
+        </properties>
+    </project>
+    """)
+    processed = []
+    mock_pd = mocker.patch('maven_check_versions.process.process_dependency')
+    mock_pd.side_effect = lambda *args: processed.append(get_version(Config(), Arguments(), ns_mappings, args[5], args[3]))
+    mock_pm = mocker.patch('maven_check_versions.process.process_modules_if_required')
+    mock_cve = mocker.patch('maven_check_versions.cveutils.get_cve_data', return_value={'k': []})
+    mock_log_vulnerability = mocker.patch('maven_check_versions.cveutils.log_vulnerability')
+    config = Config({'base': {'threading': False}})
+    process_pom_stream({}, config, Arguments(), str(tmp_path / 'pom.xml'))
+    assert processed == [('1.0', False), ('2.0', False)]
+    mock_pm.assert_called_once()
+    mock_cve.assert_called_once()
+    assert mock_log_vulnerability.call_count == 2
+
+    mock_pps = mocker.patch('maven_check_versions.process.process_pom_stream')
+    process_pom({}, Config({'base': {'stream_pom': True}}), Arguments(), 'pom.xml')
+    mock_pps.assert_called_once()
+
+
+# noinspection PyShadowingNames
+def test_process_pom_resume(mocker, tmp_path):
+    (tmp_path / 'pom.xml').write_text("""<?xml version="1.0" encoding="UTF-8"?>
+    <project xmlns="http://maven.apache.org/POM/4.0.0">
+        <artifactId>artifact</artifactId>
+        <dependencies>
+            <dependency>
+                <groupId>group</groupId>
+                <artifactId>done</artifactId>
+                <version>1.0</version>
+            </dependency>
+            <dependency>
+                <groupId>group</groupId>
+                <artifactId>left</artifactId>
+                <version>1.0</version>
+            </dependency>
+        </dependencies>
+    </project>
+    """)
+    pom_path = str(tmp_path / 'pom.xml')
+    other_path = str(tmp_path / 'other.xml')
+    (tmp_path / 'other.xml').write_text((tmp_path / 'pom.xml').read_text())
+    checkpoint = Checkpoint(str(tmp_path / 'run.checkpoint'))
+    checkpoint.mark_done(COORDINATE, coordinate_key(pom_path, 'group:done:1.0'))
+    checkpoint.close()
+
+    checkpoint = Checkpoint(str(tmp_path / 'run.checkpoint'))
+    mock_pr = mocker.patch('maven_check_versions.process.process_repositories', return_value=True)
+    config = Config({'base': {'threading': False}})
+    process_pom({}, config, Arguments(), pom_path, checkpoint=checkpoint)
+    assert [call.args[0] for call in mock_pr.call_args_list] == ['left']
+    assert (COORDINATE, coordinate_key(pom_path, 'group:left:1.0')) in checkpoint.done
+    assert (POM, pom_path) in checkpoint.done
+
+    mock_pr.reset_mock()
+    process_pom({}, config, Arguments(), other_path, checkpoint=checkpoint)
+    assert [call.args[0] for call in mock_pr.call_args_list] == ['done', 'left']
+
+    mock_pr.reset_mock()
+    process_pom({}, config, Arguments(), pom_path, checkpoint=checkpoint)
+    assert [call.args[0] for call in mock_pr.call_args_list] == ['left']
+    checkpoint.close()
+
+    mock_pr.reset_mock()
+    checkpoint = Checkpoint(str(tmp_path / 'run.checkpoint'))
+    process_pom({}, config, Arguments(), pom_path, checkpoint=checkpoint)
+    process_pom({}, config, Arguments(), other_path, checkpoint=checkpoint)
+    mock_pr.assert_not_called()
+    checkpoint.clear()
+
+
+# noinspection PyShadowingNames
+def test_process_scan_dir(mocker):
+    mocker.patch('maven_check_versions.utils.scan_pom_files', return_value=iter(['a/pom.xml', 'b/pom.xml']))
+    mock_process_pom = mocker.patch('maven_check_versions.process.process_pom')
+    process_scan_dir({}, Config(), Arguments({'process_modules': True}), 'dir')
+    assert sorted(call.args[3] for call in mock_process_pom.call_args_list) == ['a/pom.xml', 'b/pom.xml']
+    assert mock_process_pom.call_args.args[2]['process_modules'] is False
+
+    mock_process_pom.reset_mock()
+    mocker.patch('maven_check_versions.utils.scan_pom_files', return_value=iter(['a/pom.xml']))
+    process_scan_dir({}, Config({'base': {'threading': False}}), Arguments(), 'dir')
+    mock_process_pom.assert_called_once()
@@ -1,8 +1,11 @@
 #!/usr/bin/python3
 """Tests for package utility functions"""
 
+import io
 import os
 import sys
+import threading
+import time
 # noinspection PyPep8Naming
 import xml.etree.ElementTree as ET
 
@@ -14,11 +17,15 @@ os.chdir(os.path.dirname(__file__))
 sys.path.append('../src')
 
 # noinspection PyUnresolvedReferences
+import maven_check_versions.utils as _utils  # noqa: E402
 from maven_check_versions.utils import (  # noqa: E402
     parse_command_line, get_artifact_name, collect_dependencies,
     get_dependency_identifiers, fail_mode_if_required, resolve_version,
-    get_version, check_versions, get_pom_data, get_pom_tree
+    get_version, check_versions, get_pom_data, get_pom_tree,
+    get_repository_path, get_effective_index, stream_pom_dependencies,
+    get_pom_index, scan_pom_files, filter_versions
 )
+from maven_check_versions.pomutils import PomIndex, build_pom_index  # noqa: E402
 from maven_check_versions.config import Arguments, Config
 
 ns_mappings = {'xmlns': 'http://maven.apache.org/POM/4.0.0'}  # NOSONAR
@@ -48,7 +55,8 @@ def test_parse_command_line(mocker):
             empty_version=True,
             show_invalid=True,
             user='user',
-            password='password'
+            password='password',
+            queue_mode='worker'
         ))
     args = parse_command_line()
     assert args['ci_mode'] is True
@@ -71,6 +79,7 @@ def test_parse_command_line(mocker):
     assert args['show_invalid'] is True
     assert args['user'] == 'user'
     assert args['password'] == 'password'
+    assert args['queue_mode'] == 'worker'
 
 
 def test_get_artifact_name():
@@ -212,11 +221,27 @@ def test_check_versions(mocker):
 
     args['fail_mode'] = False
     assert _check_versions(args, cache_data, '1.1', ['1.2'])
+    assert _check_versions(args, cache_data, '1.1', ['1.2', '1.10', '1.9'])
+    assert cache_data['group:artifact'][1] == '1.10'
 
     mock_get_pom_data.return_value = (False, None)
     assert not _check_versions(args, cache_data, '1.1', ['1.2'])
 
 
+def test_filter_versions():
+    versions = ['2.0-SNAPSHOT', '2.0-RC1', '2.0-M1', '1.1', '1.0-beta', '1.0']
+    assert filter_versions(Config(), Arguments(), 'repo', versions, '1.0') == versions
+
+    config = Config({'base': {'exclude_qualifiers': ['-snapshot$', r'-(alpha|beta|m|rc)\d*$']}})
+    assert filter_versions(config, Arguments(), 'repo', versions, '1.0-beta') == ['1.1', '1.0-beta', '1.0']
+
+    config['repo'] = {'exclude_qualifiers': []}
+    assert filter_versions(config, Arguments(), 'repo', versions, '1.0') == versions
+
+    config['repo'] = {'include_qualifiers': r'^\d+(\.\d+)*$'}
+    assert filter_versions(config, Arguments(), 'repo', versions, None) == ['1.1', '1.0']
+
+
 # noinspection PyShadowingNames
 def test_get_pom_data(mocker):
     pom_path = 'http://example.com/pom.pom'  # NOSONAR
@@ -260,3 +285,222 @@ def test_get_pom_tree(mocker):
     mock_requests.return_value.status_code = 404
     with pytest.raises(FileNotFoundError):
         get_pom_tree(pom_path, True, config, Arguments())
+
+
+# noinspection PyShadowingNames
+def test_get_pom_index(mocker, tmp_path):
+    pom_path = tmp_path / 'pom.xml'
+    pom_path.write_text("""<?xml version="1.0" encoding="UTF-8"?>
+    <project xmlns="http://maven.apache.org/POM/4.0.0">
+        <groupId>group</groupId>
+        <artifactId>artifact</artifactId>
+        <dependencies>
+            <dependency>
+                <groupId>group</groupId>
+                <artifactId>lib</artifactId>
+                <version>1.0</version>
+            </dependency>
+        </dependencies>
+    </project>
+    """)
+    pom_cache: dict = {}
+    index = get_pom_index(str(pom_path), True, Config(), Arguments(), ns_mappings, pom_cache)
+    assert index.artifact_name == 'group:artifact'
+    assert pom_cache[str(pom_path.absolute())]['size'] == pom_path.stat().st_size
+
+    mock_get_pom_tree = mocker.patch('maven_check_versions.utils.get_pom_tree')
+    cached = get_pom_index(str(pom_path), True, Config(), Arguments(), ns_mappings, pom_cache)
+    assert cached == index
+    mock_get_pom_tree.assert_not_called()
+
+    pom_path.write_text(pom_path.read_text().replace('artifact<', 'changed<'))
+    mocker.stopall()
+    assert get_pom_index(str(pom_path), True, Config(), Arguments(), ns_mappings, pom_cache).artifact == 'changed'
+
+
+def test_scan_pom_files(tmp_path):
+    for path in ['pom.xml', 'a/pom.xml', 'a/b/pom.xml', 'a/target/pom.xml', '.git/pom.xml', 'c/d/pom.xml']:
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text('<project/>')
+    (tmp_path / 'a' / 'other.xml').write_text('<project/>')
+
+    found = scan_pom_files(str(tmp_path), ['target', '.git', 'c/d'], 4)
+    assert sorted(os.path.relpath(path, tmp_path) for path in found) == sorted([
+        'pom.xml', os.path.join('a', 'pom.xml'), os.path.join('a', 'b', 'pom.xml')
+    ])
+    assert list(scan_pom_files(str(tmp_path / 'missing'), [])) == []
+
+
+def test_get_repository_path():
+    config = Config({'repo': {'base': 'https://repo1.maven.org', 'path': 'maven2'}})
+    path = get_repository_path(config, Arguments(), 'repo', 'org.group', 'artifact')
+    assert path == 'https://repo1.maven.org/maven2/org/group/artifact'
+
+    config['repo']['repo'] = 'central'
+    path = get_repository_path(config, Arguments(), 'repo', 'org.group', 'artifact')
+    assert path == 'https://repo1.maven.org/maven2/central/org/group/artifact'
+
+
+# noinspection PyShadowingNames
+def test_get_effective_index(mocker, tmp_path):
+    (tmp_path / 'pom.xml').write_text("""<?xml version="1.0" encoding="UTF-8"?>
+    <project xmlns="http://maven.apache.org/POM/4.0.0">
+        <groupId>group</groupId>
+        <artifactId>parent</artifactId>
+        <version>1.0</version>
+        <properties>
+            <lib.version>1.0</lib.version>
+        </properties>
+        <dependencyManagement>
+            <dependencies>
+                <dependency>
+                    <groupId>group</groupId>
+                    <artifactId>lib</artifactId>
+                    <version>${lib.version}</version>
+                </dependency>
+                <dependency>
+                    <groupId>bom</groupId>
+                    <artifactId>bom</artifactId>
+                    <version>2.0</version>
+                    <scope>import</scope>
+                    <type>pom</type>
+                </dependency>
+            </dependencies>
+        </dependencyManagement>
+    </project>
+    """)
+    (tmp_path / 'module').mkdir()
+    (tmp_path / 'module' / 'pom.xml').write_text("""<?xml version="1.0" encoding="UTF-8"?>
+    <project xmlns="http://maven.apache.org/POM/4.0.0">
+        <parent>
+            <groupId>group</groupId>
+            <artifactId>parent</artifactId>
+            <version>1.0</version>
+        </parent>
+        <artifactId>module</artifactId>
+        <dependencies>
+            <dependency>
+                <groupId>group</groupId>
+                <artifactId>lib</artifactId>
+            </dependency>
+            <dependency>
+                <groupId>bom</groupId>
+                <artifactId>managed</artifactId>
+            </dependency>
+            <dependency>
+                <groupId>group</groupId>
+                <artifactId>module</artifactId>
+                <version>${project.version}</version>
+            </dependency>
+        </dependencies>
+    </project>
+    """)
+    bom = """<?xml version="1.0" encoding="UTF-8"?>
+    <project xmlns="http://maven.apache.org/POM/4.0.0">
+        <dependencyManagement>
+            <dependencies>
+                <dependency>
+                    <groupId>bom</groupId>
+                    <artifactId>managed</artifactId>
+                    <version>3.0</version>
+                </dependency>
+            </dependencies>
+        </dependencyManagement>
+    </project>
+    """
+    config = Config({
+        'repositories': ['repo'],
+        'repo': {'base': 'https://repo.example.com', 'path': 'maven2', 'auth': True}
+    })
+    mock_requests = mocker.patch(
+        'requests.Session.get', return_value=mocker.Mock(status_code=200, text=bom))
+
+    pom_path = str(tmp_path / 'module' / 'pom.xml')
+    root = ET.parse(pom_path).getroot()
+    index = get_effective_index(build_pom_index(root, ns_mappings), pom_path, config, Arguments(), True, ns_mappings)
+    versions = [get_version(config, Arguments(), ns_mappings, index, dep)[0] for dep in index.dependencies]
+    assert versions == ['1.0', '3.0', '1.0']
+    mock_requests.assert_called_once()
+    assert mock_requests.call_args[0][0] == 'https://repo.example.com/maven2/bom/bom/2.0/bom-2.0.pom'
+
+    get_effective_index(build_pom_index(root, ns_mappings), pom_path, config, Arguments(), True, ns_mappings)
+    mock_requests.assert_called_once()
+
+
+# noinspection PyShadowingNames
+def test_get_effective_index_cycle(mocker, tmp_path):
+    def _pom(name, parent):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / 'pom.xml').write_text(f"""<?xml version="1.0" encoding="UTF-8"?>
+        <project xmlns="http://maven.apache.org/POM/4.0.0">
+            <parent>
+                <groupId>cycle</groupId>
+                <artifactId>{parent}</artifactId>
+                <version>1.0</version>
+                <relativePath>../{parent}</relativePath>
+            </parent>
+            <artifactId>{name}</artifactId>
+        </project>
+        """)
+        return str(tmp_path / name / 'pom.xml')
+
+    _pom('a', 'b')
+    _pom('b', 'a')
+    children = [_pom('ca', 'a'), _pom('cb', 'b')]
+    get_pom_tree = _utils.get_pom_tree
+
+    def _slow_pom_tree(*args):
+        time.sleep(0.1)
+        return get_pom_tree(*args)
+
+    mocker.patch('maven_check_versions.utils.get_pom_tree', side_effect=_slow_pom_tree)
+    results = {}
+
+    def _resolve(path):
+        index = build_pom_index(ET.parse(path).getroot(), ns_mappings)
+        results[path] = get_effective_index(index, path, Config(), Arguments(), True, ns_mappings)
+
+    threads = [threading.Thread(target=_resolve, args=(path,), daemon=True) for path in children]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    assert not any(thread.is_alive() for thread in threads)
+    assert sorted(results) == sorted(children)
+
+
+# noinspection PyShadowingNames
+def test_stream_pom_dependencies(mocker, tmp_path):
+    xml = """<?xml version="1.0" encoding="UTF-8"?>
+    <project xmlns="http://maven.apache.org/POM/4.0.0">
+        <artifactId>artifact</artifactId>
+        <dependencies>
+            <dependency>
+                <groupId>group</groupId>
+                <artifactId>artifact</artifactId>
+                <version>1.0</version>
+            </dependency>
+        </dependencies>
+    </project>
+    """
+    (tmp_path / 'pom.xml').write_text(xml)
+    config = Config({'pom_http': {'auth': 'true'}})
+    index = PomIndex()
+    records = list(stream_pom_dependencies(str(tmp_path / 'pom.xml'), True, config, Arguments(), ns_mappings, index))
+    assert [(r.group, r.artifact, r.version) for r in records] == [('group', 'artifact', '1.0')]
+    assert index.artifact == 'artifact'
+
+    with pytest.raises(FileNotFoundError):
+        list(stream_pom_dependencies(str(tmp_path / 'other.xml'), True, config, Arguments(), ns_mappings, index))
+
+    pom_path = 'http://example.com/pom.pom'  # NOSONAR
+    mock_response = mocker.MagicMock(status_code=200, raw=io.BytesIO(xml.encode()))
+    mock_response.__enter__.return_value = mock_response
+    mock_requests = mocker.patch('requests.Session.get', return_value=mock_response)
+    records = list(stream_pom_dependencies(pom_path, True, config, Arguments(), ns_mappings, PomIndex()))
+    assert len(records) == 1
+    assert mock_requests.call_args[1]['stream'] is True
+
+    mock_response.status_code = 404
+    with pytest.raises(FileNotFoundError):
+        list(stream_pom_dependencies(pom_path, True, config, Arguments(), ns_mappings, PomIndex()))
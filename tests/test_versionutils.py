@@ -0,0 +1,50 @@
+#!/usr/bin/python3
+"""Tests for package version comparison functions"""
+
+import os
+import sys
+
+os.chdir(os.path.dirname(__file__))
+sys.path.append('../src')
+
+# noinspection PyUnresolvedReferences
+from maven_check_versions.versionutils import (  # noqa: E402
+    ComparableVersion, parse_version, sort_versions, major_minor
+)
+
+
+def test_parse_version():
+    versions = [
+        '1-alpha2snapshot', '1-alpha2', '1-alpha-123', '1-beta-2', '1-beta123', '1-m2', '1-m11',
+        '1-rc', '1-cr2', '1-rc123', '1-SNAPSHOT', '1', '1-sp', '1-sp2', '1-sp123', '1-abc', '1-def',
+        '1-pom-1', '1-1-snapshot', '1-1', '1-2', '1-123'
+    ]
+    parsed = [parse_version(v) for v in versions]
+    assert all(a < b for a, b in zip(parsed, parsed[1:]))
+
+    versions = [
+        '2.0', '2-1', '2.0.a', '2.0.0.a', '2.0.2', '2.0.123', '2.1.0', '2.1-a', '2.1b', '2.1-c', '2.1-1',
+        '2.1.0.1', '2.2', '2.123', '11.a2', '11.a11', '11.b2', '11.b11', '11.m2', '11.m11', '11', '11.a',
+        '11b', '11c', '11m'
+    ]
+    parsed = [parse_version(v) for v in versions]
+    assert all(a < b for a, b in zip(parsed, parsed[1:]))
+
+    assert parse_version('1') == parse_version('1.0.0') == parse_version('1-ga') == parse_version('1.0-final')
+    assert parse_version('1-cr1') == parse_version('1-rc1')
+    assert hash(parse_version('1.0')) == hash(parse_version('1'))
+    assert parse_version('1.0') is parse_version('1.0')
+    assert isinstance(parse_version('1.0'), ComparableVersion)
+
+
+def test_sort_versions():
+    versions = ['1.9', '2.0-RC1', '1.10', '2.0', '2.0-M1', '1.9.1']
+    assert sort_versions(versions) == ['2.0', '2.0-RC1', '2.0-M1', '1.10', '1.9.1', '1.9']
+    assert sort_versions(versions, reverse=False) == ['1.9', '1.9.1', '1.10', '2.0-M1', '2.0-RC1', '2.0']
+
+
+def test_major_minor():
+    assert major_minor('3.2.1') == (3, 2)
+    assert major_minor('3-SNAPSHOT') == (3, 0)
+    assert major_minor('abc') == (0, 0)
+    assert major_minor(None) == (0, 0)
@@ -0,0 +1,212 @@
+#!/usr/bin/python3
+"""Tests for package work queue functions"""
+
+import os
+import sys
+import time
+
+import pytest
+# noinspection PyUnresolvedReferences
+from pytest_mock import mocker
+
+os.chdir(os.path.dirname(__file__))
+sys.path.append('../src')
+
+# noinspection PyUnresolvedReferences
+from maven_check_versions.workqueue import (  # noqa: E402
+    process_queue, collect_coordinates, push_coordinates, claim_coordinate,
+    ack_coordinate, requeue_expired, run_coordinator, run_worker, split_coordinate
+)
+import maven_check_versions.workqueue as _workqueue  # noqa: E402
+from maven_check_versions.config import Config, Arguments  # noqa: E402
+
+
+class FakeRedis:
+    """In-process stand-in for the subset of Redis used by the work queue"""
+
+    def __init__(self, *args, **kwargs):
+        self.lists, self.hashes, self.sets = {}, {}, {}
+
+    def close(self):
+        pass
+
+    def sadd(self, key, value):
+        values = self.sets.setdefault(key, set())
+        added = value not in values
+        values.add(value)
+        return int(added)
+
+    def srem(self, key, value):
+        self.sets.get(key, set()).discard(value)
+
+    def rpush(self, key, value):
+        self.lists.setdefault(key, []).append(value)
+
+    def lmove(self, source, destination, src, dest):
+        if items := self.lists.get(source):
+            value = items.pop(0)
+            self.lists.setdefault(destination, []).append(value)
+            return value
+        return None
+
+    def lrem(self, key, count, value):
+        if value in (items := self.lists.get(key, [])):
+            items.remove(value)
+            return 1
+        return 0
+
+    def llen(self, key):
+        return len(self.lists.get(key, []))
+
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = str(value)
+
+    def eval(self, script, numkeys, *args):
+        keys, argv = args[:numkeys], args[numkeys:]
+        if script == _workqueue._PUSH_SCRIPT:
+            pushed = [value for value in argv if self.sadd(keys[1], value)]
+            self.lists.setdefault(keys[0], []).extend(pushed)
+            return len(pushed)
+        if script == _workqueue._CLAIM_SCRIPT:
+            if (value := self.lmove(keys[0], keys[1], 'LEFT', 'RIGHT')) is not None:
+                self.hset(keys[2], value, argv[0])
+            return value
+        if script == _workqueue._ACK_SCRIPT:
+            self.lrem(keys[0], 1, argv[0])
+            self.hdel(keys[1], argv[0])
+            self.srem(keys[2], argv[0])
+            return None
+        assert script == _workqueue._REQUEUE_SCRIPT
+        requeued = []
+        for value in list(self.lists.get(keys[1], [])):
+            if (deadline := self.hget(keys[2], value)) is None:
+                self.hset(keys[2], value, argv[1])
+            elif float(deadline) < argv[0] and self.lrem(keys[1], 1, value):
+                self.hdel(keys[2], value)
+                self.rpush(keys[0], value)
+                requeued.append(value)
+        return requeued
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def hdel(self, key, field):
+        self.hashes.get(key, {}).pop(field, None)
+
+
+def test_push_coordinates():
+    inst = FakeRedis()
+    assert push_coordinates(inst, 'queue', ['g:a:1', 'g:a:1', 'g:b:1']) == 2
+    assert push_coordinates(inst, 'queue', ['g:a:1']) == 0
+    assert inst.lists['queue'] == ['g:a:1', 'g:b:1']
+    assert push_coordinates(inst, 'queue', []) == 0
+
+
+def test_claim_and_ack_coordinate():
+    inst = FakeRedis()
+    push_coordinates(inst, 'queue', ['g:a:1'])
+    assert claim_coordinate(inst, 'queue', 10) == 'g:a:1'
+    assert inst.lists['queue:processing'] == ['g:a:1']
+    assert float(inst.hget('queue:claims', 'g:a:1')) > time.time()
+    assert claim_coordinate(inst, 'queue', 10) is None
+
+    ack_coordinate(inst, 'queue', 'g:a:1')
+    assert inst.llen('queue:processing') == 0
+    assert inst.hget('queue:claims', 'g:a:1') is None
+    assert push_coordinates(inst, 'queue', ['g:a:1']) == 1
+
+
+def test_split_coordinate():
+    assert split_coordinate('g:a:1:jdk8') == ('g', 'a', '1:jdk8')
+    assert split_coordinate('g:a') == ('g', 'a', None)
+
+
+# noinspection PyShadowingNames
+def test_requeue_expired(mocker):
+    inst = FakeRedis()
+    push_coordinates(inst, 'queue', ['g:a:1', 'g:b:1'])
+    claim_coordinate(inst, 'queue', -1)
+    inst.lmove('queue', 'queue:processing', 'LEFT', 'RIGHT')
+    assert requeue_expired(inst, 'queue', 10) == 1
+    assert inst.lists['queue'] == ['g:a:1']
+    assert inst.hget('queue:claims', 'g:b:1') is not None
+    assert requeue_expired(inst, 'queue', 10) == 0
+
+    inst = mocker.Mock()
+    inst.eval.return_value = ['g:a:1']
+    assert requeue_expired(inst, 'queue', 10) == 1
+    assert inst.mock_calls == [mocker.call.eval(
+        _workqueue._REQUEUE_SCRIPT, 3, 'queue', 'queue:processing', 'queue:claims', mocker.ANY, mocker.ANY)]
+
+
+# noinspection PyShadowingNames
+def test_collect_coordinates(mocker):
+    xml = """<?xml version="1.0" encoding="UTF-8"?>
+    <project xmlns="http://maven.apache.org/POM/4.0.0">
+        <dependencies>
+            <dependency>
+                <groupId>group</groupId>
+                <artifactId>artifact</artifactId>
+                <version>1.0</version>
+            </dependency>
+            <dependency>
+                <groupId>group</groupId>
+                <artifactId>skipped</artifactId>
+            </dependency>
+        </dependencies>
+        <modules>
+            <module>module</module>
+        </modules>
+    </project>
+    """
+    mocker.patch('os.path.exists', return_value=True)
+    mocker.patch('os.path.isfile', return_value=True)
+    mocker.patch('builtins.open', mocker.mock_open(read_data=xml))
+    assert collect_coordinates(Config(), Arguments(), 'pom.xml', True) == ['group:artifact:1.0']
+    assert collect_coordinates(Config(), Arguments({'empty_version': True}), 'pom.xml', True) == [
+        'group:artifact:1.0', 'group:skipped']
+
+    args = Arguments({'process_modules': True})
+    mocker.patch('maven_check_versions.workqueue.collect_coordinates', return_value=['group:module:1.0'])
+    assert collect_coordinates(Config(), args, 'pom.xml', True) == ['group:artifact:1.0', 'group:module:1.0']
+
+
+# noinspection PyShadowingNames
+def test_run_coordinator_and_worker(mocker):
+    inst = FakeRedis()
+    mocker.patch('redis.Redis', return_value=inst)
+    mocker.patch('maven_check_versions.cache.load_cache', return_value={
+        'group:cached': (time.time(), '1.0', 'key', None, ['1.0'])
+    })
+    mocker.patch(
+        'maven_check_versions.workqueue.collect_coordinates',
+        return_value=['group:artifact:1.0', 'group:cached:1.0', 'group:missing:1.0'])
+    run_coordinator(Config(), Arguments({'pom_file': 'pom.xml'}))
+    assert inst.lists['maven_check_versions_queue'] == ['group:artifact:1.0', 'group:missing:1.0']
+
+    def _process_repositories(artifact, cache_data, *args):
+        cache_data[f"group:{artifact}"] = (0, '1.0', 'key', None, ['1.0'])
+        return artifact != 'missing'
+
+    mocker.patch('maven_check_versions.process.process_repositories', side_effect=_process_repositories)
+    mock_save_cache = mocker.patch('maven_check_versions.cache.save_cache')
+    mock_logging = mocker.patch('logging.warning')
+    run_worker(Config({'base': {'cache_backend': 'redis'}}), Arguments())
+    assert mock_save_cache.call_count == 2
+    mock_logging.assert_called_once_with('Not Found: group:missing:1.0')
+    assert inst.llen('maven_check_versions_queue') == 0
+    assert inst.llen('maven_check_versions_queue:processing') == 0
+
+
+# noinspection PyShadowingNames
+def test_process_queue(mocker):
+    mocker.patch('maven_check_versions.config.get_config', return_value=Config())
+    mock_coordinator = mocker.patch('maven_check_versions.workqueue.run_coordinator')
+    mock_worker = mocker.patch('maven_check_versions.workqueue.run_worker')
+    process_queue(Arguments({'queue_mode': 'coordinator'}))
+    mock_coordinator.assert_called_once()
+    process_queue(Arguments({'queue_mode': 'worker'}))
+    mock_worker.assert_called_once()
+
+    with pytest.raises(ValueError):
+        process_queue(Arguments({'queue_mode': 'other'}))
@@ -0,0 +1,108 @@
+#!/usr/bin/python3
+"""Tests for package XML parser functions"""
+
+import io
+import os
+import sys
+
+import pytest
+# noinspection PyUnresolvedReferences
+from pytest_mock import mocker
+
+os.chdir(os.path.dirname(__file__))
+sys.path.append('../src')
+
+# noinspection PyUnresolvedReferences
+import maven_check_versions.xmlutils as _xmlutils  # noqa: E402
+from maven_check_versions.xmlutils import (  # noqa: E402
+    select_parser, get_parser, fromstring, parse, iterparse, find_versions
+)
+
+metadata = """<?xml version="1.0" encoding="UTF-8"?>
+<metadata>
+    <version>0.9</version>
+    <versioning>
+        <versions>
+            <version>1.0</version>
+            <!-- comment -->
+            <version>1.1</version>
+        </versions>
+    </versioning>
+</metadata>
+"""
+
+parsers = ['stdlib'] + (['auto', 'lxml'] if _xmlutils.lxml_etree is not None else [])
+
+
+@pytest.fixture(params=parsers)
+def parser(request):
+    previous = get_parser()
+    yield select_parser(request.param)
+    select_parser(previous)
+
+
+# noinspection PyShadowingNames
+def test_select_parser(mocker):
+    previous = get_parser()
+    try:
+        assert select_parser('stdlib') == 'stdlib'
+        assert get_parser() == 'stdlib'
+
+        mocker.patch.object(_xmlutils, 'lxml_etree', None)
+        mock_logging = mocker.patch('logging.warning')
+        assert select_parser('auto') == 'stdlib'
+        mock_logging.assert_not_called()
+        assert select_parser('lxml') == 'stdlib'
+        mock_logging.assert_called_once_with('lxml is not installed, falling back to xml.etree')
+    finally:
+        mocker.stopall()
+        select_parser(previous)
+
+
+# noinspection PyShadowingNames
+def test_fromstring(parser):
+    assert fromstring(metadata).tag == 'metadata'
+    assert fromstring(metadata.encode()).tag == 'metadata'
+
+
+# noinspection PyShadowingNames
+def test_parse(parser, tmp_path):
+    path = tmp_path / 'maven-metadata.xml'
+    path.write_text(metadata)
+    assert parse(str(path)).getroot().tag == 'metadata'
+
+
+# noinspection PyShadowingNames
+def test_iterparse(parser):
+    events = iterparse(io.BytesIO(metadata.encode()), events=('end',))
+    assert [element.text for _, element in events if element.tag == 'version'] == ['0.9', '1.0', '1.1']
+
+
+# noinspection PyShadowingNames
+def test_find_versions(parser):
+    assert find_versions(metadata) == ['0.9', '1.0', '1.1']
+    assert find_versions('<metadata><version/></metadata>') == []
+
+
+# noinspection PyShadowingNames
+def test_lxml_entities(tmp_path):
+    if _xmlutils.lxml_etree is None:  # pragma: no cover
+        pytest.skip('lxml is not installed')
+    secret = tmp_path / 'secret.txt'
+    secret.write_text('secret')
+    document = (
+        f'<?xml version="1.0"?><!DOCTYPE metadata [<!ENTITY e SYSTEM "{secret.as_uri()}">]>'
+        '<metadata><version>&e;</version></metadata>')
+    path = tmp_path / 'maven-metadata.xml'
+    path.write_text(document)
+    previous = get_parser()
+    try:
+        select_parser('lxml')
+        assert 'secret' not in find_versions(document)
+        assert 'secret' not in find_versions(document.encode())
+        assert parse(str(path)).getroot().findtext('version') != 'secret'
+        assert [e.text for _, e in iterparse(str(path), events=('end',)) if e.tag == 'version'] != ['secret']
+        assert find_versions(
+            '<!DOCTYPE metadata [<!ENTITY i "inner">]><metadata><version>1&i;</version></metadata>') == ['1']
+    finally:
+        select_parser(previous)
@@ -0,0 +1,55 @@
+#!/usr/bin/python3
+"""Compares the XML parser backends on a generated POM and maven-metadata.xml"""
+
+import io
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../src'))
+
+import maven_check_versions.pomutils as _pomutils  # noqa: E402
+import maven_check_versions.xmlutils as _xmlutils  # noqa: E402
+
+ns_mapping = {'xmlns': 'http://maven.apache.org/POM/4.0.0'}  # NOSONAR
+
+
+def make_pom(count: int) -> str:
+    dependencies = ''.join(
+        f"<dependency><groupId>group{i}</groupId><artifactId>artifact{i}</artifactId>"
+        f"<version>1.{i}</version></dependency>" for i in range(count))
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<project xmlns="http://maven.apache.org/POM/4.0.0">'
+        '<groupId>group</groupId><artifactId>artifact</artifactId><version>1.0</version>'
+        f"<dependencies>{dependencies}</dependencies></project>")
+
+
+def make_metadata(count: int) -> str:
+    versions = ''.join(f"<version>{i // 100}.{i % 100}</version>" for i in range(count))
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<metadata><groupId>group</groupId><artifactId>artifact</artifactId>'
+        f"<versioning><versions>{versions}</versions></versioning></metadata>")
+
+
+def main() -> None:
+    pom, metadata = make_pom(2000), make_metadata(3000)
+    cases = {
+        'pom index': lambda: _pomutils.build_pom_index(_xmlutils.fromstring(pom), ns_mapping),
+        'pom stream': lambda: list(_pomutils.iter_pom_dependencies(
+            io.BytesIO(pom.encode()), ns_mapping, _pomutils.PomIndex())),
+        'metadata versions': lambda: _xmlutils.find_versions(metadata),
+    }
+    backends = ['stdlib'] + (['lxml'] if _xmlutils.lxml_etree is not None else [])
+    print(f"{'case':<20}" + ''.join(f"{backend:>12}" for backend in backends))
+    for name, case in cases.items():
+        timings = []
+        for backend in backends:
+            _xmlutils.select_parser(backend)
+            timings.append(min(timeit.repeat(case, number=20, repeat=5)) / 20 * 1000)
+        print(f"{name:<20}" + ''.join(f"{timing:>10.2f}ms" for timing in timings))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+-- Server-side support for the maven_check_versions Tarantool cache backend.
+--
+-- Load this module in the instance file and set up each cache space:
+--
+--   local cache = dofile('maven_check_versions.lua')
+--   cache.setup('cache_maven_check_versions_artifacts', 604800)
+--   cache.setup('cache_maven_check_versions_vulnerabilities', 604800)
+--   box.schema.user.grant('CACHE_USER', 'execute', 'function', 'maven_check_versions_fetch', {if_not_exists = true})
+--   box.schema.user.grant('CACHE_USER', 'execute', 'function', 'maven_check_versions_save', {if_not_exists = true})
+--
+-- The functions run with the privileges of their owner (setuid), so the cache user needs neither
+-- access to the spaces nor 'execute' on universe. Tuples are (key, json, timestamp); with a TTL,
+-- expirationd deletes tuples older than the TTL in the background, whether they are read or not.
+
+local expirationd = require('expirationd')
+local fiber = require('fiber')
+
+local M = {}
+
+-- Returns the (key, json) pairs of the given keys. Read-only, so it also works on replicas;
+-- tuples stored before expire_before are skipped and left to expirationd.
+function maven_check_versions_fetch(space, keys, expire_before)
+    local s = box.space[space]
+    local result = {}
+    for _, key in ipairs(keys) do
+        local t = s:get(key)
+        if t ~= nil and not (expire_before > 0 and t[3] ~= nil and t[3] < expire_before) then
+            result[#result + 1] = {t[1], t[2]}
+        end
+    end
+    return result
+end
+
+-- Replaces the given (key, json, timestamp) tuples and deletes the given keys in one transaction.
+function maven_check_versions_save(space, tuples, deleted)
+    local s = box.space[space]
+    box.begin()
+    for _, t in ipairs(tuples) do s:replace(t) end
+    for _, key in ipairs(deleted) do s:delete(key) end
+    box.commit()
+    return #tuples
+end
+
+-- Creates the space and the functions if needed, and starts the expiration task if ttl is set.
+function M.setup(space, ttl)
+    local s = box.schema.space.create(space, {
+        if_not_exists = true,
+        format = {{'key', 'string'}, {'value', 'string'}, {'timestamp', 'unsigned'}},
+    })
+    s:create_index('primary', {if_not_exists = true, parts = {'key'}})
+    box.schema.func.create('maven_check_versions_fetch', {if_not_exists = true, setuid = true})
+    box.schema.func.create('maven_check_versions_save', {if_not_exists = true, setuid = true})
+
+    if ttl ~= nil and ttl > 0 then
+        expirationd.start('maven_check_versions_' .. space, s.id, function(args, tuple)
+            return tuple[3] ~= nil and tuple[3] < fiber.time() - args.ttl
+        end, {args = {ttl = ttl}, tuples_per_iteration = 1024, full_scan_time = 3600})
+    end
+end
+
+return M